@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Mock GitHub API Server
+
+A local HTTP server that serves the subset of the GitHub REST API used by
+the tools (repos, branches, commits, contents, git trees and blobs) from
+in-memory fixtures, with configurable per-request latency and request accounting.
+POST /graphql answers the batch queries of skills_registry.graphql: it
+reads the aliases and object expressions out of the query rather than
+implementing GraphQL.
+"""
+
+import re
+import sys
+import json
+import base64
+import time
+import hashlib
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from typing import Dict, List, Optional
+
+
+def git_sha(kind: str, payload: bytes) -> str:
+    """Git-style object id"""
+    return hashlib.sha1(f"{kind} {len(payload)}\0".encode() + payload).hexdigest()
+
+
+class MockRepository:
+    """One mock repository: branches mapped to file lists, with git object ids"""
+
+    def __init__(self, name: str, default_branch: str, branches: Dict[str, List[str]]):
+        self.name = name
+        self.default_branch = default_branch
+        self.trees = {}       # tree sha -> list of entries
+        self.blobs = {}       # blob sha -> bytes
+        self.branches = {}    # branch -> (commit sha, root tree sha)
+        self.paths = {}       # (branch, path) -> (type, sha)
+
+        for branch, files in branches.items():
+            root = self._build_tree(branch, "", sorted(files))
+            commit = git_sha("commit", f"tree {root}\nbranch {branch}\n".encode())
+            self.branches[branch] = (commit, root)
+            self.paths[(branch, "")] = ("tree", root)
+
+    def _build_tree(self, branch: str, prefix: str, files: List[str]) -> str:
+        """Create tree objects for `files` (relative to prefix) and return the tree sha"""
+        children = {}
+        for path in files:
+            head, _, rest = path.partition('/')
+            children.setdefault(head, []).append(rest)
+
+        entries = []
+        for name, rests in sorted(children.items()):
+            full_path = f"{prefix}{name}"
+            if rests == [""]:
+                content = f"# {name}\n\nMock content for {full_path}\n".encode()
+                sha = git_sha("blob", content)
+                self.blobs[sha] = content
+                entries.append({"path": name, "mode": "100644", "type": "blob", "sha": sha, "size": len(content)})
+            else:
+                sha = self._build_tree(branch, f"{full_path}/", [r for r in rests if r])
+                entries.append({"path": name, "mode": "040000", "type": "tree", "sha": sha})
+            self.paths[(branch, full_path)] = (entries[-1]['type'], sha)
+
+        tree_sha = git_sha("tree", json.dumps(entries, sort_keys=True).encode())
+        self.trees[tree_sha] = entries
+        return tree_sha
+
+    def resolve(self, ref: Optional[str]) -> Optional[str]:
+        """Resolve a branch name, commit sha or tree sha to a tree sha"""
+        ref = ref or self.default_branch
+        if ref in self.branches:
+            return self.branches[ref][1]
+        for commit, root in self.branches.values():
+            if ref == commit:
+                return root
+        return ref if ref in self.trees else None
+
+    def walk(self, tree_sha: str, prefix: str = "") -> List[dict]:
+        """Recursive tree listing (git trees API with recursive=1)"""
+        listing = []
+        for entry in self.trees[tree_sha]:
+            item = dict(entry, path=f"{prefix}{entry['path']}")
+            listing.append(item)
+            if entry['type'] == 'tree':
+                listing.extend(self.walk(entry['sha'], f"{item['path']}/"))
+        return listing
+
+    def skill_dirs(self, expression: str) -> Optional[dict]:
+        """
+        GraphQL object for an expression: the commit for "ref", the
+        SkillDirs fragment for "ref:path" (None if absent)
+        """
+        ref, colon, path = expression.partition(':')
+        branch = self.default_branch if ref == 'HEAD' else ref
+        if not colon:
+            return {"oid": self.branches[branch][0]} if branch in self.branches else None
+        found = self.paths.get((branch, path.strip('/')))
+        if found is None or found[0] != 'tree':
+            return None
+
+        def entries(sha):
+            return [{"name": e['path'], "type": e['type'], "oid": e['sha']} for e in self.trees[sha]]
+
+        return {
+            "oid": found[1],
+            "entries": [
+                dict(entry, object={"entries": entries(entry['oid'])} if entry['type'] == 'tree' else {})
+                for entry in entries(found[1])
+            ],
+        }
+
+
+_GRAPHQL_REPOSITORY = re.compile(r'(\w+): repository\(owner: ("(?:[^"\\]|\\.)*"), name: ("(?:[^"\\]|\\.)*")\)')
+_GRAPHQL_OBJECT = re.compile(r'(\w+): object\(expression: ("(?:[^"\\]|\\.)*")\)')
+
+
+class MockGitHubServer:
+    """
+    Threaded mock of the GitHub REST API
+
+    Usage:
+        with MockGitHubServer(repos, latency=0.05) as server:
+            repo_manager.GITHUB_API_URL = server.url
+            ...
+            print(server.request_count)
+    """
+
+    def __init__(self, repos: Dict[str, Dict], latency: float = 0.0, host: str = "127.0.0.1", port: int = 0,
+                 graphql: bool = True):
+        self.repos = {
+            name: MockRepository(name, spec.get('default_branch', 'main'), spec['branches'])
+            for name, spec in repos.items()
+        }
+        self.latency = latency
+        self.graphql_enabled = graphql
+        self.requests = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        with self._lock:
+            return len(self.requests)
+
+    def reset(self):
+        """Forget recorded requests"""
+        with self._lock:
+            self.requests.clear()
+
+    def start(self) -> "MockGitHubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def record(self, path: str, status: int, size: int):
+        with self._lock:
+            self.requests.append({'path': path, 'status': status, 'bytes': size})
+
+    def graphql(self, body: bytes) -> tuple:
+        """Answer a batch scan query (aliased repository/object fields only)"""
+        try:
+            query = json.loads(body)['query']
+        except (ValueError, KeyError, TypeError):
+            return 400, {"message": "Problems parsing JSON"}
+
+        data, errors = {}, []
+        matches = list(_GRAPHQL_REPOSITORY.finditer(query))
+        for i, match in enumerate(matches):
+            alias = match.group(1)
+            name = f"{json.loads(match.group(2))}/{json.loads(match.group(3))}"
+            repo = self.repos.get(name)
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias],
+                               "message": f"Could not resolve to a Repository with the name '{name}'."})
+                continue
+
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(query)
+            commit = repo.branches[repo.default_branch][0]
+            result = {"defaultBranchRef": {"name": repo.default_branch, "target": {"oid": commit}}}
+            for obj in _GRAPHQL_OBJECT.finditer(query, match.end(), end):
+                result[obj.group(1)] = repo.skill_dirs(json.loads(obj.group(2)))
+            data[alias] = result
+
+        payload = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return 200, payload
+
+    def route(self, method: str, raw_path: str, body: bytes = b"") -> tuple:
+        """Return (status, payload) for a request"""
+        parts = urlsplit(raw_path)
+        if method == 'POST' and parts.path == '/graphql' and self.graphql_enabled:
+            return self.graphql(body)
+
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        segments = [unquote(s) for s in parts.path.strip('/').split('/')]
+
+        if len(segments) < 3 or segments[0] != 'repos':
+            return 404, {"message": "Not Found"}
+
+        repo = self.repos.get(f"{segments[1]}/{segments[2]}")
+        if repo is None:
+            return 404, {"message": "Not Found"}
+
+        rest = segments[3:]
+
+        if not rest:
+            return 200, {"full_name": repo.name, "default_branch": repo.default_branch}
+
+        if rest[0] == 'branches' and len(rest) == 2:
+            if rest[1] not in repo.branches:
+                return 404, {"message": "Branch not found"}
+            commit, root = repo.branches[rest[1]]
+            return 200, {
+                "name": rest[1],
+                "commit": {"sha": commit, "commit": {"tree": {"sha": root}}}
+            }
+
+        if rest[0] == 'commits' and len(rest) == 2:
+            commits = dict(repo.branches.values())
+            commit = repo.branches[rest[1]][0] if rest[1] in repo.branches else rest[1]
+            if commit not in commits:
+                return 422, {"message": f"No commit found for SHA: {rest[1]}"}
+            return 200, {"sha": commit, "commit": {"tree": {"sha": commits[commit]}}}
+
+        if rest[:2] == ['git', 'blobs'] and len(rest) == 3:
+            content = repo.blobs.get(rest[2])
+            if content is None:
+                return 404, {"message": "Not Found"}
+            return 200, {"sha": rest[2], "size": len(content), "encoding": "base64",
+                         "content": base64.b64encode(content).decode('ascii')}
+
+        if rest[0] == 'contents':
+            branch = query.get('ref') or repo.default_branch
+            path = '/'.join(s for s in rest[1:] if s)
+            found = repo.paths.get((branch, path))
+            if found is None:
+                return 404, {"message": "Not Found"}
+            kind, sha = found
+            if kind == 'blob':
+                return 200, {"type": "file", "name": path.rsplit('/', 1)[-1], "path": path, "sha": sha}
+            prefix = f"{path}/" if path else ""
+            return 200, [
+                {
+                    "type": "dir" if e['type'] == 'tree' else "file",
+                    "name": e['path'],
+                    "path": f"{prefix}{e['path']}",
+                    "sha": e['sha'],
+                }
+                for e in repo.trees[sha]
+            ]
+
+        if rest[:2] == ['git', 'trees'] and len(rest) == 3:
+            tree_sha = repo.resolve(rest[2])
+            if tree_sha is None:
+                return 404, {"message": "Not Found"}
+            tree = repo.walk(tree_sha) if query.get('recursive') else repo.trees[tree_sha]
+            return 200, {"sha": tree_sha, "tree": tree, "truncated": False}
+
+        return 404, {"message": "Not Found"}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, method: str):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b""
+                if server.latency:
+                    time.sleep(server.latency)
+                status, payload = server.route(method, self.path, body)
+                data = json.dumps(payload).encode('utf-8')
+                # Recorded before the client can see the response, so counts
+                # read right after a scan include its last request
+                server.record(self.path, status, len(data))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._respond('GET')
+
+            def do_POST(self):
+                self._respond('POST')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    """Serve synthetic repositories until interrupted"""
+    from synthetic import synthetic_repos
+
+    n_repos = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    port = int(sys.argv[3]) if len(sys.argv) > 3 else 8765
+
+    server = MockGitHubServer(synthetic_repos(n_repos, 20), latency=latency, port=port)
+    print(f"Mock GitHub API on {server.url} ({n_repos} repos, {latency * 1000:.0f}ms latency)")
+    print(f"Use: GITHUB_API_URL={server.url} python tools/repo_manager.py scan")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(f"\nServed {server.request_count} requests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Skills Registry Benchmarks
+
+Time the registry tools against synthetic registries (1k/10k/100k skills by
+default) and the scan paths against a mock GitHub API, and emit the results
+as JSON for regression tracking.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1000,10000 --latency 0.02 --output bench.json
+"""
+
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import contextlib
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Callable, List, Dict
+
+BENCH_DIR = Path(__file__).resolve().parent
+TOOLS_DIR = BENCH_DIR.parent / "tools"
+sys.path.insert(0, str(TOOLS_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from skills_registry import github, graphql, registry, validate, readme, config, classifier  # noqa: E402
+from skills_registry.repo_cache import RepoCache  # noqa: E402
+from synthetic import write_registry, synthetic_repos  # noqa: E402
+from mock_github import MockGitHubServer  # noqa: E402
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def log(text: str):
+    """Progress output goes to stderr so stdout can carry the JSON report"""
+    print(text, file=sys.stderr, flush=True)
+
+
+def timed(fn: Callable, repeat: int) -> Dict:
+    """Run fn `repeat` times and summarize wall times"""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return {
+        'min_s': round(min(runs), 6),
+        'median_s': round(statistics.median(runs), 6),
+        'runs': len(runs),
+    }
+
+
+def bench_registry(size: int, repeat: int, workdir: Path, categories: dict) -> List[Dict]:
+    """Benchmark load/save, validation, README generation and categorization"""
+    path = write_registry(workdir / f"registry-{size}.json", size)
+    file_bytes = path.stat().st_size
+    data = registry.load_registry(path)
+    out_path = workdir / f"registry-{size}-out.json"
+
+    cases = {
+        'load_registry': lambda: registry.load_registry(path),
+        'save_registry': lambda: registry.save_registry(out_path, data),
+        'validate_registry': lambda: validate.validate_registry(str(path)),
+        'generate_readme': lambda: readme.generate_readme(data),
+        'generate_readme_par': lambda: readme.generate_readme(data, workers=0),
+        'categorize_skill': lambda: [
+            config.categorize_skill(name, skill['description'], categories)
+            for name, skill in data['skills'].items()
+        ],
+    }
+    if classifier.np is not None:
+        examples = classifier.labeled_skills(data)
+        model = classifier.train(examples)
+        texts = [text for text, _ in examples]
+        cases['train_classifier'] = lambda: classifier.train(examples)
+        cases['categorize_bayes'] = lambda: classifier.predict(texts, model)
+
+    results = []
+    for name, fn in cases.items():
+        result = {'benchmark': name, 'size': size, 'file_bytes': file_bytes, **timed(fn, repeat)}
+        results.append(result)
+        log(f"  {name:<20} {size:>7} skills  {result['median_s'] * 1000:10.1f} ms")
+
+    return results
+
+
+def bench_scan(n_repos: int, skills_per_repo: int, latency: float) -> List[Dict]:
+    """Benchmark the shared scan path (repo_manager.py scan, batch_add.py) against the mock API"""
+    repos = synthetic_repos(n_repos, skills_per_repo)
+
+    results = []
+    with MockGitHubServer(repos, latency=latency) as server:
+        github.GITHUB_API_URL = server.url
+        github.set_cache(RepoCache(None))
+
+        def rest():
+            return sum(len(github.find_skills_in_repo(repo)) for repo in repos)
+
+        def batched():
+            github.set_cache(RepoCache(None))
+            return sum(len(skills) for skills in graphql.find_skills_batch([(repo, [None]) for repo in repos]).values())
+
+        # Cold: empty cache; warm: default branches and trees already cached
+        for name, scan in (('find_skills_in_repo', rest), ('find_skills_in_repo (cached)', rest),
+                           ('find_skills_batch (graphql)', batched)):
+            server.reset()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                found = scan()
+            elapsed = time.perf_counter() - start
+
+            result = {
+                'benchmark': name,
+                'repos': n_repos,
+                'skills_per_repo': skills_per_repo,
+                'latency_s': latency,
+                'wall_s': round(elapsed, 6),
+                'requests': server.request_count,
+                'skills_found': found,
+            }
+            log(f"  {result['benchmark']:<36} {result['requests']:>6} requests  {elapsed:8.2f} s  ({found} skills)")
+            results.append(result)
+
+    return results
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the skills registry tools")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated synthetic registry sizes (default: 1000,10000,100000)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per registry benchmark (default: 3)")
+    parser.add_argument('--repos', type=int, default=10, help="Mock repositories to scan (default: 10)")
+    parser.add_argument('--skills-per-repo', type=int, default=20, help="Skills per mock repository (default: 20)")
+    parser.add_argument('--latency', type=float, default=0.02, help="Mock API latency in seconds (default: 0.02)")
+    parser.add_argument('--skip-registry', action='store_true', help="Skip the registry benchmarks")
+    parser.add_argument('--skip-scan', action='store_true', help="Skip the scan benchmarks")
+    parser.add_argument('--output', help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    categories = config.load_config().get('categories', {})
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'registry': [],
+        'scan': [],
+    }
+
+    if not args.skip_registry:
+        log("📊 Registry benchmarks")
+        with tempfile.TemporaryDirectory() as tmp:
+            for size in [int(s) for s in args.sizes.split(',') if s.strip()]:
+                report['registry'].extend(bench_registry(size, args.repeat, Path(tmp), categories))
+
+    if not args.skip_scan:
+        log("🔍 Scan benchmarks")
+        report['scan'] = bench_scan(args.repos, args.skills_per_repo, args.latency)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding='utf-8')
+        log(f"✅ Results written to {args.output}")
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
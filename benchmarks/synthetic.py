@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Synthetic Registry Generator
+
+Generate large, deterministic skills-registry.json files and mock GitHub
+repository fixtures for benchmarking.
+"""
+
+import sys
+import json
+import random
+from pathlib import Path
+from datetime import datetime
+from typing import List, Dict
+
+CATEGORIES = {
+    "document": "Document Processing",
+    "development": "Development Tools",
+    "science": "Scientific Computing & ML",
+    "productivity": "Productivity & Workflow",
+    "creative": "Creative & Design",
+    "operations": "Operations & DevOps",
+    "tools": "Tools & Utilities",
+}
+
+LICENSES = ["MIT", "Apache-2.0", "Proprietary", "BSD-3-Clause", "Unknown"]
+
+WORDS = [
+    "pdf", "docx", "spreadsheet", "api", "frontend", "backend", "testing",
+    "workflow", "automation", "bioinformatics", "chemistry", "dataset",
+    "training", "design", "generative", "art", "deployment", "kubernetes",
+    "analysis", "extraction", "editing", "review", "debugging", "planning",
+    "documentation", "pipeline", "visualization", "research", "converter",
+    "integration", "monitoring", "security", "refactoring", "reasoning",
+]
+
+
+def synthetic_skill(i: int, rng: random.Random, n_repos: int) -> Dict:
+    """Create one synthetic skill entry following the registry schema"""
+    name = f"skill-{i:06d}"
+    owner = f"owner{rng.randrange(n_repos // 2 + 1):04d}"
+    repo = f"{owner}/skills-{rng.randrange(n_repos):04d}"
+    words = rng.sample(WORDS, 8)
+
+    return {
+        "name": name,
+        "description": f"{words[0].title()} {' '.join(words[1:6])} for {words[6]} and {words[7]}",
+        "source": {
+            "type": "github",
+            "repo": repo,
+            "url": f"https://github.com/{repo}",
+            "branch": "main",
+            "path": f"skills/{name}"
+        },
+        "metadata": {
+            "author": owner,
+            "license": rng.choice(LICENSES),
+            "tags": words[:rng.randrange(1, 5)],
+            "category": rng.choice(list(CATEGORIES))
+        }
+    }
+
+
+def generate_registry(size: int, seed: int = 0) -> Dict:
+    """Generate a registry with `size` skills"""
+    rng = random.Random(seed)
+    n_repos = max(1, size // 50)
+    timestamp = datetime(2026, 1, 1).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    skills = {}
+    for i in range(size):
+        skill = synthetic_skill(i, rng, n_repos)
+        skills[skill['name']] = skill
+
+    category_counts = {cat: 0 for cat in CATEGORIES}
+    source_counts = {}
+    for skill in skills.values():
+        category_counts[skill['metadata']['category']] += 1
+        repo = skill['source']['repo']
+        source_counts[repo] = source_counts.get(repo, 0) + 1
+
+    return {
+        "version": "1.0.0",
+        "last_updated": timestamp,
+        "skills": skills,
+        "categories": {
+            cat: {"name": label, "description": f"Synthetic {label} skills", "count": category_counts[cat]}
+            for cat, label in CATEGORIES.items()
+        },
+        "sources": [
+            {
+                "name": repo,
+                "type": "github",
+                "url": f"https://github.com/{repo}",
+                "description": "Synthetic source",
+                "skills_count": count
+            }
+            for repo, count in sorted(source_counts.items())
+        ],
+        "stats": {
+            "total_skills": len(skills),
+            "total_sources": len(source_counts),
+            "total_categories": len(CATEGORIES),
+            "last_sync": timestamp
+        }
+    }
+
+
+def write_registry(path: Path, size: int, seed: int = 0) -> Path:
+    """Generate a registry and write it to `path`"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(generate_registry(size, seed), f, indent=2, ensure_ascii=False)
+    return path
+
+
+def synthetic_repos(n_repos: int, skills_per_repo: int, seed: int = 0) -> Dict[str, Dict]:
+    """
+    Generate mock GitHub repositories for the scan benchmarks
+
+    Most repositories keep skills under skills/, some at the root, and every
+    repository has a few non-skill directories the scanner has to rule out.
+
+    Returns:
+        Mapping of "owner/repo" to {"default_branch": ..., "branches": {name: [file paths]}}
+    """
+    rng = random.Random(seed)
+    repos = {}
+
+    for r in range(n_repos):
+        repo = f"bench-owner{r:03d}/skills-{r:03d}"
+        prefix = "" if r % 4 == 3 else "skills/"
+        files = ["README.md", "LICENSE", "docs/index.md", ".github/workflows/ci.yml"]
+
+        for s in range(skills_per_repo):
+            skill_dir = f"{prefix}{rng.choice(WORDS)}-{r:03d}-{s:03d}"
+            files.append(f"{skill_dir}/SKILL.md")
+            files.append(f"{skill_dir}/reference.md")
+
+        repos[repo] = {
+            "default_branch": "main" if r % 5 else "master",
+            "branches": {"main" if r % 5 else "master": sorted(files)},
+        }
+
+    return repos
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 3:
+        print("Usage: python synthetic.py <output.json> <size> [seed]")
+        return 1
+
+    size = int(sys.argv[2])
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    path = write_registry(Path(sys.argv[1]), size, seed)
+    print(f"✅ Wrote {size} synthetic skills to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
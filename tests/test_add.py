@@ -0,0 +1,60 @@
+"""Tests for bulk adding skills from exported registry entries"""
+
+import sys
+import copy
+import json
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry.add import add_skills, record_to_entry  # noqa: E402
+
+
+def shipped_registry() -> dict:
+    with open(ROOT / "skills" / "skills-registry.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def empty_registry(registry: dict) -> dict:
+    return {'skills': {}, 'sources': [], 'categories': copy.deepcopy(registry.get('categories', {})),
+            'stats': {}}
+
+
+class RoundTripTest(unittest.TestCase):
+
+    def test_exported_entries_add_back_unchanged(self):
+        registry = shipped_registry()
+        target = empty_registry(registry)
+
+        result = add_skills(target, copy.deepcopy(list(registry['skills'].values())))
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(sorted(result['added']), sorted(registry['skills']))
+        for name, entry in registry['skills'].items():
+            self.assertEqual(target['skills'][name], entry)
+
+    def test_update_with_exported_entry_is_unchanged(self):
+        registry = shipped_registry()
+        records = {'skills': copy.deepcopy(registry['skills'])}
+
+        result = add_skills(registry, [dict(r, name=n) for n, r in records['skills'].items()], update=True)
+
+        self.assertEqual(result['errors'], [])
+        self.assertEqual(result['added'] + result['updated'], [])
+
+    def test_github_url_follows_the_repo(self):
+        entry = shipped_registry()['skills']['pdf']
+        record = copy.deepcopy(entry)
+        record['source']['repo'] = 'acme/skills'
+        record['source']['url'] = 'https://example.com/elsewhere'
+
+        for existing in (None, entry):
+            with self.subTest(existing=existing is not None):
+                updated = record_to_entry(record, existing)
+                self.assertEqual(updated['source']['url'], 'https://github.com/acme/skills')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for the learned categorizer"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import classifier  # noqa: E402
+
+
+def skill(name: str, category: str) -> dict:
+    return {'description': f"Skill from acme/{name}", 'metadata': {'category': category, 'tags': []}}
+
+
+class EmptyTrainingSetTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.registry_path = Path(tmp.name) / "skills-registry.json"
+
+    def test_train_without_examples(self):
+        model = classifier.train([])
+        self.assertEqual(model['labels'], [])
+        self.assertEqual(classifier.predict(["pdf forms"], model), [(classifier.DEFAULT_CATEGORY, 0.0)])
+
+    def test_train_without_terms(self):
+        model = classifier.train([("", "documents"), ("--", "development")])
+        self.assertEqual(model['labels'], [])
+
+    def test_only_general_skills_keep_keyword_categories(self):
+        registry = {'skills': {'pdf': skill('pdf', 'general'), 'docx': skill('docx', 'general')}}
+        scanned = [{'name': 'pdf-forms', 'repo': 'acme/skills', 'category': 'documents'}]
+
+        changed = classifier.categorize_skills(scanned, registry, self.registry_path)
+
+        self.assertEqual(changed, 0)
+        self.assertEqual(scanned[0]['category'], 'documents')
+        # The empty model is cached like any other
+        self.assertEqual(classifier.load_model(classifier.model_path(self.registry_path))['labels'], [])
+
+    def test_labeled_skills_are_learned(self):
+        registry = {'skills': {'pdf': skill('pdf', 'documents'), 'git': skill('git', 'development')}}
+        model = classifier.train(classifier.labeled_skills(registry))
+        self.assertEqual(model['labels'], ['development', 'documents'])
+        self.assertEqual(classifier.predict(["pdf"], model)[0][0], 'documents')
+
+
+if __name__ == '__main__':
+    unittest.main()
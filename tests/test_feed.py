@@ -0,0 +1,83 @@
+"""Tests for the registry delta feed"""
+
+import sys
+import copy
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import cli, feed, registry as storage  # noqa: E402
+from skills_registry.stats import put_skill, remove_skill  # noqa: E402
+
+
+class FeedTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "skills-registry.json"
+        shutil.copy(ROOT / "skills" / "skills-registry.json", self.path)
+        feed.init_feed(self.path, storage.load_registry(self.path))
+
+    def pull(self) -> dict:
+        consumer, _, _ = feed.pull(str(feed.feed_dir(self.path)), None, None)
+        return consumer
+
+    def test_edits_are_published_per_key(self):
+        registry = storage.load_registry(self.path)
+        entry = copy.deepcopy(registry['skills']['pdf'])
+        entry['source']['repo'] = 'acme/new-skills'
+        entry['metadata']['category'] = 'brand-new'
+        put_skill(registry, 'pdf', entry)
+        remove_skill(registry, 'docx')
+
+        with mock.patch.object(storage, 'load_registry', side_effect=AssertionError("re-read")):
+            ops = feed.pending_ops(self.path, registry)
+        storage.save_registry(self.path, registry)
+
+        paths = {op['path'] for op in ops}
+        self.assertIn('/skills/pdf', paths)
+        self.assertIn('/skills/docx', paths)
+        self.assertIn('/categories/brand-new', paths)
+        self.assertIn('/sources/-', paths)
+        self.assertNotIn('/categories', paths)
+        self.assertNotIn('/sources', paths)
+
+        saved = json.loads(self.path.read_text(encoding='utf-8'))
+        self.assertEqual(self.pull(), saved)
+
+    def test_journal_restarts_after_a_save(self):
+        registry = storage.load_registry(self.path)
+        remove_skill(registry, 'docx')
+        storage.save_registry(self.path, registry)
+        self.assertEqual(feed.pending_ops(self.path, registry), [])
+
+    def test_removed_sources_are_removed_from_the_end(self):
+        old = {'sources': [{'name': 'a'}, {'name': 'b'}, {'name': 'c'}]}
+        new = {'sources': [{'name': 'a'}]}
+        ops = feed.diff_ops(old, {}, new, {})
+
+        self.assertEqual([op['path'] for op in ops], ['/sources/2', '/sources/1'])
+        self.assertEqual(feed.apply_ops(copy.deepcopy(old), ops), new)
+
+    def test_pull_refuses_the_published_registry(self):
+        with mock.patch('builtins.print'):
+            self.assertEqual(cli.main(['feed', 'pull', str(feed.feed_dir(self.path))]), 1)
+            self.assertEqual(cli.main(['--registry', str(self.path), 'feed', 'pull', str(feed.feed_dir(self.path))]), 1)
+
+            consumer = self.dir / "consumer" / "skills-registry.json"
+            consumer.parent.mkdir()
+            self.assertEqual(cli.main(['--registry', str(consumer), 'feed', 'pull', str(feed.feed_dir(self.path))]), 0)
+        self.assertEqual(json.loads(consumer.read_text(encoding='utf-8'))['skills'].keys(),
+                         json.loads(self.path.read_text(encoding='utf-8'))['skills'].keys())
+
+
+if __name__ == '__main__':
+    unittest.main()
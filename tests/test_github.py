@@ -0,0 +1,34 @@
+"""Tests for the concurrent repository scan"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import github  # noqa: E402
+
+
+def fake_iter_skills_in_refs(repo, refs, search_paths=github.DEFAULT_SEARCH_PATHS, strict=False):
+    if repo == 'acme/broken':
+        raise github.GitHubError("rate limit exceeded")
+    yield {'name': f"{repo.split('/')[1]}-skill", 'repo': repo}
+
+
+class StreamSkillsTest(unittest.TestCase):
+
+    def test_failed_repository_is_reported(self):
+        targets = [('acme/broken', [None]), ('acme/ok', [None])]
+        with mock.patch.object(github, 'iter_skills_in_refs', fake_iter_skills_in_refs):
+            results = list(github.stream_skills(targets, workers=2))
+
+        ends = {repo: skill for repo, skill in results if not isinstance(skill, dict)}
+        self.assertIsInstance(ends['acme/broken'], github.GitHubError)
+        self.assertIsNone(ends['acme/ok'])
+        self.assertIn(('acme/ok', {'name': 'ok-skill', 'repo': 'acme/ok'}), results)
+
+
+if __name__ == '__main__':
+    unittest.main()
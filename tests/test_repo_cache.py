@@ -0,0 +1,52 @@
+"""Tests for the scanner's on-disk cache"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import repo_cache  # noqa: E402
+from skills_registry.repo_cache import RepoCache  # noqa: E402
+
+
+class PruneTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / ".github-cache.json"
+
+    def test_stale_trees_and_metadata_are_dropped_on_save(self):
+        cache = RepoCache(self.path)
+        day = repo_cache._today()
+        with mock.patch.object(repo_cache, '_today', return_value=day - repo_cache.TREE_TTL_DAYS):
+            cache.add_tree('old', [{'path': 'README.md', 'type': 'blob', 'sha': 'a'}])
+            cache.add_tree('reused', [{'path': 'SKILL.md', 'type': 'blob', 'sha': 'b'}])
+        cache.add_tree('new', [{'path': 'skills', 'type': 'tree', 'sha': 'c'}])
+        cache.tree('reused')
+        cache.set_metadata('acme/skills', 'main')
+        cache.repos['acme/gone'] = {'default_branch': 'main', 'fetched_at': 0}
+        cache.save()
+
+        data = json.loads(self.path.read_text(encoding='utf-8'))
+        self.assertEqual(sorted(data['trees']), ['new', 'reused'])
+        self.assertEqual(sorted(data['repos']), ['acme/skills'])
+
+    def test_tree_count_is_capped(self):
+        cache = RepoCache(self.path)
+        for i in range(5):
+            with mock.patch.object(repo_cache, '_today', return_value=repo_cache._today() - i):
+                cache.add_tree(f"tree{i}", [])
+        with mock.patch.object(repo_cache, 'MAX_TREES', 2):
+            cache.save()
+
+        self.assertEqual(sorted(RepoCache.load(self.path).trees), ['tree0', 'tree1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Tests for the sharded registry layout"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import shards  # noqa: E402
+
+
+def entry(repo: str, category: str = "development") -> dict:
+    return {'description': f"Skill from {repo}", 'source': {'type': 'github', 'repo': repo, 'path': 'skills/x'},
+            'metadata': {'category': category, 'tags': []}}
+
+
+class ShardsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "shards"
+
+    def split(self, skills: dict, shard_by: str = "source") -> dict:
+        shards.save_sharded(self.path, {'version': '1.0.0', 'skills': skills}, shard_by)
+        return shards.load_sharded(self.path)
+
+    def test_keys_with_the_same_safe_name_get_their_own_files(self):
+        skills = {
+            'one': entry('a/b'),
+            'two': entry('a__b'),
+            'three': entry('Foo/Bar'),
+            'four': entry('foo/bar'),
+        }
+        registry = self.split(skills)
+
+        files = [info['file'].lower() for info in registry['skills'].shards.values()]
+        self.assertEqual(len(files), 4)
+        self.assertEqual(len(set(files)), 4)
+        self.assertEqual(shards.verify_shards(self.path), [])
+        self.assertEqual(shards.merge_shards(self.path)['skills'], skills)
+
+    def test_missing_name_loads_no_shard(self):
+        registry = self.split({'one': entry('a/b'), 'two': entry('c/d')})
+        skills = registry['skills']
+
+        self.assertNotIn('three', skills)
+        self.assertIn('two', skills)
+        self.assertEqual(skills._loaded, {})
+
+        self.assertEqual(skills['two'], entry('c/d'))
+        self.assertEqual(list(skills._loaded), ['c/d'])
+
+    def test_shards_by_metadata_category(self):
+        registry = self.split({'one': entry('a/b', 'documents'), 'two': entry('c/d')}, shard_by='category')
+        self.assertEqual(sorted(registry['skills'].shards), ['development', 'documents'])
+        self.assertEqual(shards.verify_shards(self.path), [])
+
+    def test_moved_and_deleted_skills_update_the_name_index(self):
+        registry = self.split({'one': entry('a/b'), 'two': entry('c/d')})
+        registry['skills']['one'] = entry('e/f')
+        del registry['skills']['two']
+        registry['skills']['three'] = entry('e/f')
+        shards.save_sharded(self.path, registry)
+
+        manifest = shards.read_manifest(self.path)
+        self.assertNotIn('names', manifest)
+        self.assertEqual(list(manifest['shards']), ['e/f'])
+        self.assertEqual(sorted(p.name for p in self.path.iterdir()),
+                         sorted([shards.MANIFEST_NAME, shards.NAMES_DIR, shards.shard_filename('e/f')]))
+
+        index = {}
+        for bucket in (self.path / shards.NAMES_DIR).iterdir():
+            index.update(json.loads(bucket.read_text(encoding='utf-8')))
+        self.assertEqual(index, {'one': 'e/f', 'three': 'e/f'})
+        self.assertEqual(shards.verify_shards(self.path), [])
+
+    def test_manifest_without_name_index(self):
+        self.split({'one': entry('a/b'), 'two': entry('c/d')})
+        manifest_path = self.path / shards.MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        del manifest['name_buckets']
+        manifest['format'] = 1
+        manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+        for bucket in (self.path / shards.NAMES_DIR).iterdir():
+            bucket.unlink()
+
+        registry = shards.load_sharded(self.path)
+        self.assertIn('two', registry['skills'])
+        self.assertNotIn('three', registry['skills'])
+        self.assertEqual(shards.verify_shards(self.path), [])
+
+        # The next save writes the name index
+        registry['skills']['three'] = entry('c/d')
+        shards.save_sharded(self.path, registry)
+        self.assertEqual(shards.read_manifest(self.path)['name_buckets'], shards.NAME_BUCKETS)
+        self.assertEqual(shards.verify_shards(self.path), [])
+        self.assertEqual(shards.load_sharded(self.path)['skills']['one'], entry('a/b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
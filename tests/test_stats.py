@@ -0,0 +1,56 @@
+"""Tests for the incremental registry counters"""
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry.stats import Registry, check, put_skill, remove_skill, update_totals  # noqa: E402
+
+
+def entry(repo: str, category: str = "development") -> dict:
+    return {'description': f"Skill from {repo}", 'source': {'type': 'github', 'repo': repo},
+            'metadata': {'category': category, 'tags': []}}
+
+
+class CountersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = Registry({'skills': {}, 'categories': {}, 'sources': [], 'stats': {}})
+
+    def counts(self) -> dict:
+        return {s['name']: s['skills_count'] for s in self.registry['sources']}
+
+    def test_put_and_remove_move_the_counters(self):
+        put_skill(self.registry, 'one', entry('acme/a'))
+        put_skill(self.registry, 'two', entry('acme/b', 'documents'))
+        put_skill(self.registry, 'one', entry('acme/b'))
+        remove_skill(self.registry, 'two')
+
+        self.assertEqual(self.counts(), {'acme/a': 0, 'acme/b': 1})
+        self.assertEqual(self.registry['categories']['documents']['count'], 0)
+        update_totals(self.registry)
+        self.assertEqual(check(self.registry), [])
+
+    def test_sources_edited_directly_are_found_again(self):
+        for repo in ('acme/a', 'acme/b', 'acme/c'):
+            put_skill(self.registry, repo, entry(repo))
+
+        del self.registry['sources'][0]
+        self.registry['sources'].insert(0, {'name': 'acme/z', 'skills_count': 0})
+        self.registry['sources'].reverse()
+        put_skill(self.registry, 'more-c', entry('acme/c'))
+        put_skill(self.registry, 'more-z', entry('acme/z'))
+
+        self.assertEqual(self.counts(), {'acme/c': 2, 'acme/b': 1, 'acme/z': 1})
+
+    def test_plain_dicts_work_too(self):
+        registry = {'skills': {}, 'categories': {}, 'sources': None}
+        put_skill(registry, 'one', entry('acme/a'))
+        self.assertEqual(registry['sources'][0]['skills_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
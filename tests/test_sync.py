@@ -0,0 +1,82 @@
+"""Tests for the scheduled sync"""
+
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from skills_registry import github, sync  # noqa: E402
+
+
+class FakeGitHub:
+    """find_skills_in_refs and request_count with a fixed request cost per repository"""
+
+    def __init__(self, costs: dict):
+        self.costs = costs
+        self.count = 0
+        self.scanned = []
+
+    def request_count(self) -> int:
+        return self.count
+
+    def find_skills_in_refs(self, repo, refs, strict=False):
+        self.count += self.costs[repo]
+        self.scanned.append(repo)
+        return [{'name': f"{repo.split('/')[1]}-skill", 'repo': repo, 'branch': 'main',
+                 'path': f"skills/{repo.split('/')[1]}"}]
+
+
+class SyncBudgetTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.registry_path = self.dir / "skills-registry.json"
+        self.state_path = self.dir / ".sync-state.json"
+        self.registry_path.write_text(json.dumps({
+            'version': '1.0.0', 'last_updated': '2026-01-01T00:00:00Z',
+            'skills': {}, 'categories': {}, 'sources': [], 'stats': {},
+        }), encoding='utf-8')
+
+    def run_sync(self, costs: dict, state: dict, budget: int) -> FakeGitHub:
+        self.state_path.write_text(json.dumps(state), encoding='utf-8')
+        config = {'repositories': [{'repo': repo, 'priority': i} for i, repo in enumerate(costs)]}
+        fake = FakeGitHub(costs)
+        with mock.patch.object(github, 'find_skills_in_refs', fake.find_skills_in_refs), \
+                mock.patch.object(github, 'request_count', fake.request_count), \
+                mock.patch('builtins.print'):
+            sync.sync(config, self.registry_path, self.state_path, budget=budget)
+        return fake
+
+    def test_repository_over_the_whole_budget_still_runs_first(self):
+        costs = {'acme/huge': 350, 'acme/small': 5}
+        fake = self.run_sync(costs, {'repos': {'acme/huge': {'requests': 350}}}, budget=300)
+
+        self.assertEqual(fake.scanned, ['acme/huge'])
+        state = sync.load_state(self.state_path)
+        self.assertIn('last_run', state['repos']['acme/huge'])
+        self.assertNotIn('last_run', state['repos'].get('acme/small', {}))
+
+        # The next run finds only the small repository due
+        fake = self.run_sync(costs, state, budget=300)
+        self.assertEqual(fake.scanned, ['acme/small'])
+
+    def test_registry_is_saved_once_per_run(self):
+        costs = {f"acme/repo{i}": 1 for i in range(5)}
+        with mock.patch.object(sync, 'save_registry', wraps=sync.save_registry) as save:
+            fake = self.run_sync(costs, {'repos': {}}, budget=300)
+
+        self.assertEqual(len(fake.scanned), 5)
+        self.assertEqual(save.call_count, 1)
+        registry = json.loads(self.registry_path.read_text(encoding='utf-8'))
+        self.assertEqual(len(registry['skills']), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Semantic Skill Index
+
+Offline TF-IDF categorization and similar-skill lookups (requires NumPy).
+Same as: python tools/skills.py semantic <build|categorize|similar|search> [text] [N]
+"""
+
+import sys
+
+from skills_registry.cli import main
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    # Keep the old "similar <skill> N" form working
+    if len(args) == 3 and args[0] in ('similar', 'search') and args[2].isdigit():
+        args = [args[0], args[1], '--top', args[2]]
+    sys.exit(main(['semantic'] + args))
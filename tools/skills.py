@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Skills Registry CLI
+
+One entry point for every registry tool. Run with --help for commands.
+"""
+
+import sys
+
+from skills_registry.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
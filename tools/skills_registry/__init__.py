@@ -0,0 +1,26 @@
+"""
+Skills Registry
+
+Shared library behind the registry tools: registry storage, repository
+configuration, GitHub scanning, validation and README generation.
+
+Only lightweight modules are imported here; the GitHub scanner (and with
+it `requests`) is loaded on first use.
+"""
+
+__version__ = "0.2.0"
+
+from .registry import REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry
+from .config import CONFIG_PATH, load_config, save_config, categorize_skill
+
+__all__ = [
+    "REGISTRY_PATH",
+    "CONFIG_PATH",
+    "load_registry",
+    "save_registry",
+    "touch_registry",
+    "create_skill_entry",
+    "load_config",
+    "save_config",
+    "categorize_skill",
+]
@@ -0,0 +1,378 @@
+"""
+Add Skill
+
+Add skills to the registry: interactively one at a time, or in bulk from
+a CSV, JSONL or YAML file of records (YAML needs the optional PyYAML
+package). Bulk records are validated together and applied in one
+transaction: if any record is invalid nothing is written, otherwise the
+registry is saved once.
+
+A record has the flat fields below; CSV tags are comma-separated, and
+JSONL/YAML records may nest source.* and metadata.* like registry entries
+(so an exported entry can be added back as is; source.url of a GitHub
+skill is re-derived from the repo):
+
+    name,description,repo,branch,path,author,license,category,tags
+    pdf,Read and write PDFs,acme/skills,main,skills/pdf,acme,MIT,documents,"pdf,docs"
+"""
+
+import csv
+import copy
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info, print_next_steps
+from .registry import REGISTRY_PATH, build_entry, load_registry, save_registry, touch_registry
+from .stats import GITHUB_URL, put_skill
+from .validate import validate_skill
+
+try:
+    import yaml
+except ImportError:  # optional dependency
+    yaml = None
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'json', '.yaml': 'yaml', '.yml': 'yaml'}
+SOURCE_FIELDS = ('type', 'repo', 'url', 'branch', 'path', 'commit', 'tree')
+METADATA_FIELDS = ('author', 'license', 'category', 'tags')
+RECORD_FIELDS = ('name', 'description') + SOURCE_FIELDS + METADATA_FIELDS
+
+
+class RecordError(ValueError):
+    """A skill definitions file or one of its records cannot be read"""
+
+
+class InputAborted(Exception):
+    """A required prompt was left empty"""
+
+
+def get_input(prompt, default=None, required=True):
+    """Get user input with optional default"""
+    if default:
+        full_prompt = f"{prompt} [{default}]: "
+    else:
+        full_prompt = f"{prompt}: "
+
+    value = input(full_prompt).strip()
+
+    if not value and default:
+        return default
+    if not value and required:
+        raise InputAborted(prompt)
+
+    return value
+
+
+def add_skill(registry_path: Path = REGISTRY_PATH) -> int:
+    """Prompt for a skill and add it to the registry; returns an exit code"""
+    print("🎯 Add New Skill to Registry")
+    print("=" * 50)
+    print()
+
+    try:
+        name = get_input("Skill name (lowercase, hyphens)", required=True)
+        description = get_input("Description", required=True)
+
+        print("\n📍 Source Information")
+        repo = get_input("GitHub repo (owner/repo)", required=True)
+        branch = get_input("Branch", default="main")
+        path = get_input("Path to skill in repo", default="skills/" + name)
+
+        print("\n📝 Metadata")
+        author = get_input("Author", required=True)
+        license_type = get_input("License", default="MIT")
+        category = get_input("Category", default="development", required=False)
+        tags_input = get_input("Tags (comma-separated)", required=False)
+    except InputAborted:
+        print("❌ This field is required!")
+        return 1
+
+    tags = [t.strip() for t in tags_input.split(",")] if tags_input else []
+
+    skill_entry = build_entry(
+        name,
+        description,
+        {"type": "github", "repo": repo, "url": GITHUB_URL + repo, "branch": branch, "path": path},
+        {"author": author, "license": license_type, "tags": tags, "category": category},
+    )
+
+    print(f"\n📂 Loading registry from {registry_path}")
+
+    try:
+        registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print("❌ Registry file not found!")
+        return 1
+
+    if name in registry['skills']:
+        response = input(f"\n⚠️  Skill '{name}' already exists. Overwrite? (y/N): ")
+        if response.lower() != 'y':
+            print("❌ Aborted.")
+            return 0
+
+    put_skill(registry, name, skill_entry)
+    touch_registry(registry)
+
+    print("\n💾 Saving registry...")
+    save_registry(registry_path, registry)
+
+    print("✅ Skill added successfully!")
+    print()
+    print("📋 Summary:")
+    print(f"  Name: {name}")
+    print(f"  Description: {description}")
+    print(f"  Source: {repo}")
+    print(f"  Path: {path}")
+    print()
+    print("👉 Next steps:")
+    print("  1. Run: python tools/validate_registry.py")
+    print("  2. Run: python tools/generate_readme.py")
+    print(f"  3. Run: git add . && git commit -m 'Add: {name} - {description}'")
+    print("  4. Run: git push")
+    return 0
+
+
+def read_records(path: Path, format: Optional[str] = None) -> List[Dict]:
+    """
+    Read skill records from a CSV, JSONL, JSON or YAML file
+
+    Args:
+        format: 'csv', 'jsonl', 'json' or 'yaml' (default: from the extension)
+
+    Raises:
+        RecordError: Unknown format or a malformed file
+    """
+    path = Path(path)
+    format = format or FORMATS.get(path.suffix.lower())
+    if format not in set(FORMATS.values()):
+        raise RecordError(f"{path}: unknown format (use .csv, .jsonl, .json, .yaml or --format)")
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if format == 'csv':
+            return [
+                {k.strip(): v for k, v in row.items() if k and v not in (None, '')}
+                for row in csv.DictReader(f)
+            ]
+
+        if format == 'jsonl':
+            records = []
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise RecordError(f"{path}:{number}: {e.msg}")
+            return records
+
+        if format == 'yaml':
+            if yaml is None:
+                raise RecordError("YAML files need PyYAML: pip install pyyaml")
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise RecordError(f"{path}: {e}")
+        else:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise RecordError(f"{path}:{e.lineno}: {e.msg}")
+
+    # JSON/YAML: a list of records, or {"skills": [...]} / {"skills": {name: record}}
+    if isinstance(data, dict) and 'skills' in data:
+        data = data['skills']
+    if isinstance(data, dict):
+        data = [dict(record, name=name) if isinstance(record, dict) else record for name, record in data.items()]
+    if not isinstance(data, list):
+        raise RecordError(f"{path}: expected a list of skill records")
+    return data
+
+
+def _fields(record: Dict) -> Dict:
+    """Flat fields of a record, nested source/metadata included (raises RecordError)"""
+    fields = {}
+    for key, value in record.items():
+        if key in ('source', 'metadata'):
+            if not isinstance(value, dict):
+                raise RecordError(f"{key} must be an object")
+            allowed = SOURCE_FIELDS if key == 'source' else METADATA_FIELDS
+            for nested, nested_value in value.items():
+                if nested not in allowed:
+                    raise RecordError(f"unknown field '{key}.{nested}'")
+                fields[nested] = nested_value
+        elif key in RECORD_FIELDS:
+            fields[key] = value
+        else:
+            raise RecordError(f"unknown field '{key}'")
+
+    if isinstance(fields.get('tags'), str):
+        fields['tags'] = [t.strip() for t in fields['tags'].split(',') if t.strip()]
+    for key, value in fields.items():
+        if key != 'tags' and value is not None and not isinstance(value, str):
+            raise RecordError(f"{key} must be a string")
+    return {k: v for k, v in fields.items() if v is not None and v != ''}
+
+
+def record_to_entry(record: Dict, existing: Optional[Dict] = None) -> Dict:
+    """
+    Registry entry for a record; with existing, the record updates that entry
+    and fields it leaves out keep their values
+
+    Raises:
+        RecordError: Unknown fields or fields of the wrong type
+    """
+    fields = _fields(record)
+    name = fields.get('name')
+
+    if existing is None:
+        repo = fields.get('repo')
+        source_type = fields.get('type', 'github')
+        # GitHub urls are always derived from the repo
+        if source_type == 'github':
+            url = GITHUB_URL + repo if repo else None
+        else:
+            url = fields.get('url')
+        return build_entry(
+            name,
+            fields.get('description'),
+            {"type": source_type, "repo": repo, "url": url, "branch": fields.get('branch', 'main' if repo else None),
+             "path": fields.get('path', f"skills/{name}"), "commit": fields.get('commit'), "tree": fields.get('tree')},
+            {"author": fields.get('author', repo.split('/')[0] if isinstance(repo, str) else None),
+             "license": fields.get('license', 'Unknown'), "tags": list(fields.get('tags', [])),
+             "category": fields.get('category', 'general')},
+        )
+
+    entry = copy.deepcopy(existing)
+    if 'description' in fields:
+        entry['description'] = fields['description']
+    source = entry.setdefault('source', {})
+    metadata = entry.setdefault('metadata', {})
+    moved = any(k in fields and fields[k] != source.get(k) for k in ('repo', 'branch', 'path'))
+    for key in SOURCE_FIELDS:
+        if key in fields:
+            source[key] = fields[key]
+    for key in METADATA_FIELDS:
+        if key in fields:
+            metadata[key] = fields[key]
+
+    # A pin only describes the location it was taken from
+    if moved and 'commit' not in fields and 'tree' not in fields:
+        source.pop('commit', None)
+        source.pop('tree', None)
+    if 'url' in source and source.get('type') == 'github' and source.get('repo'):
+        source['url'] = GITHUB_URL + source['repo']
+    return entry
+
+
+def add_skills(registry: dict, records: Iterable[Dict], update: bool = False) -> Dict[str, List]:
+    """
+    Validate records and apply them to the registry as one transaction
+
+    Every record is checked with validate_skill before anything changes; if
+    any record fails the registry is left untouched.
+
+    Args:
+        update: Allow records to update existing skills (otherwise an
+            existing name is an error)
+
+    Returns:
+        {'added', 'updated', 'unchanged', 'errors'} lists; names, or error
+        messages prefixed with the record number
+    """
+    skills = registry['skills']
+    result = {'added': [], 'updated': [], 'unchanged': [], 'errors': []}
+    entries = {}
+
+    for number, record in enumerate(records, 1):
+        name = record.get('name') if isinstance(record, dict) else None
+        where = f"Record {number}" + (f" ({name})" if isinstance(name, str) else "")
+        if not isinstance(record, dict):
+            result['errors'].append(f"{where}: must be an object")
+            continue
+        if not isinstance(name, str) or not name:
+            result['errors'].append(f"{where}: missing name")
+            continue
+        if name in entries:
+            result['errors'].append(f"{where}: '{name}' is defined more than once")
+            continue
+
+        existing = skills.get(name)
+        if existing is not None and not update:
+            result['errors'].append(f"{where}: '{name}' already exists (use --update to change it)")
+            continue
+
+        try:
+            entry = record_to_entry(record, existing)
+        except RecordError as e:
+            result['errors'].append(f"{where}: {e}")
+            continue
+        errors = validate_skill(name, entry)
+        result['errors'].extend(f"{where}: {error}" for error in errors)
+
+        entries[name] = entry
+        if existing is None:
+            result['added'].append(name)
+        elif entry != existing:
+            result['updated'].append(name)
+        else:
+            result['unchanged'].append(name)
+
+    if result['errors']:
+        return result
+
+    for name in result['added'] + result['updated']:
+        put_skill(registry, name, entries[name])
+    if result['added'] or result['updated']:
+        touch_registry(registry)
+    return result
+
+
+def import_skills(path: Path, registry_path: Path = REGISTRY_PATH, update: bool = False,
+                  dry_run: bool = False, format: Optional[str] = None) -> int:
+    """Add or update the skills defined in a file with one registry write; returns an exit code"""
+    print_header("📥 Add Skills from File")
+
+    try:
+        records = read_records(path, format)
+    except (OSError, csv.Error, RecordError) as e:
+        print_error(str(e))
+        return 1
+
+    try:
+        registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    print_info(f"Validating {len(records)} record(s) from {path}...")
+    result = add_skills(registry, records, update)
+    if result['errors']:
+        print()
+        for error in result['errors']:
+            print(f"  {Colors.RED}✗{Colors.END} {error}")
+        print()
+        print_error(f"{len(result['errors'])} error(s); nothing was written")
+        return 1
+
+    for label, names in (("Added", result['added']), ("Updated", result['updated'])):
+        if names:
+            print(f"\n{Colors.BOLD}{label}:{Colors.END}")
+            for name in names:
+                print(f"  {Colors.GREEN}✓{Colors.END} {name}")
+    print()
+
+    changed = len(result['added']) + len(result['updated'])
+    summary = (f"{len(result['added'])} added, {len(result['updated'])} updated, "
+               f"{len(result['unchanged'])} unchanged")
+    if dry_run:
+        print_warning(f"Dry run: {summary}; registry not written")
+        return 0
+    if not changed:
+        print_info(f"Nothing to write ({summary})")
+        return 0
+
+    save_registry(registry_path, registry)
+    print_success(f"Saved registry: {summary}")
+    print()
+    print_next_steps(f"Add or update {changed} skills from {Path(path).name}")
+    return 0
@@ -0,0 +1,243 @@
+"""
+Batch Skills Manager
+
+Scan several repositories at once and interactively pick which of the
+discovered skills to add.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from . import tracing
+from .bulk import parse_repository_list
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info, print_next_steps
+from .github import DEFAULT_WORKERS
+from .registry import REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry
+from .stats import put_skill
+
+POPULAR_REPOSITORIES = [
+    "anthropics/skills",
+    "obra/superpowers",
+    "alirezarezvani/claude-skills",
+    "K-Dense-AI/claude-scientific-skills",
+    "mrgoonie/claudekit-skills",
+    "czlonkowski/n8n-skills",
+    "huggingface/skills",
+    "bear2u/my-skills",
+    "yusufkaraaslan/Skill_Seekers"
+]
+
+
+def batch_add_repositories(repos: List[Union[str, Dict]], branch: Optional[str] = None,
+                           registry_path: Path = REGISTRY_PATH, workers: int = DEFAULT_WORKERS):
+    """
+    Batch add skills from multiple repositories (branch None: each repository's default branch)
+
+    repos are owner/repo names or {'repo', 'branches'} entries of a
+    repository list; an entry's own branches take precedence over branch.
+
+    Repositories are scanned `workers` at a time and new skills are listed,
+    numbered for selection, as soon as they are found.
+    """
+    from .github import stream_skills
+
+    print_header("🚀 Batch Skills Manager")
+
+    try:
+        with tracing.span('load_registry'):
+            registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return
+
+    targets = [(r['repo'], [b or branch for b in r['branches']]) if isinstance(r, dict) else (r, [branch])
+               for r in repos]
+    repo_stats = {repo: 0 for repo, _ in targets}
+    new_skills = []
+    new_names = set()
+    existing_skills = []
+    existing_count = 0
+    failed = []
+    done = 0
+
+    # Step 1: Scan all repositories, checking each skill as it arrives
+    print_info(f"Scanning {len(repos)} repositories...\n")
+
+    with tracing.span('scan'):
+        for repo, skill in stream_skills(targets, workers):
+            if skill is None or isinstance(skill, Exception):
+                done += 1
+                prefix = f"[{done}/{len(repos)}] {Colors.BOLD}{repo}{Colors.END}"
+                if skill is not None:
+                    print_error(f"{prefix}: scan failed: {skill}")
+                    failed.append(repo)
+                elif repo_stats[repo]:
+                    print_success(f"{prefix}: {repo_stats[repo]} skill(s)")
+                else:
+                    print_warning(f"{prefix}: no skills found")
+                continue
+
+            repo_stats[repo] += 1
+            if skill['name'] in registry['skills'] or skill['name'] in new_names:
+                existing_count += 1
+                if len(existing_skills) < 10:
+                    existing_skills.append(skill)
+                continue
+
+            new_skills.append(skill)
+            new_names.add(skill['name'])
+            print(f"{Colors.CYAN}{len(new_skills):3d}.{Colors.END} {Colors.BOLD}{skill['name']}{Colors.END}"
+                  f"  {Colors.BLUE}{skill['repo']}/{skill['path']}{Colors.END}")
+
+    total = sum(repo_stats.values())
+    if failed:
+        print_warning(f"{len(failed)} repositories failed: {', '.join(sorted(failed))}")
+    if not total:
+        print_error("No skills found in any repository!")
+        return
+
+    # Step 2: Show summary
+    print()
+    print_header("📊 Scan Summary")
+
+    print(f"Repositories scanned: {len(repos)}")
+    print(f"Total skills found: {Colors.GREEN}{Colors.BOLD}{total}{Colors.END}")
+    print()
+
+    for repo, found in repo_stats.items():
+        if repo in failed:
+            print(f"  {Colors.RED}❌{Colors.END} {repo}: failed")
+        elif found:
+            print(f"  {Colors.GREEN}✅{Colors.END} {repo}: {found} skills")
+        else:
+            print(f"  {Colors.YELLOW}⚠️{Colors.END} {repo}: 0 skills")
+
+    # Step 3: Duplicates
+    print()
+    print(f"New skills: {Colors.GREEN}{len(new_skills)}{Colors.END}")
+    print(f"Existing skills: {Colors.YELLOW}{existing_count}{Colors.END}")
+
+    if existing_skills:
+        print()
+        print_warning("These skills already exist and will be skipped:")
+        for skill in existing_skills:
+            print(f"  - {skill['name']}")
+        if existing_count > len(existing_skills):
+            print(f"  ... and {existing_count - len(existing_skills)} more")
+
+    if not new_skills:
+        return
+
+    # Step 4: Interactive selection (numbers as listed during the scan)
+    print()
+    selected = select_skills(new_skills)
+    if not selected:
+        return
+
+    # Step 5: Add skills to registry
+    print()
+    print_header("💾 Adding Skills to Registry")
+
+    for skill in selected:
+        put_skill(registry, skill['name'], create_skill_entry(skill, skill['branch']))
+        print_success(f"Added {skill['name']}")
+
+    touch_registry(registry, synced=True)
+    with tracing.span('save_registry'):
+        save_registry(registry_path, registry)
+
+    print()
+    print_success(f"Successfully added {len(selected)} skill(s)!")
+    print()
+    print_next_steps(f"Batch add {len(selected)} skills")
+
+
+def select_skills(new_skills: List[dict]) -> List[dict]:
+    """Ask which of the new skills to add (empty list when cancelled)"""
+    print(f"{Colors.YELLOW}Choose an option:{Colors.END}")
+    print(f"  {Colors.GREEN}1{Colors.END}. Add all new skills ({len(new_skills)})")
+    print(f"  {Colors.GREEN}2{Colors.END}. Select specific skills to add")
+    print(f"  {Colors.GREEN}3{Colors.END}. Cancel")
+
+    choice = input(f"\n{Colors.BOLD}Enter choice [1-3]:{Colors.END} ").strip()
+
+    if choice == '1':
+        return new_skills
+
+    if choice != '2':
+        print_info("Cancelled")
+        return []
+
+    print()
+    print("Enter skill numbers to add (comma-separated, e.g., 1,3,5):")
+    print("Or enter 'all' to add all, '0' to cancel")
+
+    selection = input(f"{Colors.BOLD}Selection:{Colors.END} ").strip()
+
+    if selection.lower() == 'all':
+        return new_skills
+    if selection == '0':
+        print_info("Cancelled")
+        return []
+
+    try:
+        indices = [int(x.strip()) - 1 for x in selection.split(',')]
+    except ValueError:
+        print_error("Invalid selection")
+        return []
+
+    selected = [new_skills[i] for i in indices if 0 <= i < len(new_skills)]
+    if not selected:
+        print_warning("No skills selected")
+    return selected
+
+
+def prompt_repositories() -> List[Union[str, Dict]]:
+    """Interactive menu shown by batch_add.py without arguments (see batch_add_repositories for the entries)"""
+    print_header("🎯 Batch Skills Manager")
+    print(f"{Colors.BOLD}Add multiple skill repositories at once{Colors.END}\n")
+
+    print(f"{Colors.YELLOW}Options:{Colors.END}")
+    print("  1. Enter repository URLs interactively")
+    print("  2. Load from file")
+    print("  3. Use popular repositories")
+
+    choice = input(f"\n{Colors.BOLD}Choose option [1-3]:{Colors.END} ").strip()
+
+    repos = []
+
+    if choice == '1':
+        print()
+        print_info("Enter repository URLs (one per line, empty line to finish):")
+        print_info("Format: owner/repo (e.g., anthropics/skills)")
+
+        while True:
+            repo = input(f"{Colors.BOLD}Repo:{Colors.END} ").strip()
+            if not repo:
+                break
+            repos.append(repo)
+
+    elif choice == '2':
+        filename = input(f"\n{Colors.BOLD}Enter filename:{Colors.END} ").strip()
+        try:
+            entries, problems = parse_repository_list(Path(filename))
+        except FileNotFoundError:
+            print_error(f"File not found: {filename}")
+            return []
+        for problem in problems:
+            print_warning(f"Skipped {problem}")
+        repos = entries
+        print_success(f"Loaded {len(repos)} repositories from {filename}")
+
+    elif choice == '3':
+        repos = list(POPULAR_REPOSITORIES)
+        print_success(f"Selected {len(repos)} popular repositories")
+
+    else:
+        print_error("Invalid choice")
+        return []
+
+    if not repos:
+        print_error("No repositories specified")
+
+    return repos
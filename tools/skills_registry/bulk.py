@@ -0,0 +1,253 @@
+"""
+Bulk Import
+
+Import every skill from a repository list (repositories.txt or
+repositories.json) without prompts. Repositories are scanned concurrently
+and each finished repository is checkpointed to a state file, so an
+interrupted run resumes where it stopped instead of scanning everything
+again.
+
+repositories.txt format (one repository per line):
+
+    # Comment lines and blank lines are ignored
+    anthropics/skills
+    obra/superpowers@develop          # branch after '@', trailing comments ok
+    owner/repo@main,v2                # several branches or tags
+    https://github.com/huggingface/skills
+"""
+
+import re
+import json
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from . import tracing
+from .config import categorize_skill
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info, print_next_steps
+from .registry import (ROOT_DIR, REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry,
+                       utc_now)
+from .stats import put_skill
+
+STATE_PATH = ROOT_DIR / ".bulk-import-state.json"
+DEFAULT_WORKERS = 8
+
+_REPO = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
+_GITHUB_URL = re.compile(r"^(?:https?://)?(?:www\.)?github\.com/")
+
+
+def parse_repository_line(line: str, default_branch: Optional[str] = None) -> Optional[Dict]:
+    """
+    Parse one repositories.txt line
+
+    Returns:
+        {'repo', 'branches'}, or None for blank and comment lines (a branch
+        of None means the repository's default branch)
+
+    Raises:
+        ValueError: The line is not a repository
+    """
+    line = line.split('#', 1)[0].strip()
+    if not line:
+        return None
+
+    repo, _, branch = line.partition('@')
+    repo = _GITHUB_URL.sub('', repo.strip()).rstrip('/')
+    if repo.endswith('.git'):
+        repo = repo[:-4]
+    if not _REPO.match(repo):
+        raise ValueError(f"not an owner/repo: {line!r}")
+    branches = [b.strip() for b in branch.split(',') if b.strip()]
+    return {'repo': repo, 'branches': branches or [default_branch]}
+
+
+def parse_repository_list(path: Path, default_branch: Optional[str] = None) -> Tuple[List[Dict], List[str]]:
+    """
+    Read a repository list file
+
+    repositories.json contributes its enabled repositories; any other file is
+    read as repositories.txt. Duplicate repositories keep their first entry.
+
+    Returns:
+        (list of {'repo', 'branches'}, list of problems with line numbers)
+    """
+    path = Path(path)
+    repos, problems = [], []
+
+    if path.suffix == '.json':
+        from .config import load_config, enabled_repositories, repository_refs
+
+        for entry in enabled_repositories(load_config(path)):
+            refs = [ref or default_branch for ref in repository_refs(entry)]
+            repos.append({'repo': entry['repo'], 'branches': refs})
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    entry = parse_repository_line(line, default_branch)
+                except ValueError as e:
+                    problems.append(f"{path.name}:{number}: {e}")
+                    continue
+                if entry:
+                    repos.append(entry)
+
+    seen = set()
+    unique = []
+    for entry in repos:
+        if entry['repo'] not in seen:
+            seen.add(entry['repo'])
+            unique.append(entry)
+    return unique, problems
+
+
+def load_state(state_path: Path, source: str) -> Dict:
+    """Checkpoint of a previous run over the same list (fresh state otherwise)"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('source') == source:
+            return state
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {'source': source, 'started': utc_now(), 'repos': {}}
+
+
+def save_state(state_path: Path, state: Dict):
+    """Write the checkpoint atomically"""
+    tmp = Path(state_path).with_name(Path(state_path).name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    tmp.replace(state_path)
+
+
+def scan_all(repos: List[Dict], state: Dict, state_path: Path, workers: int = DEFAULT_WORKERS) -> List[str]:
+    """
+    Scan the repositories not yet in the checkpoint, saving it after each one
+
+    Returns:
+        Repositories that failed (they stay out of the checkpoint and are
+        retried on the next run)
+    """
+    from .github import find_skills_in_refs, GitHubError
+
+    pending = [r for r in repos if r['repo'] not in state['repos']]
+    failed = []
+    if not pending:
+        return failed
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(find_skills_in_refs, r['repo'], r['branches'], strict=True): r
+            for r in pending
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                entry = futures[future]
+                prefix = f"[{done}/{len(pending)}] {Colors.BOLD}{entry['repo']}{Colors.END}"
+                try:
+                    skills = future.result()
+                except GitHubError as e:
+                    print_error(f"{prefix}: {e}")
+                    failed.append(entry['repo'])
+                    continue
+
+                state['repos'][entry['repo']] = {'skills': skills}
+                save_state(state_path, state)
+                print(f"{prefix}: {len(skills)} skill(s)")
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return failed
+
+
+def bulk_import(list_path: Path, registry_path: Path = REGISTRY_PATH, state_path: Path = STATE_PATH,
+                workers: int = DEFAULT_WORKERS, branch: Optional[str] = None, fresh: bool = False,
+                categories: Optional[dict] = None, bayes: bool = False) -> int:
+    """
+    Scan every repository of a list file and add all new skills; returns an exit code
+
+    New skills are categorized by keyword; with bayes the learned categorizer
+    (classifier.py) relabels them in one batch where it is confident.
+    """
+    print_header("📦 Bulk Import")
+
+    try:
+        repos, problems = parse_repository_list(list_path, branch)
+    except FileNotFoundError:
+        print_error(f"File not found: {list_path}")
+        return 1
+
+    for problem in problems:
+        print_warning(f"Skipped {problem}")
+    if not repos:
+        print_error("No repositories in the list")
+        return 1
+
+    source = str(Path(list_path).resolve())
+    if fresh:
+        Path(state_path).unlink(missing_ok=True)
+    state = load_state(state_path, source)
+    if state['repos']:
+        print_info(f"Resuming: {len(state['repos'])} of {len(repos)} repositories already scanned")
+    print_info(f"Scanning {len(repos) - len(state['repos'])} repositories with {workers} workers...\n")
+
+    try:
+        with tracing.span('scan'):
+            failed = scan_all(repos, state, state_path, workers)
+    except KeyboardInterrupt:
+        print()
+        print_warning(f"Interrupted; progress saved to {state_path}")
+        print_info("Run the same command again to resume")
+        return 130
+
+    try:
+        with tracing.span('load_registry'):
+            registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    # Same order as the list: the first repository wins a name collision
+    new_skills = {}
+    for entry in repos:
+        result = state['repos'].get(entry['repo'])
+        for skill in (result or {}).get('skills', []):
+            if skill['name'] in registry['skills'] or skill['name'] in new_skills:
+                continue
+            skill = dict(skill, category=categorize_skill(skill['name'], f"Skill from {skill['repo']}", categories or {}))
+            new_skills[skill['name']] = skill
+
+    if bayes and new_skills:
+        from .classifier import categorize_skills
+
+        with tracing.span('categorize'):
+            categorize_skills(list(new_skills.values()), registry, registry_path)
+
+    added = []
+    for name, skill in new_skills.items():
+        put_skill(registry, name, create_skill_entry(skill, skill['branch'], skill['category']))
+        added.append(name)
+
+    print()
+    print_header("📊 Bulk Import Summary")
+    print(f"Repositories scanned: {len(state['repos'])}/{len(repos)}")
+    print(f"New skills: {Colors.GREEN}{len(added)}{Colors.END}")
+
+    if added:
+        touch_registry(registry, synced=True)
+        with tracing.span('save_registry'):
+            save_registry(registry_path, registry)
+        print_success(f"Added {len(added)} skill(s) to the registry")
+
+    if failed:
+        print_warning(f"{len(failed)} repositories failed: {', '.join(sorted(failed))}")
+        print_info(f"Run the same command again to retry them (state: {state_path})")
+        return 1
+
+    Path(state_path).unlink(missing_ok=True)
+    if added:
+        print()
+        print_next_steps(f"Bulk import {len(added)} skills")
+    return 0
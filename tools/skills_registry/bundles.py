@@ -0,0 +1,302 @@
+"""
+Skill Bundles
+
+Local, content-addressed cache of skill directories, so installs need no
+network round trip. Fetching resolves each registry entry to a commit,
+lists the skill directory through the git trees API and downloads only
+the files the cache doesn't have:
+
+    .skill-cache/
+        objects/ab/cdef...       file contents, named by git blob sha
+        trees/<tree sha>.json    files of one skill directory version
+        index.json               skill -> repo, path, ref, commit, tree
+
+Identical files (a shared LICENSE, the unchanged files of a new version)
+are stored once, and every download is checked against its blob sha.
+Installs hardlink the objects into place; executables, and every file
+with --copy or across filesystems, are copied.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info
+from .registry import ROOT_DIR
+
+CACHE_DIR = ROOT_DIR / ".skill-cache"
+INSTALL_DIR = Path.home() / ".claude" / "skills"
+DEFAULT_WORKERS = 8
+
+
+class BundleError(Exception):
+    """A skill could not be fetched or installed"""
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Git object id of a file's content"""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    tmp.replace(path)
+
+
+class BundleCache:
+    """Objects, tree manifests and the skill index of one cache directory"""
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+        self.index_path = self.root / "index.json"
+        self.lock = threading.Lock()
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+
+    def object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / sha[2:]
+
+    def has_object(self, sha: str) -> bool:
+        return self.object_path(sha).exists()
+
+    def add_object(self, sha: str, data: bytes):
+        """Store file content under its blob sha (raises BundleError on a mismatch)"""
+        if git_blob_sha(data) != sha:
+            raise BundleError(f"content of blob {sha} does not match its sha")
+        path = self.object_path(sha)
+        _write_atomic(path, data)
+        path.chmod(0o444)
+
+    def manifest(self, tree: str) -> Optional[List[Dict]]:
+        try:
+            with open(self.root / "trees" / f"{tree}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def add_manifest(self, tree: str, files: List[Dict]):
+        _write_atomic(self.root / "trees" / f"{tree}.json", json.dumps(files, separators=(',', ':')).encode('utf-8'))
+
+    def record(self, name: str, info: Dict):
+        with self.lock:
+            self.index[name] = info
+
+    def save_index(self):
+        with self.lock:
+            data = json.dumps(self.index, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        _write_atomic(self.index_path, data)
+
+    def stats(self) -> Dict[str, int]:
+        """Skills, objects, stored bytes and the bytes the skills would take without sharing"""
+        objects = [p for p in (self.root / "objects").glob("*/*") if p.is_file()]
+        logical = 0
+        for info in self.index.values():
+            logical += sum(f['size'] for f in self.manifest(info['tree']) or ())
+        return {
+            'skills': len(self.index),
+            'objects': len(objects),
+            'stored_bytes': sum(p.stat().st_size for p in objects),
+            'logical_bytes': logical,
+        }
+
+
+class _Commits:
+    """Commit of each (repo, ref), resolved once per run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.resolved = {}
+
+    def get(self, repo: str, ref: Optional[str]) -> Tuple[str, str]:
+        from .github import resolve_commit, resolve_default_branch, GitHubError
+
+        key = (repo, ref)
+        with self.lock:
+            if key in self.resolved:
+                return self.resolved[key]
+        try:
+            ref = ref or resolve_default_branch(repo, strict=True)
+            result = resolve_commit(repo, ref, strict=True) if ref else None
+        except GitHubError as e:
+            raise BundleError(str(e))
+        if result is None:
+            raise BundleError(f"{repo}@{ref or 'default branch'} not found")
+        with self.lock:
+            self.resolved[key] = result
+        return result
+
+
+def fetch_skill(cache: BundleCache, name: str, entry: Dict, commits: _Commits) -> Dict:
+    """
+    Bring one skill into the cache
+
+    Returns:
+        {'name', 'files', 'downloaded', 'bytes', 'unchanged'} (raises BundleError)
+    """
+    from .github import GITHUB_API_URL, github_get, fetch_blob, tree_sha_at, GitHubError
+
+    source = entry.get('source') or {}
+    repo, path = source.get('repo'), source.get('path') or ""
+    if source.get('type', 'github') != 'github' or not repo:
+        raise BundleError("not a GitHub skill")
+
+    try:
+        if source.get('commit') and source.get('tree'):
+            commit, tree = source['commit'], source['tree']
+        else:
+            commit, root = commits.get(repo, source.get('branch'))
+            previous = cache.index.get(name)
+            if previous and previous.get('commit') == commit and cache.manifest(previous['tree']) is not None:
+                tree = previous['tree']
+            else:
+                tree = tree_sha_at(repo, root, path, strict=True)
+                if tree is None:
+                    raise BundleError(f"{path or '/'} not found in {repo}@{commit[:12]}")
+
+        files = cache.manifest(tree)
+        if files is None:
+            data = github_get(f"{GITHUB_API_URL}/repos/{repo}/git/trees/{tree}?recursive=1", repo, strict=True)
+            if not isinstance(data, dict) or data.get('truncated') or 'tree' not in data:
+                raise BundleError(f"cannot list {repo}/{path}")
+            files = [
+                {'path': e['path'], 'mode': e['mode'], 'sha': e['sha'], 'size': e.get('size', 0)}
+                for e in data['tree'] if e['type'] == 'blob'
+            ]
+            cache.add_manifest(tree, files)
+
+        downloaded = 0
+        size = 0
+        for file in files:
+            if cache.has_object(file['sha']):
+                continue
+            content = fetch_blob(repo, file['sha'], strict=True)
+            if content is None:
+                raise BundleError(f"blob {file['sha']} of {file['path']} not found")
+            cache.add_object(file['sha'], content)
+            downloaded += 1
+            size += len(content)
+    except GitHubError as e:
+        raise BundleError(str(e))
+
+    previous = cache.index.get(name) or {}
+    cache.record(name, {
+        'repo': repo,
+        'path': path,
+        'ref': source.get('branch'),
+        'commit': commit,
+        'tree': tree,
+        'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    })
+    return {'name': name, 'files': len(files), 'downloaded': downloaded, 'bytes': size,
+            'unchanged': previous.get('tree') == tree}
+
+
+def fetch_bundles(registry: dict, names: Optional[List[str]] = None, cache_dir: Path = CACHE_DIR,
+                  workers: int = DEFAULT_WORKERS) -> int:
+    """Fetch the given skills (default: all) into the cache; returns an exit code"""
+    print_header("📦 Fetch Skill Bundles")
+
+    skills = registry['skills']
+    unknown = [n for n in names or () if n not in skills]
+    for name in unknown:
+        print_error(f"Unknown skill: {name}")
+    selected = [n for n in names if n in skills] if names else list(skills)
+    if not selected:
+        return 1
+
+    cache = BundleCache(cache_dir)
+    commits = _Commits()
+    failed = []
+    downloaded = size = 0
+
+    print_info(f"Fetching {len(selected)} skill(s) into {cache.root}...\n")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_skill, cache, n, skills[n], commits): n for n in selected}
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except BundleError as e:
+                    print_error(f"{name}: {e}")
+                    failed.append(name)
+                    continue
+                downloaded += result['downloaded']
+                size += result['bytes']
+                status = "unchanged" if result['unchanged'] else f"{result['downloaded']} new file(s)"
+                print(f"  {Colors.GREEN}✓{Colors.END} {name}: {result['files']} file(s), {status}")
+        finally:
+            cache.save_index()
+
+    print()
+    print_success(f"Cached {len(selected) - len(failed)} skill(s); downloaded {downloaded} file(s), "
+                  f"{size / 1024:.1f} KB")
+    if failed or unknown:
+        print_warning(f"{len(failed) + len(unknown)} skill(s) not fetched")
+        return 1
+    return 0
+
+
+def install_skill(name: str, dest_dir: Path = INSTALL_DIR, cache_dir: Path = CACHE_DIR,
+                  copy: bool = False, force: bool = False) -> Path:
+    """
+    Install a cached skill into dest_dir/<name> without touching the network
+
+    Returns:
+        The installed directory (raises BundleError)
+    """
+    cache = BundleCache(cache_dir)
+    info = cache.index.get(name)
+    files = cache.manifest(info['tree']) if info else None
+    if files is None:
+        raise BundleError(f"{name} is not cached; run 'skills.py bundles fetch {name}'")
+
+    target = Path(dest_dir) / name
+    if target.exists() and not force:
+        raise BundleError(f"{target} already exists (use --force to replace it)")
+
+    staging = target.with_name(f".{name}.installing")
+    shutil.rmtree(staging, ignore_errors=True)
+    for file in files:
+        source = cache.object_path(file['sha'])
+        if not source.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+            raise BundleError(f"object {file['sha']} of {name} is missing; fetch it again")
+
+        path = staging / file['path']
+        path.parent.mkdir(parents=True, exist_ok=True)
+        executable = file['mode'] == '100755'
+        try:
+            if copy or executable:
+                raise OSError
+            os.link(source, path)
+        except OSError:
+            shutil.copyfile(source, path)
+            path.chmod(0o755 if executable else 0o644)
+
+    if target.exists():
+        shutil.rmtree(target)
+    staging.replace(target)
+    return target
+
+
+def print_status(cache_dir: Path = CACHE_DIR):
+    """Cache size and how much deduplication saves"""
+    stats = BundleCache(cache_dir).stats()
+    saved = stats['logical_bytes'] - stats['stored_bytes']
+    print(f"Cache:   {cache_dir}")
+    print(f"Skills:  {stats['skills']}")
+    print(f"Objects: {stats['objects']} ({stats['stored_bytes'] / 1024:.1f} KB stored, "
+          f"{stats['logical_bytes'] / 1024:.1f} KB across skills, {max(saved, 0) / 1024:.1f} KB shared)")
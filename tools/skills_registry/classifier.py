@@ -0,0 +1,241 @@
+"""
+Learned Categorizer
+
+Multinomial Naive Bayes over the tokens of each skill's name, description
+and tags, trained on the categories already curated in the registry. It
+complements the keyword lists of repositories.json: categorize_skill only
+knows the words someone wrote down, this model learns from every labeled
+skill.
+
+Training is a handful of NumPy reductions over the term count matrix, and
+the model is cached next to the registry (skills/skills-classifier.npz)
+with a fingerprint of the labeled skills, so it is only retrained when a
+label or a labeled skill's text changes. "general" is the fallback of the
+keyword matcher rather than a curated label, so it is not learned; it is
+what predict returns for text the model has no confident answer for.
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .semantic import np, require_numpy, tokenize, skill_text
+
+MODEL_FILENAME = "skills-classifier.npz"
+DEFAULT_CATEGORY = "general"
+
+# Laplace smoothing of the per-category term counts
+ALPHA = 1.0
+
+# Predictions less probable than this keep the caller's category
+MIN_PROBABILITY = 0.5
+
+# Texts scored per vectorized step when predicting large batches
+BATCH_SIZE = 4096
+
+
+def model_path(registry_path: Path) -> Path:
+    """Location of the cached model for a registry file"""
+    return Path(registry_path).parent / MODEL_FILENAME
+
+
+def labeled_skills(registry: dict) -> List[Tuple[str, str]]:
+    """(text, category) of every skill with a curated category, sorted by name"""
+    examples = []
+    skills = registry.get('skills', {})
+    for name in sorted(skills):
+        skill = skills[name]
+        metadata = skill.get('metadata') if isinstance(skill, dict) else None
+        category = metadata.get('category') if isinstance(metadata, dict) else None
+        if isinstance(category, str) and category and category != DEFAULT_CATEGORY:
+            examples.append((skill_text(skill), category))
+    return examples
+
+
+def labels_fingerprint(examples: List[Tuple[str, str]]) -> str:
+    """Hash of the training set; the cached model is reused while it matches"""
+    payload = json.dumps(examples, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _term_pairs(token_lists: List[List[str]], vocabulary: Dict[str, int]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """(document row, term column) of every known token, the sparse form of a count matrix"""
+    rows, cols = [], []
+    for row, tokens in enumerate(token_lists):
+        for token in tokens:
+            col = vocabulary.get(token)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+    return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)
+
+
+def train(examples: List[Tuple[str, str]], alpha: float = ALPHA) -> dict:
+    """
+    Fit the model on (text, category) examples
+
+    Returns:
+        Model dictionary (fingerprint, labels, vocabulary, log_prior,
+        log_likelihood, examples)
+    """
+    require_numpy()
+
+    token_lists = [tokenize(text) for text, _ in examples]
+    vocabulary = sorted({token for tokens in token_lists for token in tokens})
+    # Without a term there is nothing to learn; the empty model makes
+    # predict() keep every caller's category
+    labels = sorted({category for _, category in examples}) if vocabulary else []
+    if not labels:
+        return {
+            'fingerprint': labels_fingerprint(examples),
+            'labels': [],
+            'vocabulary': [],
+            'log_prior': np.zeros(0, dtype=np.float32),
+            'log_likelihood': np.zeros((0, 0), dtype=np.float32),
+            'examples': len(examples),
+        }
+
+    rows, cols = _term_pairs(token_lists, {term: i for i, term in enumerate(vocabulary)})
+
+    label_index = {label: i for i, label in enumerate(labels)}
+    label_ids = np.array([label_index[category] for _, category in examples], dtype=np.int64)
+
+    # Term counts per category, smoothed, as log P(term | category)
+    cells = label_ids[rows] * len(vocabulary) + cols
+    class_counts = np.bincount(cells, minlength=len(labels) * len(vocabulary)).reshape(len(labels), len(vocabulary)) + alpha
+    log_likelihood = np.log(class_counts) - np.log(class_counts.sum(axis=1, keepdims=True))
+    log_prior = np.log(np.bincount(label_ids, minlength=len(labels)) / len(examples))
+
+    return {
+        'fingerprint': labels_fingerprint(examples),
+        'labels': labels,
+        'vocabulary': vocabulary,
+        'log_prior': log_prior.astype(np.float32),
+        'log_likelihood': log_likelihood.astype(np.float32),
+        'examples': len(examples),
+    }
+
+
+def save_model(model: dict, path: Path):
+    """Save the model as a compressed NumPy archive"""
+    require_numpy()
+    np.savez_compressed(
+        path,
+        fingerprint=np.array(model['fingerprint']),
+        labels=np.array(model['labels'], dtype=str),
+        vocabulary=np.array(model['vocabulary'], dtype=str),
+        log_prior=model['log_prior'],
+        log_likelihood=model['log_likelihood'],
+        examples=np.array(model['examples']),
+    )
+
+
+def load_model(path: Path) -> dict:
+    """Load a model saved by save_model"""
+    require_numpy()
+    with np.load(path, allow_pickle=False) as data:
+        return {
+            'fingerprint': str(data['fingerprint']),
+            'labels': data['labels'].tolist(),
+            'vocabulary': data['vocabulary'].tolist(),
+            'log_prior': data['log_prior'],
+            'log_likelihood': data['log_likelihood'],
+            'examples': int(data['examples']),
+        }
+
+
+def load_or_train(registry_path: Path, registry: dict) -> dict:
+    """Load the cached model, retraining it when the labeled skills have changed"""
+    examples = labeled_skills(registry)
+    path = model_path(registry_path)
+    if path.exists():
+        try:
+            model = load_model(path)
+        except (OSError, KeyError, ValueError):
+            model = None
+        if model and model['fingerprint'] == labels_fingerprint(examples):
+            return model
+
+    model = train(examples)
+    save_model(model, path)
+    return model
+
+
+def predict(texts: List[str], model: dict, default: str = DEFAULT_CATEGORY) -> List[Tuple[str, float]]:
+    """
+    Most probable category of each text, in batches of BATCH_SIZE
+
+    Returns:
+        List of (category, posterior probability); texts sharing no terms
+        with the model get the default category and 0.0
+    """
+    require_numpy()
+    if not texts:
+        return []
+    if not model['labels']:
+        return [(default, 0.0)] * len(texts)
+
+    vocabulary = {term: i for i, term in enumerate(model['vocabulary'])}
+    labels = model['labels']
+    results = []
+    for start in range(0, len(texts), BATCH_SIZE):
+        batch = texts[start:start + BATCH_SIZE]
+        rows, cols = _term_pairs([tokenize(t) for t in batch], vocabulary)
+        scores = np.tile(model['log_prior'], (len(batch), 1))
+        np.add.at(scores, rows, model['log_likelihood'].T[cols])
+
+        # Posterior of the best category, computed stably in log space
+        best = scores.argmax(axis=1)
+        shifted = scores - scores[np.arange(len(scores)), best][:, None]
+        probability = 1.0 / np.exp(shifted).sum(axis=1)
+        known = np.bincount(rows, minlength=len(batch)) > 0
+
+        results.extend(
+            (labels[b], float(p)) if k else (default, 0.0)
+            for b, p, k in zip(best.tolist(), probability.tolist(), known.tolist())
+        )
+    return results
+
+
+def scan_text(skill: Dict) -> str:
+    """Text of a scan result, which has no description yet"""
+    return f"{skill['name'].replace('-', ' ').replace('_', ' ')} Skill from {skill['repo']}"
+
+
+def categorize_skills(skills: List[Dict], registry: dict, registry_path: Path,
+                      min_probability: float = MIN_PROBABILITY) -> int:
+    """
+    Set 'category' on scan results in one batch, where the model is confident
+
+    Skills whose best category is less probable than min_probability keep
+    the category they have (the keyword match).
+
+    Returns:
+        Number of skills the model categorized
+    """
+    if not skills:
+        return 0
+    model = load_or_train(registry_path, registry)
+    changed = 0
+    for skill, (category, probability) in zip(skills, predict([scan_text(s) for s in skills], model)):
+        if probability >= min_probability:
+            skill['category'] = category
+            changed += 1
+    return changed
+
+
+def cross_validate(examples: List[Tuple[str, str]], folds: int = 5) -> Optional[float]:
+    """Accuracy over `folds` train/test splits of the examples (None when too few)"""
+    require_numpy()
+    folds = min(folds, len(examples))
+    if folds < 2:
+        return None
+
+    correct = 0
+    for fold in range(folds):
+        test = examples[fold::folds]
+        model = train([e for i, e in enumerate(examples) if i % folds != fold])
+        predictions = predict([text for text, _ in test], model)
+        correct += sum(1 for (category, _), (_, label) in zip(predictions, test) if category == label)
+    return correct / len(examples)
@@ -0,0 +1,68 @@
+"""
+Skills Registry CLI
+
+Single entry point for all registry tools:
+
+    python tools/skills.py <command> [options]
+
+The subcommands are defined in the commands package. Command modules are
+imported inside their handlers, so read-only commands such as list,
+validate and search never load the HTTP stack.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+from .commands import load_config_or_exit  # noqa: F401  (used by repo_manager.py)
+from .commands import repositories, imports, checks, lookups, categorization, storage, releases
+from .console import setup_console
+from .registry import ROOT_DIR, REGISTRY_PATH
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="skills.py",
+        description="Manage the Claude Skills registry",
+    )
+    parser.add_argument('--registry', type=Path, default=REGISTRY_PATH,
+                        help="Registry file (default: skills/skills-registry.json)")
+    parser.add_argument('--config', type=Path, default=ROOT_DIR / "repositories.json",
+                        help="Repository configuration (default: repositories.json)")
+    sub = parser.add_subparsers(dest='command', metavar='<command>')
+    sub.required = True
+
+    trace = argparse.ArgumentParser(add_help=False)
+    trace.add_argument('--trace', metavar='FILE',
+                       help="Record requests and spans to FILE (.jsonl for JSONL, otherwise Chrome trace)")
+
+    for group in (repositories, imports, checks, lookups, categorization, storage, releases):
+        group.register(sub, trace)
+
+    # Every command can be profiled; an argument group rather than a parent
+    # parser so the option also lands on commands added above without one
+    for p in sub.choices.values():
+        group = p.add_argument_group('profiling')
+        group.add_argument('--profile', metavar='FILE',
+                           help="Run under cProfile; write pstats data to FILE and a report to FILE.txt")
+        group.add_argument('--profile-memory', action='store_true',
+                           help="With --profile, also trace allocations (tracemalloc) for peak memory")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    setup_console()
+    args = build_parser().parse_args(argv)
+
+    # Positional registry path (validate/readme) overrides --registry
+    if getattr(args, 'path', None):
+        args.registry = args.path
+
+    if args.profile:
+        from .profiling import run_profiled
+        command = " ".join(["skills.py"] + list(argv if argv is not None else sys.argv[1:]))
+        return run_profiled(args.profile, args.profile_memory, command, args.handler, args) or 0
+    return args.handler(args) or 0
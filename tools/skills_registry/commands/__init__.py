@@ -0,0 +1,54 @@
+"""
+Subcommand handlers of the CLI, one module per group of commands
+
+Each module defines cmd_* handlers and register(sub, trace), which adds
+its subcommands to the parser; trace is the parent parser providing
+--trace. Handlers import the modules doing the work when they run.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+from ..console import print_error
+
+
+def run_traced(trace_path: Optional[str], fn, *args, **kwargs):
+    """Run fn with tracing enabled when a trace file was requested"""
+    from .. import tracing
+
+    if not trace_path:
+        return fn(*args, **kwargs)
+
+    tracing.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        tracing.finish(trace_path)
+
+
+def load_config_or_exit(config_path: Path) -> dict:
+    """Load repositories.json, exiting with a hint when it is missing"""
+    from ..config import load_config
+    from ..console import print_info
+
+    try:
+        return load_config(config_path)
+    except FileNotFoundError:
+        print_error(f"Config file not found: {config_path}")
+        print_info("Create it first using the template")
+        sys.exit(1)
+
+
+def registry_root(registry_path: Path) -> dict:
+    """Top-level registry fields, decoding no skill entries when possible"""
+    from ..reader import RegistryReader
+    from ..registry import load_registry
+    from ..shards import is_sharded
+
+    if is_sharded(registry_path):
+        data = load_registry(registry_path)
+        return {k: v for k, v in data.items() if k != 'skills'}
+
+    with RegistryReader.open(registry_path) as reader:
+        return reader.root
@@ -0,0 +1,108 @@
+"""Learned categorization commands: semantic, classifier"""
+
+from ..console import print_error
+
+
+def cmd_semantic(args) -> int:
+    from .. import semantic
+    from ..config import CONFIG_PATH, load_config
+    from ..registry import load_registry
+
+    semantic.require_numpy()
+
+    try:
+        registry = load_registry(args.registry)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    categories = load_config(CONFIG_PATH).get('categories', {}) if CONFIG_PATH.exists() else {}
+
+    if args.action == 'build':
+        index = semantic.build_index(registry, categories)
+        semantic.save_index(index, semantic.vectors_path(args.registry))
+        print(f"✅ Indexed {len(index['names'])} skills "
+              f"({len(index['vocabulary'])} terms, {len(index['centroid_labels'])} categories)")
+        print(f"   Saved: {semantic.vectors_path(args.registry)}")
+        return 0
+
+    if not args.text:
+        print_error(f"'{args.action}' needs an argument")
+        return 1
+
+    index = semantic.load_or_build_index(args.registry, registry, categories)
+    text = ' '.join(args.text)
+
+    if args.action == 'categorize':
+        category, score = semantic.categorize([text], index)[0]
+        print(f"{category} ({score:.3f})")
+        return 0
+
+    if args.action == 'similar':
+        matches = semantic.similar_skills([text], index, args.top).get(text)
+        if matches is None:
+            print_error(f"Unknown skill: {text}")
+            return 1
+    else:
+        matches = semantic.search(text, index, args.top)
+
+    for name, score in matches:
+        print(f"  {score:.3f}  {name}")
+    return 0
+
+
+def cmd_classifier(args) -> int:
+    from .. import classifier
+    from ..registry import load_registry
+
+    classifier.require_numpy()
+
+    try:
+        registry = load_registry(args.registry)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    if args.action == 'evaluate':
+        examples = classifier.labeled_skills(registry)
+        accuracy = classifier.cross_validate(examples, args.folds)
+        if accuracy is None:
+            print_error("Not enough labeled skills to evaluate")
+            return 1
+        print(f"✅ {args.folds}-fold accuracy: {accuracy:.1%} over {len(examples)} labeled skills")
+        return 0
+
+    if args.action == 'train':
+        model = classifier.train(classifier.labeled_skills(registry))
+        if not model['labels']:
+            print_error(f"No skills with a category other than '{classifier.DEFAULT_CATEGORY}' to learn from")
+            return 1
+        classifier.save_model(model, classifier.model_path(args.registry))
+        print(f"✅ Trained on {model['examples']} labeled skills "
+              f"({len(model['vocabulary'])} terms, {len(model['labels'])} categories)")
+        print(f"   Saved: {classifier.model_path(args.registry)}")
+        return 0
+
+    if not args.text:
+        print_error("'categorize' needs a description")
+        return 1
+
+    model = classifier.load_or_train(args.registry, registry)
+    category, probability = classifier.predict([' '.join(args.text)], model)[0]
+    print(f"{category} ({probability:.3f})")
+    return 0
+
+
+def register(sub, trace):
+    """Add the semantic and classifier subcommands"""
+    p = sub.add_parser('semantic', help="Offline TF-IDF categorization and similarity (needs NumPy)")
+    p.add_argument('action', choices=['build', 'categorize', 'similar', 'search'])
+    p.add_argument('text', nargs='*', help="Description, skill name or query")
+    p.add_argument('--top', type=int, default=5, help="Number of matches (default: 5)")
+    p.set_defaults(handler=cmd_semantic)
+
+    p = sub.add_parser('classifier', help="Naive Bayes categorizer learned from the registry's categories (needs NumPy)")
+    p.add_argument('action', choices=['train', 'categorize', 'evaluate'])
+    p.add_argument('text', nargs='*', help="categorize: skill name and description")
+    p.add_argument('--folds', type=int, default=5, help="evaluate: cross-validation folds (default: 5)")
+    p.set_defaults(handler=cmd_classifier)
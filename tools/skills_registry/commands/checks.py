@@ -0,0 +1,190 @@
+"""Registry maintenance commands: validate, readme, stats, diff"""
+
+import json
+from pathlib import Path
+
+from . import registry_root
+from ..console import print_error
+from ..registry import ROOT_DIR
+
+
+def verify_pins(registry_path: Path) -> int:
+    """Check the commit/tree pins of the registry against GitHub"""
+    from ..pins import verify_pins
+    from ..registry import load_registry
+
+    registry = load_registry(registry_path)
+    pinned = sum(1 for e in registry['skills'].values() if e.get('source', {}).get('commit'))
+    print(f"🔗 Verifying {pinned} pinned skill(s) against GitHub...")
+    problems = verify_pins(registry['skills'])
+    if problems:
+        print("🚫 Pin mismatches:")
+        for problem in problems:
+            print(f"   {problem}")
+        return 1
+    print("✅ All pins match")
+    return 0
+
+
+def cmd_validate(args) -> int:
+    from ..validate import validate_registry
+
+    registry_path = args.registry
+
+    print(f"Validating: {registry_path}")
+    print("")
+
+    is_valid, errors = validate_registry(str(registry_path))
+
+    if is_valid:
+        print("✅ Registry is VALID!")
+        print("")
+
+        if errors:
+            print("⚠️  Warnings:")
+            for warning in errors:
+                print(f"   {warning}")
+            print("")
+
+        print("📊 Registry Statistics:")
+        data = registry_root(registry_path)
+
+        print(f"   Version: {data.get('version', 'Unknown')}")
+        print(f"   Total Skills: {data.get('stats', {}).get('total_skills', 'Unknown')}")
+        print(f"   Total Sources: {data.get('stats', {}).get('total_sources', 'Unknown')}")
+        print(f"   Last Updated: {data.get('last_updated', 'Unknown')}")
+        print("")
+
+        if args.verify_pins:
+            return verify_pins(registry_path)
+        return 0
+
+    print("❌ Registry is INVALID!")
+    print("")
+    print("🚫 Errors:")
+    for error in errors:
+        print(f"   {error}")
+    print("")
+
+    return 1
+
+
+def cmd_readme(args) -> int:
+    from ..readme import generate_readme
+    from ..registry import load_registry
+
+    print(f"Loading registry from: {args.registry}")
+
+    try:
+        data = load_registry(args.registry)
+    except Exception as e:
+        print(f"❌ Error loading registry: {e}")
+        return 1
+
+    print("Generating README...")
+
+    try:
+        readme_content = generate_readme(data, args.workers)
+
+        with open(args.readme, 'w', encoding='utf-8') as f:
+            f.write(readme_content)
+    except Exception as e:
+        print(f"❌ Error generating README: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    print(f"✅ README generated: {args.readme}")
+
+    if not args.no_index:
+        from ..lookup import write_index
+        print(f"✅ Lookup index written: {write_index(args.registry, data)}")
+
+    print("")
+    print(f"  {len(data.get('skills', {}))} skills")
+    print(f"  {len(data.get('categories', {}))} categories")
+    return 0
+
+
+def cmd_stats(args) -> int:
+    from .. import stats
+    from ..registry import load_registry, save_registry, touch_registry
+
+    try:
+        registry = load_registry(args.registry)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    totals = registry.get('stats', {})
+    print(f"Skills:     {totals.get('total_skills')}")
+    print(f"Sources:    {totals.get('total_sources')}")
+    print(f"Categories: {totals.get('total_categories')}")
+    print(f"Last sync:  {totals.get('last_sync')}")
+
+    drift = stats.check(registry)
+    if not drift:
+        print("✅ Stats, category counts and source counts match the skills")
+        return 0
+
+    print(f"\n⚠️  {len(drift)} counter(s) out of date:")
+    for line in drift:
+        print(f"   {line}")
+    if not args.fix:
+        print("Run with --fix to recount them")
+        return 1
+
+    stats.recount(registry)
+    touch_registry(registry)
+    save_registry(args.registry, registry)
+    print(f"✅ Recounted and saved {args.registry}")
+    return 0
+
+
+def cmd_diff(args) -> int:
+    from .. import diff
+
+    new_spec = args.new or str(args.registry)
+    try:
+        old = diff.load_version(args.old, args.registry)
+        new = diff.load_version(new_spec, args.registry)
+    except diff.VersionError as e:
+        print_error(str(e))
+        return 1
+
+    result = diff.diff_registries(old, new)
+    if args.format == 'json':
+        print(json.dumps(diff.to_json(result, args.old, new_spec), indent=2, ensure_ascii=False))
+    else:
+        for line in diff.format_text(result, root=args.root):
+            print(line)
+    return 1 if args.exit_code and diff.has_changes(result) else 0
+
+
+def register(sub, trace):
+    """Add the validate, readme, stats and diff subcommands"""
+    p = sub.add_parser('validate', help="Validate the registry")
+    p.add_argument('path', nargs='?', type=Path, help="Registry file to validate")
+    p.add_argument('--verify-pins', action='store_true',
+                   help="Also check each pinned commit/tree against GitHub (network)")
+    p.set_defaults(handler=cmd_validate)
+
+    p = sub.add_parser('readme', help="Generate README.md from the registry")
+    p.add_argument('path', nargs='?', type=Path, help="Registry file")
+    p.add_argument('readme', nargs='?', type=Path, default=ROOT_DIR / "README.md", help="Output file")
+    p.add_argument('--no-index', action='store_true', help="Don't rebuild the lookup index next to the registry")
+    p.add_argument('--workers', type=int, default=1,
+                   help="Processes rendering category sections (default: 1, serial; 0: one per CPU)")
+    p.set_defaults(handler=cmd_readme)
+
+    p = sub.add_parser('stats', help="Check the registry's stats and category/source counts against its skills")
+    p.add_argument('--fix', action='store_true', help="Recount everything and save the registry")
+    p.set_defaults(handler=cmd_stats)
+
+    p = sub.add_parser('diff', help="Compare two registry versions skill by skill (files or git revisions)")
+    p.add_argument('old', help="Registry file, shard directory, or git revision (rev or rev:path)")
+    p.add_argument('new', nargs='?', help="Same forms (default: the --registry file)")
+    p.add_argument('--format', choices=['text', 'json'], default='text', help="Output format (default: text)")
+    p.add_argument('--root', action='store_true', help="text: also list changed top-level fields (stats, categories, ...)")
+    p.add_argument('--exit-code', action='store_true', help="Exit with 1 when the versions differ")
+    p.set_defaults(handler=cmd_diff)
@@ -0,0 +1,77 @@
+"""Commands that add skills to the registry: batch, bulk, import, add"""
+
+from pathlib import Path
+
+from . import load_config_or_exit, run_traced
+from ..registry import ROOT_DIR
+
+
+def cmd_batch(args) -> int:
+    from ..batch import batch_add_repositories, prompt_repositories
+
+    repos = args.repos or prompt_repositories()
+    if not repos:
+        return 1
+
+    run_traced(args.trace, batch_add_repositories, repos, args.branch, registry_path=args.registry,
+               workers=args.workers)
+    return 0
+
+
+def cmd_bulk(args) -> int:
+    from ..bulk import bulk_import
+
+    config = load_config_or_exit(args.config) if args.config.exists() else {}
+    if args.bayes:
+        from ..classifier import require_numpy
+
+        require_numpy()
+    return run_traced(args.trace, bulk_import, args.file, args.registry, args.state, args.workers,
+                      args.branch, args.fresh, config.get('categories', {}), args.bayes)
+
+
+def cmd_import(args) -> int:
+    from ..importer import import_repository
+
+    return run_traced(args.trace, import_repository, args.repo, args.branch, registry_path=args.registry)
+
+
+def cmd_add(args) -> int:
+    from ..add import add_skill, import_skills
+
+    if args.file:
+        return run_traced(args.trace, import_skills, args.file, args.registry, args.update, args.dry_run, args.format)
+    return add_skill(args.registry)
+
+
+def register(sub, trace):
+    """Add the batch, bulk, import and add subcommands"""
+    p = sub.add_parser('batch', parents=[trace], help="Scan several repositories and pick skills to add")
+    p.add_argument('repos', nargs='*', help="owner/repo (interactive menu when omitted)")
+    p.add_argument('--branch', help="Branch or tag to scan (default: each repository's default branch)")
+    p.add_argument('--workers', type=int, default=8, help="Repositories scanned in parallel (default: 8)")
+    p.set_defaults(handler=cmd_batch)
+
+    p = sub.add_parser('bulk', parents=[trace], help="Import all skills from a repository list, resumable")
+    p.add_argument('file', nargs='?', type=Path, default=ROOT_DIR / "repositories.txt",
+                   help="repositories.txt or repositories.json (default: repositories.txt)")
+    p.add_argument('--workers', type=int, default=8, help="Repositories scanned in parallel (default: 8)")
+    p.add_argument('--branch', help="Branch for entries without one (default: the repository's default branch)")
+    p.add_argument('--state', type=Path, default=ROOT_DIR / ".bulk-import-state.json",
+                   help="Checkpoint file (default: .bulk-import-state.json)")
+    p.add_argument('--fresh', action='store_true', help="Ignore the checkpoint of a previous run")
+    p.add_argument('--bayes', action='store_true',
+                   help="Categorize new skills with a model learned from the registry's categories (needs NumPy)")
+    p.set_defaults(handler=cmd_bulk)
+
+    p = sub.add_parser('import', parents=[trace], help="Import all skills from one repository")
+    p.add_argument('repo', help="owner/repo")
+    p.add_argument('branch', nargs='?', help="Branch or tag (default: the repository's default branch)")
+    p.set_defaults(handler=cmd_import)
+
+    p = sub.add_parser('add', parents=[trace], help="Interactively add a single skill, or add many from a file")
+    p.add_argument('file', nargs='?', type=Path, help="CSV, JSONL, JSON or YAML file of skill records")
+    p.add_argument('--format', choices=['csv', 'jsonl', 'json', 'yaml'], help="File format (default: from the extension)")
+    p.add_argument('--update', action='store_true', help="Update skills that already exist instead of failing")
+    p.add_argument('--dry-run', action='store_true', help="Validate and report without writing the registry")
+    p.set_defaults(handler=cmd_add)
@@ -0,0 +1,194 @@
+"""Read-only lookup commands: search, show, query, index, serve"""
+
+import sys
+import json
+from pathlib import Path
+
+from ..console import print_error
+
+
+def cmd_search(args) -> int:
+    from ..search import search_skills
+    from ..registry import load_registry
+
+    try:
+        registry = load_registry(args.registry)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    results = search_skills(registry, ' '.join(args.query))
+    if not results:
+        print("No matching skills")
+        return 1
+
+    for _, name, skill in results[:args.limit]:
+        category = skill.get('metadata', {}).get('category', '-')
+        print(f"{name:<32} {category:<14} {skill.get('description', '')[:80]}")
+
+    if len(results) > args.limit:
+        print(f"... and {len(results) - args.limit} more")
+    return 0
+
+
+def cmd_show(args) -> int:
+    from ..reader import RegistryReader, RegistryFormatError
+    from ..registry import load_registry
+    from ..shards import is_sharded
+
+    try:
+        if is_sharded(args.registry):
+            skill = load_registry(args.registry)['skills'].get(args.name)
+        else:
+            with RegistryReader.open(args.registry) as reader:
+                skill = reader.get(args.name)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+    except RegistryFormatError as e:
+        print_error(str(e))
+        return 1
+
+    if skill is None:
+        print_error(f"Unknown skill: {args.name}")
+        return 1
+
+    print(json.dumps(skill, indent=2, ensure_ascii=False))
+    return 0
+
+
+def cmd_query(args) -> int:
+    from .. import query
+
+    try:
+        clauses = query.parse_query(args.filters)
+        index, from_file = query.open_index(args.registry, args.index)
+    except query.QueryError as e:
+        print_error(str(e))
+        return 1
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+    if not from_file:
+        # stderr: names and JSON output are meant for pipes
+        print("⚠️  Lookup index missing or stale; built it in memory "
+              "(run 'skills.py index build' to speed up queries)", file=sys.stderr)
+
+    with index:
+        page = query.paginate(query.run_query(index, clauses), args.offset, args.limit)
+        names = [index.name(i) for i in page['items']]
+
+        if args.format == 'names':
+            for name in names:
+                print(name)
+        elif args.format == 'json':
+            page['items'] = [dict(index.entry(i), name=name) for i, name in zip(page['items'], names)]
+            print(json.dumps(page, indent=2, ensure_ascii=False))
+        else:
+            if not names:
+                print("No matching skills")
+                return 1
+            print(f"{'NAME':<32} {'CATEGORY':<14} {'LICENSE':<12} {'AUTHOR':<20} REPO")
+            for i, name in zip(page['items'], names):
+                entry = index.entry(i)
+                metadata, source = entry.get('metadata') or {}, entry.get('source') or {}
+                print(f"{name:<32} {metadata.get('category', '-'):<14} {metadata.get('license') or '-':<12} "
+                      f"{metadata.get('author') or '-':<20} {source.get('repo') or '-'}")
+            shown = f"{page['offset'] + 1}-{page['offset'] + len(names)}"
+            more = f"; next page: --offset {page['next_offset']}" if page['next_offset'] is not None else ""
+            print(f"\n{shown} of {page['total']} skill(s){more}")
+    return 0 if page['total'] else 1
+
+
+def cmd_index(args) -> int:
+    from .. import lookup
+    from ..registry import load_registry
+
+    path = args.index or lookup.index_path(args.registry)
+
+    if args.action == 'build':
+        try:
+            registry = load_registry(args.registry)
+        except FileNotFoundError:
+            print_error("Registry file not found!")
+            return 1
+        lookup.write_index(args.registry, registry, path)
+        print(f"✅ Indexed {len(registry['skills'])} skills: {path}")
+        return 0
+
+    try:
+        index = lookup.LookupIndex.open(path)
+    except (FileNotFoundError, ValueError, lookup.LookupIndexError) as e:
+        print_error(f"Cannot open index {path}: {e}")
+        return 1
+
+    with index:
+        if args.action == 'verify':
+            if index.is_current(args.registry):
+                print(f"✅ {path} is up to date ({len(index)} skills)")
+                return 0
+            print_error(f"{path} is stale; run 'skills.py index build'")
+            return 1
+
+        if args.action == 'get':
+            if not args.name:
+                print_error("get needs a skill name")
+                return 1
+            entry = index.get(args.name)
+            if entry is None:
+                print_error(f"Unknown skill: {args.name}")
+                return 1
+            print(json.dumps(entry, indent=2, ensure_ascii=False))
+            return 0
+
+        for name in index.names(args.category, args.tag, args.repo):
+            print(name)
+    return 0
+
+
+def cmd_serve(args) -> int:
+    from ..server import serve
+
+    try:
+        serve(args.registry, args.host, args.port, args.socket, args.poll)
+    except (FileNotFoundError, OSError) as e:
+        print_error(str(e))
+        return 1
+    return 0
+
+
+def register(sub, trace):
+    """Add the search, show, query, index and serve subcommands"""
+    p = sub.add_parser('search', help="Search skills by keyword")
+    p.add_argument('query', nargs='+')
+    p.add_argument('--limit', type=int, default=20, help="Maximum results (default: 20)")
+    p.set_defaults(handler=cmd_search)
+
+    p = sub.add_parser('show', help="Print one skill entry (decodes only that entry)")
+    p.add_argument('name')
+    p.set_defaults(handler=cmd_show)
+
+    p = sub.add_parser('query', help="Filter skills by category, tag, license, author, repo or name")
+    p.add_argument('filters', nargs='*', metavar='FIELD=VALUE',
+                   help="Clauses that must all match: field=a,b (any of), field!=a, globs like repo=acme/*")
+    p.add_argument('--format', choices=['table', 'json', 'names'], default='table', help="Output format (default: table)")
+    p.add_argument('--limit', type=int, default=50, help="Results per page, 0 for all (default: 50)")
+    p.add_argument('--offset', type=int, default=0, help="Results to skip (default: 0)")
+    p.add_argument('--index', type=Path, help="Index file (default: skills-index.bin next to the registry)")
+    p.set_defaults(handler=cmd_query)
+
+    p = sub.add_parser('index', help="Build or query the precomputed lookup index (skills-index.bin)")
+    p.add_argument('action', choices=['build', 'verify', 'get', 'names'])
+    p.add_argument('name', nargs='?', help="get: skill name")
+    p.add_argument('--index', type=Path, help="Index file (default: skills-index.bin next to the registry)")
+    p.add_argument('--category', help="names: filter by category")
+    p.add_argument('--tag', help="names: filter by tag")
+    p.add_argument('--repo', help="names: filter by source repository")
+    p.set_defaults(handler=cmd_index)
+
+    p = sub.add_parser('serve', help="Serve lookups, search and listings over a local HTTP API")
+    p.add_argument('--host', default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    p.add_argument('--port', type=int, default=8377, help="Port (default: 8377)")
+    p.add_argument('--socket', metavar='PATH', help="Listen on a Unix socket instead of TCP")
+    p.add_argument('--poll', type=float, default=1.0, help="Seconds between registry file checks (default: 1)")
+    p.set_defaults(handler=cmd_serve)
@@ -0,0 +1,104 @@
+"""Skill bundle and release archive commands: bundles, build-release, extract-release"""
+
+from pathlib import Path
+
+from . import run_traced
+from ..console import print_error
+from ..registry import ROOT_DIR
+
+
+def cmd_bundles(args) -> int:
+    from .. import bundles
+    from ..registry import load_registry
+
+    if args.action == 'status':
+        bundles.print_status(args.cache)
+        return 0
+
+    if args.action == 'install':
+        if len(args.names) != 1:
+            print_error("install needs exactly one skill name")
+            return 1
+        try:
+            target = bundles.install_skill(args.names[0], args.dest, args.cache, args.copy, args.force)
+        except bundles.BundleError as e:
+            print_error(str(e))
+            return 1
+        print(f"✅ Installed {args.names[0]} to {target}")
+        return 0
+
+    try:
+        registry = load_registry(args.registry)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+    return run_traced(args.trace, bundles.fetch_bundles, registry, args.names, args.cache, args.workers)
+
+
+def cmd_build_release(args) -> int:
+    from .. import release
+
+    try:
+        archive, manifest = run_traced(
+            args.trace, release.build_release, args.registry, args.output, args.compression,
+            args.cache if args.bundles else None, args.level,
+        )
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+    except release.ReleaseError as e:
+        print_error(str(e))
+        return 1
+
+    print(f"✅ Built {archive} ({release.format_size(archive.stat().st_size)})")
+    release.print_manifest(manifest)
+    print(f"   SHA-256: {release.read_checksum(str(archive))}")
+    return 0
+
+
+def cmd_extract_release(args) -> int:
+    from .. import release
+
+    expected = args.sha256 or release.read_checksum(args.archive)
+    try:
+        manifest = release.extract_release(args.archive, args.dest, expected)
+    except (OSError, release.ReleaseError) as e:
+        print_error(f"Cannot extract {args.archive}: {e}")
+        return 1
+
+    print(f"✅ Extracted release {manifest['version']} to {args.dest}"
+          + ("" if expected else " (archive checksum not verified)"))
+    release.print_manifest(manifest)
+    return 0
+
+
+def register(sub, trace):
+    """Add the bundles, build-release and extract-release subcommands"""
+    p = sub.add_parser('bundles', parents=[trace], help="Cache skill contents locally and install from the cache")
+    p.add_argument('action', choices=['fetch', 'install', 'status'])
+    p.add_argument('names', nargs='*', help="Skills to fetch (default: all) or the skill to install")
+    p.add_argument('--cache', type=Path, default=ROOT_DIR / ".skill-cache",
+                   help="Bundle cache directory (default: .skill-cache)")
+    p.add_argument('--workers', type=int, default=8, help="Skills fetched in parallel (default: 8)")
+    p.add_argument('--dest', type=Path, default=Path.home() / ".claude" / "skills",
+                   help="install: directory to install into (default: ~/.claude/skills)")
+    p.add_argument('--copy', action='store_true', help="install: copy files instead of hardlinking them")
+    p.add_argument('--force', action='store_true', help="install: replace an existing installation")
+    p.set_defaults(handler=cmd_bundles)
+
+    p = sub.add_parser('build-release', parents=[trace],
+                       help="Pack the registry and its indexes into one reproducible, checksummed archive")
+    p.add_argument('--output', type=Path, default=ROOT_DIR / "dist", help="Output directory (default: dist)")
+    p.add_argument('--compression', choices=['gzip', 'zstd'], default='gzip',
+                   help="Archive compression (default: gzip; zstd needs the zstandard package)")
+    p.add_argument('--level', type=int, help="Compression level")
+    p.add_argument('--bundles', action='store_true', help="Include the cached skill bundles of registry skills")
+    p.add_argument('--cache', type=Path, default=ROOT_DIR / ".skill-cache",
+                   help="Bundle cache directory (default: .skill-cache)")
+    p.set_defaults(handler=cmd_build_release)
+
+    p = sub.add_parser('extract-release', help="Unpack a release archive, verifying every file as it streams")
+    p.add_argument('archive', help="Archive file or URL")
+    p.add_argument('dest', nargs='?', type=Path, default=Path("."), help="Directory to extract into (default: .)")
+    p.add_argument('--sha256', help="Expected archive digest (default: the .sha256 file next to a local archive)")
+    p.set_defaults(handler=cmd_extract_release)
@@ -0,0 +1,77 @@
+"""Repository configuration and scanning commands: list, add-repo, toggle, scan, sync"""
+
+from pathlib import Path
+
+from . import load_config_or_exit, run_traced
+from ..registry import ROOT_DIR
+
+
+def cmd_list(args) -> int:
+    from ..repos import list_repositories
+
+    list_repositories(load_config_or_exit(args.config), args.config)
+    return 0
+
+
+def cmd_add_repo(args) -> int:
+    from ..repos import add_repository
+
+    add_repository(load_config_or_exit(args.config), args.config)
+    return 0
+
+
+def cmd_toggle(args) -> int:
+    from ..repos import toggle_repository
+
+    toggle_repository(load_config_or_exit(args.config), args.config)
+    return 0
+
+
+def cmd_scan(args) -> int:
+    from ..repos import scan_repositories
+
+    config = load_config_or_exit(args.config)
+    if args.bayes:
+        from ..classifier import require_numpy
+
+        require_numpy()
+    run_traced(args.trace, scan_repositories, config, args.config,
+               semantic=args.semantic, registry_path=args.registry, backend=args.backend,
+               workers=args.workers, bayes=args.bayes)
+    return 0
+
+
+def cmd_sync(args) -> int:
+    from ..sync import sync
+
+    config = load_config_or_exit(args.config)
+    return run_traced(args.trace, sync, config, args.registry, args.state, args.budget, args.force, args.dry_run)
+
+
+def register(sub, trace):
+    """Add the list, add-repo, toggle, scan and sync subcommands"""
+    p = sub.add_parser('list', help="List configured repositories")
+    p.set_defaults(handler=cmd_list)
+
+    p = sub.add_parser('add-repo', help="Add a repository to repositories.json")
+    p.set_defaults(handler=cmd_add_repo)
+
+    p = sub.add_parser('toggle', help="Enable or disable a configured repository")
+    p.set_defaults(handler=cmd_toggle)
+
+    p = sub.add_parser('scan', parents=[trace], help="Scan enabled repositories and import new skills")
+    p.add_argument('--semantic', action='store_true', help="Categorize new skills with the TF-IDF index")
+    p.add_argument('--bayes', action='store_true',
+                   help="Categorize new skills with a model learned from the registry's categories (needs NumPy)")
+    p.add_argument('--backend', choices=['rest', 'graphql'], default='rest',
+                   help="graphql batches many repositories per request, falling back to rest (default: rest)")
+    p.add_argument('--workers', type=int, default=8, help="Repositories scanned in parallel over REST (default: 8)")
+    p.set_defaults(handler=cmd_scan)
+
+    p = sub.add_parser('sync', parents=[trace], help="Scan the repositories whose refresh interval is due (for cron)")
+    p.add_argument('--budget', type=int, help="Maximum GitHub requests for this run (default: sync.budget or 300)")
+    p.add_argument('--force', action='store_true', help="Treat every enabled repository as due")
+    p.add_argument('--dry-run', action='store_true', help="Show the schedule without scanning")
+    p.add_argument('--state', type=Path, default=ROOT_DIR / ".sync-state.json",
+                   help="Last-run state file (default: .sync-state.json)")
+    p.set_defaults(handler=cmd_sync)
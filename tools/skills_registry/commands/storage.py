@@ -0,0 +1,113 @@
+"""Registry layout and distribution commands: shards, feed"""
+
+import json
+from pathlib import Path
+
+from ..console import print_error
+from ..registry import ROOT_DIR, REGISTRY_PATH
+
+
+def cmd_shards(args) -> int:
+    from .. import shards
+    from ..registry import load_registry, save_registry
+
+    if args.action == 'split':
+        output = args.output or ROOT_DIR / "skills" / "shards"
+        try:
+            registry = load_registry(args.registry)
+        except FileNotFoundError:
+            print_error("Registry file not found!")
+            return 1
+
+        shards.save_sharded(output, registry, args.by)
+        manifest = shards.read_manifest(output)
+        print(f"✅ Wrote {len(manifest['shards'])} shards ({len(registry['skills'])} skills, by {args.by}) to {output}")
+        return 0
+
+    if not shards.is_sharded(args.registry):
+        print_error("--registry must point to a shard directory or manifest.json")
+        return 1
+
+    if args.action == 'verify':
+        errors = shards.verify_shards(args.registry)
+        for error in errors:
+            print(f"   {error}")
+        print("✅ Shards match the manifest" if not errors else f"❌ {len(errors)} problem(s)")
+        return 1 if errors else 0
+
+    # merge: compatibility build of the single-file registry
+    output = args.output or REGISTRY_PATH
+    merged = shards.merge_shards(args.registry)
+    save_registry(output, merged)
+    print(f"✅ Merged {len(merged['skills'])} skills into {output}")
+    return 0
+
+
+def cmd_feed(args) -> int:
+    from .. import feed, shards
+    from ..registry import load_registry
+
+    try:
+        if args.action == 'init':
+            directory = feed.init_feed(args.registry, load_registry(args.registry))
+            print(f"✅ Feed started at version 0: {directory}")
+            return 0
+
+        if args.action == 'status':
+            directory = feed.feed_dir(args.registry)
+            index = feed.read_index(directory)
+            print(f"Feed: {directory}")
+            print(f"  Versions: {index['base']}..{index['latest']} (snapshot {index['snapshot']})")
+            print(f"  Updated: {index.get('updated') or 'never'}")
+            return 0
+
+        if args.action == 'compact':
+            base, removed = feed.compact(args.registry, args.keep)
+            print(f"✅ Feed base is now version {base} ({removed} patch files folded into the snapshot)")
+            return 0
+
+        # pull: update a consumer copy (args.registry) from a published feed
+        if not args.source:
+            print_error("pull needs a feed directory or URL")
+            return 1
+        if Path(args.registry).resolve() == REGISTRY_PATH.resolve() or feed.is_enabled(args.registry) \
+                or shards.is_sharded(args.registry):
+            print_error(f"pull replaces its registry file; pass the consumer copy with --registry "
+                        f"(not {args.registry})")
+            return 1
+
+        state_path = Path(str(args.registry) + ".feed")
+        try:
+            registry = load_registry(args.registry)
+            version = json.loads(state_path.read_text(encoding='utf-8'))['version']
+        except (FileNotFoundError, KeyError, ValueError):
+            registry, version = None, None
+
+        registry, version, applied = feed.pull(args.source, registry, version)
+        # Written directly: a consumer copy must not publish into a feed of its own
+        with open(args.registry, 'w', encoding='utf-8') as f:
+            json.dump(registry, f, indent=2, ensure_ascii=False)
+        state_path.write_text(json.dumps({'version': version}) + "\n", encoding='utf-8')
+        print(f"✅ {args.registry} is at feed version {version} ({applied} patches applied)")
+        return 0
+
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+    except feed.FeedError as e:
+        print_error(str(e))
+    return 1
+
+
+def register(sub, trace):
+    """Add the shards and feed subcommands"""
+    p = sub.add_parser('shards', help="Split the registry into shards, merge them back, or verify them")
+    p.add_argument('action', choices=['split', 'merge', 'verify'])
+    p.add_argument('--by', choices=['category', 'source'], default='category', help="Shard key for split (default: category)")
+    p.add_argument('--output', type=Path, help="split: shard directory (default: skills/shards); merge: registry file")
+    p.set_defaults(handler=cmd_shards)
+
+    p = sub.add_parser('feed', help="Publish registry changes as a versioned patch feed, or follow one")
+    p.add_argument('action', choices=['init', 'status', 'compact', 'pull'])
+    p.add_argument('source', nargs='?', help="pull: feed directory or base URL")
+    p.add_argument('--keep', type=int, default=50, help="compact: patches to keep (default: 50)")
+    p.set_defaults(handler=cmd_feed)
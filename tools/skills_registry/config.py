@@ -0,0 +1,55 @@
+"""
+Repository Configuration
+
+Load and save repositories.json and categorize skills by its keywords.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from .registry import ROOT_DIR
+
+CONFIG_PATH = ROOT_DIR / "repositories.json"
+
+
+def load_config(config_path: Path = CONFIG_PATH) -> dict:
+    """Load repository configuration (raises FileNotFoundError if missing)"""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_config(config_path: Path, config: dict):
+    """Save repository configuration"""
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+
+
+def enabled_repositories(config: dict) -> List[Dict]:
+    """Enabled repositories, in configuration order"""
+    return [r for r in config.get('repositories', []) if r.get('enabled', True)]
+
+
+def repository_refs(repo_config: Dict) -> List[Optional[str]]:
+    """
+    Branches/tags to scan for a configured repository
+
+    "branches": [...] scans several refs, "branch" one; None stands for the
+    repository's default branch.
+    """
+    refs = repo_config.get('branches') or [repo_config.get('branch')]
+    return [ref or None for ref in refs]
+
+
+def categorize_skill(skill_name: str, description: str, categories: dict) -> str:
+    """Auto-categorize a skill based on keywords"""
+    skill_lower = skill_name.lower()
+    desc_lower = description.lower()
+
+    for category, config in categories.items():
+        keywords = config.get('keywords', [])
+        for keyword in keywords:
+            if keyword.lower() in skill_lower or keyword.lower() in desc_lower:
+                return category
+
+    return "general"
@@ -0,0 +1,63 @@
+"""
+Console Output
+
+Terminal colors and the message helpers shared by all tools.
+"""
+
+import io
+import sys
+
+
+def setup_console():
+    """Fix Windows console encoding so emoji output does not crash"""
+    if sys.platform == 'win32' and getattr(sys.stdout, 'encoding', '').lower() != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+
+class Colors:
+    """Terminal colors"""
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    END = '\033[0m'
+    BOLD = '\033[1m'
+
+
+def print_header(text: str, width: int = 70):
+    """Print formatted header"""
+    print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * width}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(width)}{Colors.END}")
+    print(f"{Colors.HEADER}{Colors.BOLD}{'=' * width}{Colors.END}\n")
+
+
+def print_success(text: str):
+    """Print success message"""
+    print(f"{Colors.GREEN}✅ {text}{Colors.END}")
+
+
+def print_error(text: str):
+    """Print error message"""
+    print(f"{Colors.RED}❌ {text}{Colors.END}")
+
+
+def print_warning(text: str):
+    """Print warning message"""
+    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
+
+
+def print_info(text: str):
+    """Print info message"""
+    print(f"{Colors.CYAN}ℹ️  {text}{Colors.END}")
+
+
+def print_next_steps(commit_message: str):
+    """Print the usual validate/generate/commit/push reminder"""
+    print(f"{Colors.BOLD}Next steps:{Colors.END}")
+    print(f"  1. {Colors.CYAN}python tools/validate_registry.py{Colors.END}")
+    print(f"  2. {Colors.CYAN}python tools/generate_readme.py{Colors.END}")
+    print(f"  3. {Colors.CYAN}git add . && git commit -m '{commit_message}'{Colors.END}")
+    print(f"  4. {Colors.CYAN}git push{Colors.END}")
@@ -0,0 +1,170 @@
+"""
+Registry Diff
+
+Compare two versions of the registry skill by skill instead of line by
+line. A version is a registry file or shard directory, or a git revision
+("HEAD~1", "main", or "rev:path/to/registry.json"). Each entry is reduced
+to a digest of its canonical JSON, so formatting and key order don't
+matter and only entries whose digests differ are compared field by field:
+the diff is linear in the number of skills.
+
+    + new-skill (development, acme/skills)
+    - old-skill
+    ~ pdf
+        metadata.category: "document" -> "productivity"
+"""
+
+import json
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .console import Colors
+from .registry import ROOT_DIR, load_registry
+
+
+class VersionError(Exception):
+    """A registry version could not be loaded"""
+
+
+def load_version(spec: str, registry_path: Path) -> dict:
+    """
+    Load a registry version: an existing path, or a git revision with an
+    optional ":path" (default: registry_path at that revision)
+
+    Raises:
+        VersionError: Neither a readable registry nor a git revision
+    """
+    path = Path(spec)
+    if path.exists():
+        try:
+            return load_registry(path)
+        except (OSError, ValueError) as e:
+            raise VersionError(f"{spec}: {e}")
+
+    rev, _, file = spec.partition(':')
+    if not file:
+        try:
+            file = Path(registry_path).resolve().relative_to(ROOT_DIR).as_posix()
+        except ValueError:
+            raise VersionError(f"{spec}: not a file, and {registry_path} is outside the repository")
+
+    try:
+        result = subprocess.run(['git', 'show', f"{rev}:{file}"], cwd=ROOT_DIR, capture_output=True)
+    except OSError as e:
+        raise VersionError(f"{spec}: cannot run git: {e}")
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise VersionError(f"{spec}: {message[-1] if message else 'not a file or git revision'}")
+    try:
+        return json.loads(result.stdout)
+    except ValueError as e:
+        raise VersionError(f"{spec}: {e}")
+
+
+_CANONICAL = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def entry_digest(entry) -> bytes:
+    """Digest of an entry's canonical JSON"""
+    return hashlib.sha1(_CANONICAL.encode(entry).encode('utf-8')).digest()
+
+
+def _flatten(value, prefix: str = "") -> Dict[str, object]:
+    """Dotted field paths of nested objects; lists and scalars are leaves"""
+    if isinstance(value, dict) and value:
+        fields = {}
+        for key, item in value.items():
+            fields.update(_flatten(item, f"{prefix}.{key}" if prefix else key))
+        return fields
+    return {prefix: value}
+
+
+def field_changes(old, new) -> Dict[str, Tuple[object, object]]:
+    """Changed fields of two entries as {path: (old, new)}; a missing side is None"""
+    old_fields, new_fields = _flatten(old), _flatten(new)
+    changes = {}
+    for path in sorted(set(old_fields) | set(new_fields)):
+        before, after = old_fields.get(path), new_fields.get(path)
+        if before != after or (path in old_fields) != (path in new_fields):
+            changes[path] = (before, after)
+    return changes
+
+
+def diff_registries(old: dict, new: dict) -> Dict:
+    """
+    Skill-level differences between two registries
+
+    Returns:
+        {'added': {name: entry}, 'removed': {name: entry},
+         'changed': {name: {field: (old, new)}}, 'root': {field: (old, new)},
+         'unchanged': count}
+    """
+    old_skills, new_skills = old.get('skills', {}), new.get('skills', {})
+    old_digests = {name: entry_digest(entry) for name, entry in old_skills.items()}
+    new_digests = {name: entry_digest(entry) for name, entry in new_skills.items()}
+
+    changed = {
+        name: field_changes(old_skills[name], new_skills[name])
+        for name in sorted(old_digests.keys() & new_digests.keys())
+        if old_digests[name] != new_digests[name]
+    }
+    old_root = {k: v for k, v in old.items() if k != 'skills'}
+    new_root = {k: v for k, v in new.items() if k != 'skills'}
+
+    return {
+        'added': {name: new_skills[name] for name in sorted(new_digests.keys() - old_digests.keys())},
+        'removed': {name: old_skills[name] for name in sorted(old_digests.keys() - new_digests.keys())},
+        'changed': changed,
+        'root': field_changes(old_root, new_root),
+        'unchanged': len(old_digests.keys() & new_digests.keys()) - len(changed),
+    }
+
+
+def has_changes(diff: Dict) -> bool:
+    return bool(diff['added'] or diff['removed'] or diff['changed'] or diff['root'])
+
+
+def _value(value) -> str:
+    return "(none)" if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def format_text(diff: Dict, root: bool = False) -> List[str]:
+    """Lines of the human-readable diff (top-level fields only with root=True)"""
+    lines = []
+    for name, entry in diff['added'].items():
+        metadata = entry.get('metadata') or {}
+        source = entry.get('source') or {}
+        details = ", ".join(str(v) for v in (metadata.get('category'), source.get('repo')) if v)
+        lines.append(f"{Colors.GREEN}+ {name}{Colors.END}" + (f" ({details})" if details else ""))
+    for name in diff['removed']:
+        lines.append(f"{Colors.RED}- {name}{Colors.END}")
+    for name, changes in diff['changed'].items():
+        lines.append(f"{Colors.YELLOW}~ {name}{Colors.END}")
+        for field, (before, after) in changes.items():
+            lines.append(f"    {field}: {_value(before)} -> {_value(after)}")
+    if root:
+        for field, (before, after) in diff['root'].items():
+            lines.append(f"{Colors.BLUE}* {field}{Colors.END}: {_value(before)} -> {_value(after)}")
+
+    lines.append(f"{len(diff['added'])} added, {len(diff['removed'])} removed, "
+                 f"{len(diff['changed'])} changed, {diff['unchanged']} unchanged"
+                 + (f", {len(diff['root'])} top-level field(s) changed" if diff['root'] else ""))
+    return lines
+
+
+def to_json(diff: Dict, old_label: str, new_label: str) -> Dict:
+    """JSON-serializable form of a diff"""
+    def pairs(changes):
+        return {field: {'old': before, 'new': after} for field, (before, after) in changes.items()}
+
+    return {
+        'old': old_label,
+        'new': new_label,
+        'added': diff['added'],
+        'removed': sorted(diff['removed']),
+        'changed': {name: pairs(changes) for name, changes in diff['changed'].items()},
+        'root': pairs(diff['root']),
+        'unchanged': diff['unchanged'],
+    }
@@ -0,0 +1,346 @@
+"""
+Registry Delta Feed
+
+Versioned changelog of registry edits for downstream consumers. Once a feed
+is initialized next to the registry, every save_registry() appends one
+numbered JSON Patch (RFC 6902) file with the changes of that save:
+
+    skills/feed/
+        index.json              {"format", "base", "latest", "snapshot", "updated"}
+        snapshot-000000.json    {"version": 0, "registry": {...}}
+        000001.json             {"version": 1, "previous": 0, "created", "ops": [...]}
+        000002.json
+        ...
+
+A consumer holding version N fetches index.json and the patches N+1..latest
+and applies them in order. Versions older than the base are compacted away;
+such consumers start over from the snapshot.
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from . import shards
+
+FEED_DIR = "feed"
+INDEX_NAME = "index.json"
+FEED_FORMAT = 1
+DEFAULT_KEEP = 50
+
+
+class FeedError(Exception):
+    """A feed cannot be read or a patch cannot be applied"""
+
+
+def feed_dir(registry_path: Path) -> Path:
+    """Feed directory of a registry file or shard directory"""
+    registry_path = Path(registry_path)
+    if shards.is_sharded(registry_path):
+        return shards.shard_dir(registry_path) / FEED_DIR
+    return registry_path.parent / FEED_DIR
+
+
+def patch_name(version: int) -> str:
+    return f"{version:06d}.json"
+
+
+def snapshot_name(version: int) -> str:
+    return f"snapshot-{version:06d}.json"
+
+
+def pointer(*parts: str) -> str:
+    """JSON Pointer for a path ("a/b" -> "/a~1b")"""
+    return ''.join('/' + p.replace('~', '~0').replace('/', '~1') for p in parts)
+
+
+def unpointer(path: str) -> List[str]:
+    if not path.startswith('/'):
+        raise FeedError(f"Invalid JSON pointer: {path!r}")
+    return [p.replace('~1', '/').replace('~0', '~') for p in path[1:].split('/')]
+
+
+def _write_json(path: Path, data):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp.replace(path)
+
+
+def _read_json(path: Path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def is_enabled(registry_path: Path) -> bool:
+    return (feed_dir(registry_path) / INDEX_NAME).exists()
+
+
+def read_index(directory: Path) -> dict:
+    try:
+        return _read_json(Path(directory) / INDEX_NAME)
+    except FileNotFoundError:
+        raise FeedError(f"No feed at {directory} (run 'skills.py feed init')")
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+def diff_ops(old_root: dict, old_skills: Dict[str, dict],
+             new_root: dict, new_skills: Dict[str, dict]) -> List[dict]:
+    """JSON Patch turning (old_root, old_skills) into (new_root, new_skills)"""
+    ops = []
+
+    for key in old_root:
+        if key not in new_root:
+            ops.append({'op': 'remove', 'path': pointer(key)})
+    for key, value in new_root.items():
+        if key not in old_root:
+            ops.append({'op': 'add', 'path': pointer(key), 'value': value})
+        elif old_root[key] != value:
+            ops.extend(_field_ops(key, old_root[key], value))
+
+    for name in sorted(old_skills):
+        if name not in new_skills:
+            ops.append({'op': 'remove', 'path': pointer('skills', name)})
+    for name in sorted(new_skills):
+        if name not in old_skills:
+            ops.append({'op': 'add', 'path': pointer('skills', name), 'value': new_skills[name]})
+        elif old_skills[name] != new_skills[name]:
+            ops.append({'op': 'replace', 'path': pointer('skills', name), 'value': new_skills[name]})
+
+    return ops
+
+
+def _field_ops(field: str, old, new) -> List[dict]:
+    """Ops for a changed root field: per key of an object (categories), per position of an array (sources)"""
+    ops = []
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': pointer(field, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({'op': 'add', 'path': pointer(field, key), 'value': value})
+            elif old[key] != value:
+                ops.append({'op': 'replace', 'path': pointer(field, key), 'value': value})
+    elif isinstance(old, list) and isinstance(new, list):
+        for i, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                ops.append({'op': 'replace', 'path': pointer(field, str(i)), 'value': after})
+        for value in new[len(old):]:
+            ops.append({'op': 'add', 'path': pointer(field, '-'), 'value': value})
+        for i in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({'op': 'remove', 'path': pointer(field, str(i))})
+    else:
+        ops.append({'op': 'replace', 'path': pointer(field), 'value': new})
+    return ops
+
+
+def _root(registry: dict) -> dict:
+    return {k: v for k, v in registry.items() if k != 'skills'}
+
+
+def pending_ops(registry_path: Path, registry: dict) -> List[dict]:
+    """
+    Changes that saving registry to registry_path is about to make
+
+    A registry loaded from registry_path only compares the skills in its
+    journal (see stats.Registry), a sharded one otherwise its dirty shards;
+    anything else is compared against the file on disk.
+    """
+    from .stats import Registry
+
+    skills = registry.get('skills', {})
+
+    if isinstance(registry, Registry) and registry.path == Path(registry_path).resolve():
+        old_skills = {name: entry for name, entry in registry.changes.items() if entry is not None}
+        new_skills = {name: skills[name] for name in registry.changes if name in skills}
+        return diff_ops(registry.saved_root, old_skills, _root(registry), new_skills)
+
+    if isinstance(skills, shards.ShardedSkills) and shards.is_sharded(registry_path):
+        old_skills, new_skills = {}, {}
+        for key in skills.dirty:
+            info = skills.shards.get(key)
+            if info is not None:
+                old_skills.update(_read_json(skills.directory / info['file']).get('skills', {}))
+            new_skills.update(skills.load_shard(key))
+        old_root = _root(shards.load_sharded(registry_path))
+        return diff_ops(old_root, old_skills, _root(registry), new_skills)
+
+    try:
+        from .registry import load_registry
+        old = load_registry(registry_path)
+    except FileNotFoundError:
+        old = {}
+    return diff_ops(_root(old), dict(old.get('skills', {}).items()),
+                    _root(registry), dict(skills.items()))
+
+
+def append(registry_path: Path, ops: List[dict]) -> Optional[int]:
+    """Write ops as the next patch; returns its version (None when empty)"""
+    if not ops:
+        return None
+
+    directory = feed_dir(registry_path)
+    index = read_index(directory)
+    version = index['latest'] + 1
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    _write_json(directory / patch_name(version), {
+        'version': version,
+        'previous': index['latest'],
+        'created': now,
+        'ops': ops,
+    })
+    # index.json is written last: consumers never see a version without its patch
+    index.update(latest=version, updated=now)
+    _write_json(directory / INDEX_NAME, index)
+    return version
+
+
+def init_feed(registry_path: Path, registry: dict) -> Path:
+    """Start a feed at version 0 with a snapshot of the current registry"""
+    directory = feed_dir(registry_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    if (directory / INDEX_NAME).exists():
+        raise FeedError(f"Feed already exists: {directory}")
+
+    snapshot = dict(registry, skills=dict(registry.get('skills', {}).items()))
+    _write_json(directory / snapshot_name(0), {'version': 0, 'registry': snapshot})
+    _write_json(directory / INDEX_NAME, {
+        'format': FEED_FORMAT,
+        'base': 0,
+        'latest': 0,
+        'snapshot': snapshot_name(0),
+        'updated': registry.get('last_updated'),
+    })
+    return directory
+
+
+def compact(registry_path: Path, keep: int = DEFAULT_KEEP) -> Tuple[int, int]:
+    """
+    Fold all but the last `keep` patches into a new snapshot
+
+    Returns:
+        (new base version, number of patch files removed)
+    """
+    directory = feed_dir(registry_path)
+    index = read_index(directory)
+    new_base = max(index['latest'] - keep, index['base'])
+    if new_base == index['base']:
+        return index['base'], 0
+
+    snapshot = _read_json(directory / index['snapshot'])['registry']
+    for version in range(index['base'] + 1, new_base + 1):
+        apply_ops(snapshot, _read_json(directory / patch_name(version))['ops'])
+
+    old_snapshot = index['snapshot']
+    _write_json(directory / snapshot_name(new_base), {'version': new_base, 'registry': snapshot})
+    index.update(base=new_base, snapshot=snapshot_name(new_base))
+    _write_json(directory / INDEX_NAME, index)
+
+    if old_snapshot != index['snapshot']:
+        (directory / old_snapshot).unlink(missing_ok=True)
+    removed = 0
+    for version in range(1, new_base + 1):
+        path = directory / patch_name(version)
+        if path.exists():
+            path.unlink()
+            removed += 1
+    return new_base, removed
+
+
+# ---------------------------------------------------------------------------
+# Consuming
+# ---------------------------------------------------------------------------
+
+def apply_ops(registry: dict, ops: List[dict]) -> dict:
+    """Apply a registry patch in place (add/replace/remove on root fields, their keys or positions, and skills)"""
+    for op in ops:
+        parts = unpointer(op['path'])
+        parent = registry
+        for part in parts[:-1]:
+            parent = parent[_position(parent, part, op)] if isinstance(parent, list) else parent.setdefault(part, {})
+        key = parts[-1]
+
+        if isinstance(parent, list):
+            if op['op'] == 'add':
+                parent.insert(len(parent) if key == '-' else _position(parent, key, op, end=True), op['value'])
+            elif op['op'] == 'replace':
+                parent[_position(parent, key, op)] = op['value']
+            elif op['op'] == 'remove':
+                del parent[_position(parent, key, op)]
+            else:
+                raise FeedError(f"Unsupported patch op: {op['op']}")
+        elif op['op'] in ('add', 'replace'):
+            parent[key] = op['value']
+        elif op['op'] == 'remove':
+            if key not in parent:
+                raise FeedError(f"Cannot remove missing {op['path']}")
+            del parent[key]
+        else:
+            raise FeedError(f"Unsupported patch op: {op['op']}")
+    return registry
+
+
+def _position(array: list, part: str, op: dict, end: bool = False) -> int:
+    """Array index of a pointer part (end allows the position just past the last item)"""
+    if not part.isdigit() or int(part) > len(array) - (0 if end else 1):
+        raise FeedError(f"Invalid array position in {op['path']}")
+    return int(part)
+
+
+def _reader(source: str):
+    """Return a function that loads a feed file from a directory or base URL"""
+    if source.startswith(('http://', 'https://')):
+        from .github import get_session, REQUEST_TIMEOUT
+
+        session = get_session()
+        base = source.rstrip('/') + '/'
+
+        def read(name: str):
+            response = session.get(base + name, timeout=REQUEST_TIMEOUT)
+            if response.status_code != 200:
+                raise FeedError(f"{base + name}: HTTP {response.status_code}")
+            return response.json()
+        return read
+
+    directory = Path(source)
+
+    def read(name: str):
+        try:
+            return _read_json(directory / name)
+        except FileNotFoundError:
+            raise FeedError(f"Missing feed file: {directory / name}")
+    return read
+
+
+def pull(source: str, registry: Optional[dict], version: Optional[int]) -> Tuple[dict, int, int]:
+    """
+    Bring a consumer copy up to date from a feed
+
+    Args:
+        source: Feed directory or base URL
+        registry: Local copy (None to start from the snapshot)
+        version: Feed version of the local copy
+
+    Returns:
+        (registry, new version, number of patches applied)
+    """
+    read = _reader(source)
+    index = read(INDEX_NAME)
+
+    if registry is None or version is None or version < index['base']:
+        snapshot = read(index['snapshot'])
+        registry, version = snapshot['registry'], snapshot['version']
+    elif version > index['latest']:
+        raise FeedError(f"Local version {version} is ahead of the feed ({index['latest']})")
+
+    applied = 0
+    for v in range(version + 1, index['latest'] + 1):
+        apply_ops(registry, read(patch_name(v))['ops'])
+        applied += 1
+    return registry, index['latest'], applied
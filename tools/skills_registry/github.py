@@ -0,0 +1,379 @@
+"""
+GitHub Scanner
+
+Discover skills (any directory containing a SKILL.md) through the git
+trees API. Default branches and tree listings are cached (repo_cache.py),
+so an unchanged tree is fetched once across branches, tags and runs.
+Scans are generators, so callers can show results as they are found.
+`requests` is imported on first use so commands that never touch the
+network do not pay for it.
+"""
+
+import os
+import time
+import queue
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple, Union
+
+from . import tracing
+from .console import print_error
+from .repo_cache import CACHE_PATH, RepoCache
+
+# Override to point the tools at a GitHub API mirror or mock server
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+
+REQUEST_TIMEOUT = 10
+
+DEFAULT_SEARCH_PATHS = ("skills", "")
+
+DEFAULT_WORKERS = 8
+STREAM_BUFFER = 256
+
+_local = threading.local()
+_cache = None
+_cache_lock = threading.Lock()
+_request_count = 0
+_count_lock = threading.Lock()
+
+
+class GitHubError(Exception):
+    """A GitHub request failed (raised only in strict mode)"""
+
+
+def get_session():
+    """HTTP session of the current thread (imports requests lazily)"""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        import requests
+
+        session = requests.Session()
+        session.headers['Accept'] = 'application/vnd.github+json'
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            session.headers['Authorization'] = f"Bearer {token}"
+        _local.session = session
+    return session
+
+
+def count_request():
+    """Count one API request against request_count()"""
+    global _request_count
+    with _count_lock:
+        _request_count += 1
+
+
+def request_count() -> int:
+    """GitHub API requests made by this process so far"""
+    with _count_lock:
+        return _request_count
+
+
+def get_cache() -> RepoCache:
+    """Scanner cache, loaded on first use and saved at exit"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RepoCache.load(CACHE_PATH)
+            atexit.register(_cache.save)
+        return _cache
+
+
+def set_cache(cache: RepoCache):
+    """Use another cache (e.g. RepoCache(None) for an in-memory one)"""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def github_get(url: str, repo: str, strict: bool = False) -> Optional[Union[list, dict]]:
+    """
+    GET a GitHub API URL
+
+    Returns:
+        Decoded JSON; None for missing objects (404, or 422 for an unknown
+        commit) and failed requests. With strict=True, other failures raise
+        GitHubError instead.
+    """
+    count_request()
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    except Exception as e:
+        tracing.record_request(url, start, repo=repo, error=str(e))
+        if strict:
+            raise GitHubError(f"Request failed: {e}")
+        print_error(f"Request failed: {e}")
+        return None
+
+    tracing.record_request(url, start, response, repo=repo)
+    if response.status_code == 200:
+        return response.json()
+    if response.status_code not in (404, 422):
+        if strict:
+            raise GitHubError(f"GitHub API error: {response.status_code} ({url})")
+        print_error(f"GitHub API error: {response.status_code} ({url})")
+    return None
+
+
+def fetch_github_contents(repo: str, path: str = "", branch: str = "main",
+                          strict: bool = False) -> Optional[Union[list, dict]]:
+    """
+    Fetch repository contents from GitHub API
+
+    Returns:
+        Directory listing (list) or file object (dict); None when the path
+        does not exist or the request failed
+    """
+    return github_get(f"{GITHUB_API_URL}/repos/{repo}/contents/{path}?ref={branch}", repo, strict)
+
+
+def resolve_default_branch(repo: str, strict: bool = False) -> Optional[str]:
+    """Default branch of a repository (cached for a day), None if it doesn't exist"""
+    cache = get_cache()
+    branch = cache.default_branch(repo)
+    if branch:
+        tracing.record_cache_hit(f"repos/{repo}", repo)
+        return branch
+
+    data = github_get(f"{GITHUB_API_URL}/repos/{repo}", repo, strict)
+    if isinstance(data, dict) and data.get('default_branch'):
+        cache.set_metadata(repo, data['default_branch'])
+        return data['default_branch']
+    return None
+
+
+def get_tree(repo: str, ref: str, recursive: bool = False,
+             strict: bool = False) -> Optional[List[List[str]]]:
+    """
+    Listing of a git tree as [name, type, sha] entries
+
+    ref is a branch, tag or tree sha. Tree shas are served from the cache;
+    a recursive fetch caches the listing of every tree it contains.
+    """
+    cache = get_cache()
+    listing = cache.tree(ref)
+    if listing is not None:
+        tracing.record_cache_hit(f"repos/{repo}/git/trees/{ref}", repo)
+        return listing
+
+    url = f"{GITHUB_API_URL}/repos/{repo}/git/trees/{ref}" + ("?recursive=1" if recursive else "")
+    data = github_get(url, repo, strict)
+    if not isinstance(data, dict) or 'sha' not in data:
+        return None
+
+    if recursive and not data.get('truncated'):
+        cache.add_recursive_tree(data['sha'], data['tree'])
+    else:
+        cache.add_tree(data['sha'], [e for e in data['tree'] if '/' not in e['path']])
+    return cache.tree(data['sha'])
+
+
+def resolve_commit(repo: str, ref: str, strict: bool = False) -> Optional[Tuple[str, str]]:
+    """(commit sha, root tree sha) a branch, tag or commit currently points to"""
+    data = github_get(f"{GITHUB_API_URL}/repos/{repo}/commits/{ref}", repo, strict)
+    if not isinstance(data, dict) or 'sha' not in data:
+        return None
+    return data['sha'], data['commit']['tree']['sha']
+
+
+def tree_sha_at(repo: str, root: str, path: str, strict: bool = False) -> Optional[str]:
+    """Sha of the tree at `path` below the tree `root` (None if there is none)"""
+    sha = root
+    for part in [p for p in path.split('/') if p]:
+        listing = get_tree(repo, sha, strict=strict)
+        sha = next((s for name, kind, s in listing or () if name == part and kind == 'tree'), None)
+        if sha is None:
+            return None
+    return sha
+
+
+def fetch_blob(repo: str, sha: str, strict: bool = False) -> Optional[bytes]:
+    """Content of a git blob"""
+    import base64
+
+    data = github_get(f"{GITHUB_API_URL}/repos/{repo}/git/blobs/{sha}", repo, strict)
+    if not isinstance(data, dict) or 'content' not in data:
+        return None
+    if data.get('encoding') == 'base64':
+        return base64.b64decode(data['content'])
+    return data['content'].encode('utf-8')
+
+
+def skill_description(text: str) -> Optional[str]:
+    """The description: field of a SKILL.md front matter block"""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != '---':
+        return None
+    for i, line in enumerate(lines[1:], 1):
+        if line.strip() == '---':
+            return None
+        key, _, value = line.partition(':')
+        if key.strip() != 'description':
+            continue
+        value = value.strip()
+        if value in ('', '>', '|', '>-', '|-'):
+            # Block scalar: the indented lines that follow
+            block = []
+            for more in lines[i + 1:]:
+                if more.strip() == '---' or (more and not more[0].isspace()):
+                    break
+                block.append(more.strip())
+            value = ' '.join(b for b in block if b)
+        elif value[0] == value[-1] and value[0] in '"\'' and len(value) > 1:
+            value = value[1:-1]
+        return value or None
+    return None
+
+
+def fetch_skill_description(repo: str, tree: str, strict: bool = False) -> Optional[str]:
+    """Description from the SKILL.md of a skill directory (by its tree sha)"""
+    listing = get_tree(repo, tree, strict=strict)
+    sha = next((sha for name, kind, sha in listing or () if name.lower() == 'skill.md' and kind == 'blob'), None)
+    content = fetch_blob(repo, sha, strict) if sha else None
+    return skill_description(content.decode('utf-8', 'replace')) if content else None
+
+
+def iter_skills_in_repo(repo: str, branch: Optional[str] = None,
+                        search_paths: Sequence[str] = DEFAULT_SEARCH_PATHS,
+                        strict: bool = False) -> Iterator[Dict]:
+    """
+    Yield the skills of a repository as each skill directory is confirmed
+
+    Args:
+        repo: owner/repo
+        branch: Branch, tag or commit to scan (None: the repository's default branch)
+
+    Yields:
+        {'name', 'path', 'repo', 'branch', 'commit', 'tree'} for each
+        directory holding a SKILL.md, with the commit scanned and the
+        directory's tree sha (strict=True raises GitHubError rather than
+        skipping failed requests)
+    """
+    with tracing.span(repo, category='repo', branch=branch):
+        ref = branch or resolve_default_branch(repo, strict)
+        if ref is None:
+            return
+
+        with tracing.span('list', repo=repo, path=''):
+            resolved = resolve_commit(repo, ref, strict)
+            root = get_tree(repo, resolved[1], strict=strict) if resolved else None
+        if root is None:
+            return
+        commit = resolved[0]
+
+        for search_path in search_paths:
+            base = root
+            for part in [p for p in search_path.split('/') if p]:
+                sha = next((sha for name, kind, sha in base if name == part and kind == 'tree'), None)
+                if sha is None:
+                    base = None
+                    break
+                with tracing.span('list', repo=repo, path=search_path):
+                    base = get_tree(repo, sha, recursive=True, strict=strict)
+                if base is None:
+                    break
+            if base is None:
+                continue
+
+            for name, kind, sha in base:
+                if kind != 'tree':
+                    continue
+
+                path = f"{search_path.strip('/')}/{name}" if search_path.strip('/') else name
+                with tracing.span('inspect', repo=repo, path=path):
+                    listing = get_tree(repo, sha, strict=strict)
+                if listing and any(n.lower() == 'skill.md' and k == 'blob' for n, k, _ in listing):
+                    yield {
+                        'name': name,
+                        'path': path,
+                        'repo': repo,
+                        'branch': ref,
+                        'commit': commit,
+                        'tree': sha,
+                    }
+
+
+def find_skills_in_repo(repo: str, branch: Optional[str] = None,
+                        search_paths: Sequence[str] = DEFAULT_SEARCH_PATHS,
+                        strict: bool = False) -> List[Dict]:
+    """All skills of a repository (see iter_skills_in_repo)"""
+    return list(iter_skills_in_repo(repo, branch, search_paths, strict))
+
+
+def iter_skills_in_refs(repo: str, refs: Sequence[Optional[str]],
+                        search_paths: Sequence[str] = DEFAULT_SEARCH_PATHS,
+                        strict: bool = False) -> Iterator[Dict]:
+    """
+    Yield the skills of several branches or tags of a repository
+
+    Trees shared between refs are fetched once. A skill present on several
+    refs is reported for the first ref that has it.
+    """
+    seen = set()
+    for ref in refs or [None]:
+        for skill in iter_skills_in_repo(repo, ref, search_paths, strict):
+            if skill['name'] not in seen:
+                seen.add(skill['name'])
+                yield skill
+
+
+def find_skills_in_refs(repo: str, refs: Sequence[Optional[str]],
+                        search_paths: Sequence[str] = DEFAULT_SEARCH_PATHS,
+                        strict: bool = False) -> List[Dict]:
+    """All skills of several refs of a repository (see iter_skills_in_refs)"""
+    return list(iter_skills_in_refs(repo, refs, search_paths, strict))
+
+
+def stream_skills(targets: Sequence[Tuple[str, Sequence[Optional[str]]]], workers: int = DEFAULT_WORKERS,
+                  search_paths: Sequence[str] = DEFAULT_SEARCH_PATHS) -> Iterator[Tuple[str, Union[Dict, Exception, None]]]:
+    """
+    Scan repositories concurrently and yield results as they are found
+
+    Args:
+        targets: (owner/repo, refs) pairs; a ref of None is the default branch
+        workers: Repositories scanned at the same time
+
+    Yields:
+        (repo, skill) for every skill, in discovery order, then (repo, None)
+        once a repository is finished, or (repo, exception) if its scan
+        failed. Only a bounded number of results is buffered; closing the
+        generator stops the workers.
+    """
+    results = queue.Queue(maxsize=STREAM_BUFFER)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan(repo: str, refs: Sequence[Optional[str]]):
+        try:
+            for skill in iter_skills_in_refs(repo, refs, search_paths):
+                if not put((repo, skill)):
+                    return
+        except Exception as e:
+            put((repo, e))
+        else:
+            put((repo, None))
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    futures = [pool.submit(scan, repo, refs) for repo, refs in targets]
+    remaining = len(futures)
+    try:
+        while remaining:
+            repo, skill = results.get()
+            if skill is None or isinstance(skill, Exception):
+                remaining -= 1
+            yield repo, skill
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
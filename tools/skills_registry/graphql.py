@@ -0,0 +1,230 @@
+"""
+GitHub GraphQL Scanner
+
+Batch backend for the scanner: one query covers up to GRAPHQL_BATCH_SIZE
+repository/ref pairs. Each pair gets an alias that fetches the default
+branch, its head commit and the entries of every search path two levels
+deep (enough to spot SKILL.md) at once. The tree listings it returns go
+into the same cache as the REST scanner's.
+
+api.github.com only serves GraphQL to authenticated clients; without
+GITHUB_TOKEN, or once the endpoint has failed, scans fall back to the REST
+scanner in github.py.
+"""
+
+import os
+import json
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import github, tracing
+from .console import print_warning
+
+GRAPHQL_BATCH_SIZE = 20
+
+PUBLIC_API_URL = "https://api.github.com"
+
+TREE_FRAGMENT = """
+fragment SkillDirs on Tree {
+  oid
+  entries { name type oid object { ... on Tree { entries { name type oid } } } }
+}"""
+
+_unavailable = None
+
+
+def graphql_url() -> str:
+    return f"{github.GITHUB_API_URL}/graphql"
+
+
+def is_available() -> bool:
+    """Whether scans should try GraphQL (a token is needed on api.github.com)"""
+    if _unavailable:
+        return False
+    return bool(os.environ.get('GITHUB_TOKEN')) or github.GITHUB_API_URL != PUBLIC_API_URL
+
+
+def _literal(value: str) -> str:
+    return json.dumps(value)
+
+
+def build_query(targets: Sequence[Tuple[str, Optional[str]]],
+                search_paths: Sequence[str] = github.DEFAULT_SEARCH_PATHS) -> str:
+    """
+    One query for several (repo, ref) pairs, aliased r0, r1, ...
+
+    Inside each repository c is the commit scanned and p0, p1, ... are the
+    search paths; a ref of None reads the default branch (HEAD).
+    """
+    blocks = []
+    for i, (repo, ref) in enumerate(targets):
+        owner, name = repo.split('/', 1)
+        objects = "\n".join(
+            f"    p{j}: object(expression: {_literal((ref or 'HEAD') + ':' + path.strip('/'))}) {{ ...SkillDirs }}"
+            for j, path in enumerate(search_paths)
+        )
+        blocks.append(
+            f"  r{i}: repository(owner: {_literal(owner)}, name: {_literal(name)}) {{\n"
+            f"    defaultBranchRef {{ name target {{ oid }} }}\n"
+            f"    c: object(expression: {_literal(ref or 'HEAD')}) {{ oid }}\n"
+            f"{objects}\n"
+            f"  }}"
+        )
+    return "query {\n" + "\n".join(blocks) + "\n}" + TREE_FRAGMENT
+
+
+def _post(query: str, count: int) -> Optional[dict]:
+    """POST a query; None (and GraphQL marked unavailable) if the endpoint fails"""
+    global _unavailable
+
+    url = graphql_url()
+    github.count_request()
+    start = time.perf_counter()
+    try:
+        response = github.get_session().post(url, json={'query': query}, timeout=github.REQUEST_TIMEOUT)
+    except Exception as e:
+        tracing.record_request(url, start, repo=f"{count} repositories", error=str(e))
+        _unavailable = f"request failed: {e}"
+        return None
+
+    tracing.record_request(url, start, response, repo=f"{count} repositories")
+    try:
+        payload = response.json() if response.status_code == 200 else None
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict) or not isinstance(payload.get('data'), dict):
+        _unavailable = f"HTTP {response.status_code}"
+        if isinstance(payload, dict) and payload.get('errors'):
+            _unavailable = payload['errors'][0].get('message', _unavailable)
+        return None
+    return payload
+
+
+def _cache_tree(cache, tree: dict):
+    """Store a SkillDirs result and the listings of its subdirectories"""
+    entries = tree.get('entries') or []
+    cache.add_tree(tree['oid'], [{'path': e['name'], 'type': e['type'], 'sha': e['oid']} for e in entries])
+    for entry in entries:
+        listing = (entry.get('object') or {}).get('entries')
+        if entry['type'] == 'tree' and listing is not None:
+            cache.add_tree(entry['oid'], [{'path': e['name'], 'type': e['type'], 'sha': e['oid']} for e in listing])
+
+
+def parse_repository(data: dict, repo: str, ref: Optional[str],
+                     search_paths: Sequence[str] = github.DEFAULT_SEARCH_PATHS) -> List[Dict]:
+    """Skills in one aliased repository result, caching what it lists"""
+    cache = github.get_cache()
+    default = data.get('defaultBranchRef')
+    if default:
+        cache.set_metadata(repo, default['name'])
+
+    branch = ref or (default and default['name'])
+    commit = (data.get('c') or {}).get('oid')
+    skills = []
+    if not branch:
+        return skills
+
+    for j, search_path in enumerate(search_paths):
+        tree = data.get(f"p{j}")
+        if not tree or 'entries' not in tree:
+            continue
+        _cache_tree(cache, tree)
+
+        base = search_path.strip('/')
+        for entry in tree['entries']:
+            listing = (entry.get('object') or {}).get('entries') or []
+            if entry['type'] == 'tree' and any(e['name'].lower() == 'skill.md' and e['type'] == 'blob' for e in listing):
+                skills.append({
+                    'name': entry['name'],
+                    'path': f"{base}/{entry['name']}" if base else entry['name'],
+                    'repo': repo,
+                    'branch': branch,
+                    'commit': commit,
+                    'tree': entry['oid'],
+                })
+    return skills
+
+
+def _batches(targets: Sequence[Tuple[str, Sequence[Optional[str]]]], batch_size: int) -> Iterator[List]:
+    """Group repositories so no batch has more than batch_size (repo, ref) pairs"""
+    batch, size = [], 0
+    for repo, refs in targets:
+        refs = list(refs or [None])
+        if batch and size + len(refs) > batch_size:
+            yield batch
+            batch, size = [], 0
+        batch.append((repo, refs))
+        size += len(refs)
+    if batch:
+        yield batch
+
+
+def _unique(skills: List[Dict]) -> List[Dict]:
+    """First skill of each name, like find_skills_in_refs"""
+    seen = set()
+    return [s for s in skills if s['name'] not in seen and not seen.add(s['name'])]
+
+
+def iter_skills_batch(targets: Sequence[Tuple[str, Sequence[Optional[str]]]],
+                      search_paths: Sequence[str] = github.DEFAULT_SEARCH_PATHS,
+                      strict: bool = False, batch_size: int = GRAPHQL_BATCH_SIZE) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Scan many repositories with as few GraphQL queries as possible
+
+    Args:
+        targets: (owner/repo, refs) pairs; a ref of None is the default branch
+
+    Yields:
+        (repo, skills) for each repository as its batch completes, skills as
+        find_skills_in_refs would report them. Repositories GraphQL could
+        not answer are scanned over REST.
+    """
+    for batch in _batches(targets, batch_size):
+        payload = None
+        if is_available():
+            pairs = [(repo, ref) for repo, refs in batch for ref in refs]
+            with tracing.span('graphql', category='batch', repos=len(batch)):
+                payload = _post(build_query(pairs, search_paths), len(batch))
+            if payload is None:
+                print_warning(f"GraphQL unavailable ({_unavailable}); using the REST API")
+
+        if payload is None:
+            for repo, refs in batch:
+                yield repo, github.find_skills_in_refs(repo, refs, search_paths, strict)
+            continue
+
+        missing = {
+            error['path'][0] for error in payload.get('errors') or []
+            if error.get('type') == 'NOT_FOUND' and error.get('path')
+        }
+        alias = 0
+        for repo, refs in batch:
+            skills, answered = [], True
+            for ref in refs:
+                data = payload['data'].get(f"r{alias}")
+                if data is not None:
+                    skills.extend(parse_repository(data, repo, ref, search_paths))
+                elif f"r{alias}" not in missing:
+                    answered = False
+                alias += 1
+
+            if answered:
+                yield repo, _unique(skills)
+            else:
+                yield repo, github.find_skills_in_refs(repo, refs, search_paths, strict)
+
+
+def find_skills_batch(targets: Sequence[Tuple[str, Sequence[Optional[str]]]],
+                      search_paths: Sequence[str] = github.DEFAULT_SEARCH_PATHS,
+                      strict: bool = False, batch_size: int = GRAPHQL_BATCH_SIZE) -> Dict[str, List[Dict]]:
+    """Mapping of repo to skills for all targets (see iter_skills_batch)"""
+    return dict(iter_skills_batch(targets, search_paths, strict, batch_size))
+
+
+def stream_skills_batch(targets: Sequence[Tuple[str, Sequence[Optional[str]]]],
+                        search_paths: Sequence[str] = github.DEFAULT_SEARCH_PATHS) -> Iterator[Tuple[str, Optional[Dict]]]:
+    """Same (repo, skill) / (repo, None) stream as github.stream_skills, batch by batch"""
+    for repo, skills in iter_skills_batch(targets, search_paths):
+        for skill in skills:
+            yield repo, skill
+        yield repo, None
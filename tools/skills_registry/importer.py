@@ -0,0 +1,87 @@
+"""
+Single Repository Import
+
+Scan one GitHub repository and add every skill it contains.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from .registry import REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry
+from .stats import put_skill
+
+
+def import_repository(repo: str, branch: Optional[str] = None, registry_path: Path = REGISTRY_PATH) -> int:
+    """Import all skills from a repository after confirmation; returns an exit code"""
+    from .github import find_skills_in_repo, resolve_default_branch
+
+    print("🎯 Import Skills from GitHub Repository")
+    print("=" * 50)
+    print(f"Repository: {repo}")
+    print(f"Branch: {branch or resolve_default_branch(repo) or 'default'}")
+    print()
+
+    print(f"🔍 Scanning {repo}...")
+    skills = find_skills_in_repo(repo, branch)
+
+    if not skills:
+        print("❌ No skills found!")
+        return 0
+
+    print(f"\n✅ Found {len(skills)} skill(s)")
+    print()
+
+    try:
+        registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print("❌ Registry file not found!")
+        return 1
+
+    # Ask for confirmation
+    print("📋 Skills to add:")
+    for i, skill in enumerate(skills, 1):
+        exists = skill['name'] in registry['skills']
+        status = "⚠️  EXISTS" if exists else "✅ NEW"
+        print(f"  {i}. {status} - {skill['name']}")
+        print(f"     Path: {skill['path']}")
+
+    print()
+    response = input("Continue? (y/N): ")
+
+    if response.lower() != 'y':
+        print("❌ Aborted.")
+        return 0
+
+    added_count = 0
+    skipped_count = 0
+
+    for skill in skills:
+        skill_name = skill['name']
+
+        if skill_name in registry['skills']:
+            print(f"⏭️  Skipped: {skill_name} (already exists)")
+            skipped_count += 1
+            continue
+
+        put_skill(registry, skill_name, create_skill_entry(skill, skill['branch']))
+        added_count += 1
+        print(f"✅ Added: {skill_name}")
+
+    touch_registry(registry, synced=True)
+
+    print()
+    print("💾 Saving registry...")
+    save_registry(registry_path, registry)
+
+    print()
+    print("✅ Import complete!")
+    print(f"   Added: {added_count}")
+    print(f"   Skipped: {skipped_count}")
+    print()
+    print("👉 Next steps:")
+    print("  1. Edit skills/skills-registry.json to add descriptions and metadata")
+    print("  2. Run: python tools/validate_registry.py")
+    print("  3. Run: python tools/generate_readme.py")
+    print(f"  4. Run: git add . && git commit -m 'Import skills from {repo}'")
+    print("  5. Run: git push")
+    return 0
@@ -0,0 +1,301 @@
+"""
+Precomputed Lookup Index
+
+Compact binary index shipped next to the registry (skills/skills-index.bin)
+so consumers can answer name -> entry and category/tag/repo/license/author
+-> names lookups by binary search over a memory-mapped file, without parsing the
+registry JSON.
+
+Layout (little-endian, offsets relative to the start of the file):
+
+    header      magic "SKIX", format, skill count,
+                SHA-256 of the registry file it was built from,
+                (offset, length) of the seven sections below
+    names       string table of skill names, sorted
+    entries     offset table + compact JSON of each entry, in name order
+    category    string table of keys + postings (name indices, sorted)
+    tag         "
+    repo        "
+    license     "
+    author      "
+
+A string table is a u32 count N, N+1 u32 offsets and the UTF-8 blob; a
+postings section is a key string table followed by K+1 u32 offsets and the
+u32 name indices.
+"""
+
+import json
+import mmap
+import struct
+import hashlib
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .registry import registry_file
+
+MAGIC = b"SKIX"
+INDEX_FORMAT = 2
+SECTIONS = ("names", "entries", "category", "tag", "repo", "license", "author")
+KEY_FIELDS = ("category", "tag", "repo", "license", "author")
+
+_HEADER = struct.Struct("<4sHHI32s" + "QQ" * len(SECTIONS))
+_U32 = struct.Struct("<I")
+
+
+class LookupIndexError(Exception):
+    """The index file is missing, corrupt or of an unknown format"""
+
+
+def index_path(registry_path: Path) -> Path:
+    """Index file that belongs to a registry file or shard directory"""
+    path = registry_file(registry_path)
+    return path.parent / "skills-index.bin"
+
+
+def registry_digest(registry_path: Path) -> bytes:
+    """SHA-256 of the registry file (the shard manifest for shards)"""
+    digest = hashlib.sha256()
+    with open(registry_file(registry_path), 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def skill_keys(skill: dict) -> Dict[str, List[str]]:
+    """Category, tag, repo, license and author keys of one entry"""
+    metadata = skill.get('metadata') if isinstance(skill.get('metadata'), dict) else {}
+    source = skill.get('source') if isinstance(skill.get('source'), dict) else {}
+    return {
+        'category': [metadata.get('category') or 'general'],
+        'tag': sorted({t for t in metadata.get('tags', []) if isinstance(t, str)}),
+        'repo': [source['repo']] if source.get('repo') else [],
+        'license': [metadata['license']] if isinstance(metadata.get('license'), str) and metadata['license'] else [],
+        'author': [metadata['author']] if isinstance(metadata.get('author'), str) and metadata['author'] else [],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def _pack_offsets(offsets: List[int]) -> bytes:
+    return struct.pack(f"<{len(offsets)}I", *offsets)
+
+
+def _string_table(strings: List[str]) -> bytes:
+    blobs = [s.encode('utf-8') for s in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return _U32.pack(len(blobs)) + _pack_offsets(offsets) + b"".join(blobs)
+
+
+def _postings(keys: Dict[str, List[int]]) -> bytes:
+    ordered = sorted(keys)
+    offsets = [0]
+    indices = []
+    for key in ordered:
+        indices.extend(sorted(keys[key]))
+        offsets.append(len(indices))
+    return _string_table(ordered) + _pack_offsets(offsets) + _pack_offsets(indices)
+
+
+def build_index(registry: dict) -> bytes:
+    """Serialize the lookup index of a registry (digest left blank)"""
+    skills = dict(registry.get('skills', {}).items())
+    names = sorted(skills)
+
+    entries = [json.dumps(skills[n], ensure_ascii=False, separators=(',', ':')).encode('utf-8') for n in names]
+    offsets = [0]
+    for entry in entries:
+        offsets.append(offsets[-1] + len(entry))
+
+    postings = {field: {} for field in KEY_FIELDS}
+    for i, name in enumerate(names):
+        for field, values in skill_keys(skills[name]).items():
+            for value in values:
+                postings[field].setdefault(value, []).append(i)
+
+    sections = [
+        _string_table(names),
+        _pack_offsets(offsets) + b"".join(entries),
+    ] + [_postings(postings[field]) for field in KEY_FIELDS]
+
+    directory = []
+    position = _HEADER.size
+    for section in sections:
+        directory += [position, len(section)]
+        position += len(section)
+
+    header = _HEADER.pack(MAGIC, INDEX_FORMAT, 0, len(names), b"\0" * 32, *directory)
+    return header + b"".join(sections)
+
+
+def write_index(registry_path: Path, registry: dict, output: Optional[Path] = None) -> Path:
+    """Build the index for a registry and write it (next to the registry by default)"""
+    data = bytearray(build_index(registry))
+    data[12:44] = registry_digest(registry_path)
+
+    output = Path(output or index_path(registry_path))
+    tmp = output.with_name(output.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(output)
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class _StringTable:
+    """Sorted string table inside the mapped file"""
+
+    def __init__(self, buf, offset: int):
+        self.buf = buf
+        self.count = _U32.unpack_from(buf, offset)[0]
+        self.offsets = offset + 4
+        self.blob = self.offsets + 4 * (self.count + 1)
+        self.end = self.blob + _U32.unpack_from(buf, self.offsets + 4 * self.count)[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        start, end = struct.unpack_from("<II", self.buf, self.offsets + 4 * i)
+        return bytes(self.buf[self.blob + start:self.blob + end]).decode('utf-8')
+
+    def find(self, key: str) -> Optional[int]:
+        """Position of key (binary search), None if absent"""
+        i = bisect_left(self, key)
+        return i if i < self.count and self[i] == key else None
+
+
+class _Postings:
+    """Key -> sorted name indices"""
+
+    def __init__(self, buf, offset: int):
+        self.buf = buf
+        self.keys = _StringTable(buf, offset)
+        self.offsets = self.keys.end
+        self.indices = self.offsets + 4 * (len(self.keys) + 1)
+
+    def get(self, key: str) -> List[int]:
+        i = self.keys.find(key)
+        if i is None:
+            return []
+        start, end = struct.unpack_from("<II", self.buf, self.offsets + 4 * i)
+        return list(struct.unpack_from(f"<{end - start}I", self.buf, self.indices + 4 * start))
+
+    def counts(self) -> Dict[str, int]:
+        result = {}
+        for i in range(len(self.keys)):
+            start, end = struct.unpack_from("<II", self.buf, self.offsets + 4 * i)
+            result[self.keys[i]] = end - start
+        return result
+
+
+class LookupIndex:
+    """
+    Read-only view of an index file
+
+    Usage:
+        with LookupIndex.open("skills/skills-index.bin") as index:
+            index.get("pdf")
+            index.names(category="document", tag="pdf")
+    """
+
+    def __init__(self, buf, close=None):
+        if len(buf) < _HEADER.size:
+            raise LookupIndexError("Index file is truncated")
+        magic, fmt, _, count, digest, *directory = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise LookupIndexError("Not a skills index file")
+        if fmt != INDEX_FORMAT:
+            raise LookupIndexError(f"Unsupported index format {fmt}")
+
+        self.buf = buf
+        self.count = count
+        self.digest = digest
+        self._close = close
+        sections = dict(zip(SECTIONS, directory[0::2]))
+
+        self._names = _StringTable(buf, sections['names'])
+        self._entries = sections['entries']
+        self._entry_blob = self._entries + 4 * (count + 1)
+        self._keys = {field: _Postings(buf, sections[field]) for field in KEY_FIELDS}
+
+    @classmethod
+    def open(cls, path: Path) -> "LookupIndex":
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped.close)
+
+    def close(self):
+        if self._close:
+            self._close()
+            self._close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, name: str) -> bool:
+        return self._names.find(name) is not None
+
+    def is_current(self, registry_path: Path) -> bool:
+        """True when the index was built from the registry as it is on disk"""
+        return self.digest == registry_digest(registry_path)
+
+    def entry(self, i: int) -> dict:
+        start, end = struct.unpack_from("<II", self.buf, self._entries + 4 * i)
+        return json.loads(bytes(self.buf[self._entry_blob + start:self._entry_blob + end]))
+
+    def get(self, name: str) -> Optional[dict]:
+        """Entry for a skill name, None if absent"""
+        i = self._names.find(name)
+        return None if i is None else self.entry(i)
+
+    def names(self, category: Optional[str] = None, tag: Optional[str] = None,
+              repo: Optional[str] = None) -> List[str]:
+        """Sorted skill names matching all given filters"""
+        filters = [
+            self._keys[field].get(value)
+            for field, value in (('category', category), ('tag', tag), ('repo', repo))
+            if value
+        ]
+        if not filters:
+            return [self._names[i] for i in range(self.count)]
+
+        matched = set(min(filters, key=len)).intersection(*filters)
+        return [self._names[i] for i in sorted(matched)]
+
+    def position(self, name: str) -> Optional[int]:
+        """Position of a skill name (binary search), None if absent"""
+        return self._names.find(name)
+
+    def name(self, i: int) -> str:
+        """Skill name at a position (names are sorted)"""
+        return self._names[i]
+
+    def keys(self, field: str) -> List[str]:
+        """Sorted keys of a category, tag, repo, license or author field"""
+        table = self._keys[field].keys
+        return [table[i] for i in range(len(table))]
+
+    def postings(self, field: str, key: str) -> List[int]:
+        """Sorted name positions of the skills with a key"""
+        return self._keys[field].get(key)
+
+    def counts(self, field: str) -> Dict[str, int]:
+        """Skill count for every key of a field"""
+        return self._keys[field].counts()
+
+    def iter_names(self) -> Iterable[str]:
+        for i in range(self.count):
+            yield self._names[i]
@@ -0,0 +1,92 @@
+"""
+Content Pins
+
+Scanned entries record where their content came from:
+
+    "source": {..., "commit": "<commit sha>", "tree": "<tree sha of path>"}
+
+The tree sha is a digest of the skill directory, so consumers can cache a
+skill by it forever, and a rescan knows which skills changed by comparing
+tree shas without fetching any content. An entry is only re-pinned when
+its tree changes; a new commit that leaves the directory alone keeps the
+old pin.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from .stats import put_skill
+
+_SHA = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})?$")
+
+
+def check_pin(name: str, source: dict) -> List[str]:
+    """Format errors of an entry's commit/tree pin (none when unpinned)"""
+    errors = []
+    for field in ('commit', 'tree'):
+        value = source.get(field)
+        if value is not None and not (isinstance(value, str) and _SHA.match(value)):
+            errors.append(f"Skill '{name}': source.{field} must be a 40 or 64 character lowercase hex sha")
+    if ('commit' in source) != ('tree' in source):
+        errors.append(f"Skill '{name}': source.commit and source.tree must be set together")
+    return errors
+
+
+def update_pin(registry: dict, name: str, skill: Dict) -> Optional[str]:
+    """
+    Re-pin an existing entry from a scan result of the same repo and path
+
+    The entry is replaced by an updated copy rather than edited in place,
+    so sharded registries mark its shard dirty and the feed sees the change.
+
+    Returns:
+        'pinned' for a previously unpinned entry, 'changed' when the
+        directory's tree differs, None when nothing was updated
+    """
+    entry = registry['skills'][name]
+    source = entry.get('source') if isinstance(entry, dict) else None
+    if (not isinstance(source, dict) or not skill.get('tree') or not skill.get('commit')
+            or source.get('repo') != skill['repo'] or source.get('path') != skill['path']):
+        return None
+    if source.get('tree') == skill['tree']:
+        return None
+
+    status = 'changed' if source.get('tree') else 'pinned'
+    put_skill(registry, name, dict(entry, source=dict(source, commit=skill['commit'], tree=skill['tree'])))
+    return status
+
+
+def verify_pins(skills: Dict[str, Dict]) -> List[str]:
+    """
+    Check over the GitHub API that every pinned directory has its recorded tree
+
+    Returns:
+        One message per entry whose commit or path no longer matches
+    """
+    from .github import resolve_commit, tree_sha_at, GitHubError
+
+    problems = []
+    roots = {}
+    for name, entry in skills.items():
+        source = entry.get('source') if isinstance(entry, dict) else None
+        if not isinstance(source, dict) or not source.get('commit') or source.get('type') != 'github':
+            continue
+
+        repo, commit = source.get('repo'), source['commit']
+        try:
+            if (repo, commit) not in roots:
+                resolved = resolve_commit(repo, commit, strict=True)
+                roots[(repo, commit)] = resolved[1] if resolved else None
+            root = roots[(repo, commit)]
+            tree = tree_sha_at(repo, root, source.get('path') or "", strict=True) if root else None
+        except GitHubError as e:
+            problems.append(f"Skill '{name}': cannot verify pin: {e}")
+            continue
+
+        if root is None:
+            problems.append(f"Skill '{name}': commit {commit[:12]} not found in {repo}")
+        elif tree != source.get('tree'):
+            found = tree[:12] if tree else "no directory"
+            problems.append(f"Skill '{name}': {source.get('path')} at {commit[:12]} is {found}, "
+                            f"pinned {str(source.get('tree'))[:12]}")
+    return problems
@@ -0,0 +1,165 @@
+"""
+Profiling
+
+Every command accepts --profile FILE: the command runs under cProfile and
+leaves two files behind:
+
+    FILE        pstats data (python -m pstats FILE, or snakeviz FILE)
+    FILE.txt    report: wall time, peak memory, the functions with the most
+                cumulative and own time, and with --profile-memory the
+                lines holding the most memory near the Python heap's peak
+
+--profile-memory adds tracemalloc, which slows the run down noticeably, so
+time and memory are best measured in separate runs. The heap is sampled
+from a background thread, which takes a snapshot whenever it has grown by
+a tenth since the last one, so the allocation table describes the heap
+close to its peak rather than what is left when the command ends (the
+snapshots themselves add to peak RSS in that mode). cProfile only sees
+the main thread; the scan worker threads show up as waiting, so use
+--trace for per-request scan timing.
+"""
+
+import io
+import sys
+import time
+import threading
+import pstats
+import cProfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+TRACEBACK_FRAMES = 5
+
+# Heap sampling: seconds between checks, and the growth that triggers a snapshot
+SAMPLE_INTERVAL = 0.1
+SAMPLE_GROWTH = 1.1
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, where the OS reports it"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class PeakSampler(threading.Thread):
+    """Keep a tracemalloc snapshot of the largest heap seen while running"""
+
+    def __init__(self):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.size = 0
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.size * SAMPLE_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.size = current
+
+    def run(self):
+        while not self._stop_event.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def stop(self) -> Optional[tracemalloc.Snapshot]:
+        self._stop_event.set()
+        self.join()
+        self.sample()
+        return self.snapshot
+
+
+def _mb(size: Optional[int]) -> str:
+    return "n/a" if size is None else f"{size / (1024 * 1024):.1f} MB"
+
+
+def _stats_table(profiler: cProfile.Profile, sort: str, limit: int) -> str:
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return buffer.getvalue().strip()
+
+
+def write_report(path: Path, command: str, elapsed: float, profiler: cProfile.Profile,
+                 snapshot: Optional[tracemalloc.Snapshot], heap_peak: Optional[int]) -> List[str]:
+    """Write the text report; returns its summary lines"""
+    summary = [
+        f"Command:        {command}",
+        f"Wall time:      {elapsed:.3f} s",
+        f"Peak RSS:       {_mb(peak_rss())}",
+    ]
+    if heap_peak is not None:
+        summary.append(f"Python heap:    {_mb(heap_peak)} at peak (tracemalloc)")
+
+    sections = [
+        "\n".join(summary),
+        "== Cumulative time ==\n" + _stats_table(profiler, 'cumulative', TOP_FUNCTIONS),
+        "== Own time ==\n" + _stats_table(profiler, 'tottime', TOP_FUNCTIONS),
+    ]
+    if snapshot is not None:
+        lines = ["== Memory near peak (by line) =="]
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            frame = stat.traceback[0]
+            lines.append(f"{_mb(stat.size):>10}  {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+        sections.append("\n".join(lines))
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n\n".join(sections) + "\n")
+    return summary
+
+
+def run_profiled(path: Path, memory: bool, command: str, fn: Callable, *args, **kwargs):
+    """
+    Run fn under cProfile (and tracemalloc with memory) and write the pstats
+    file and report, also when fn raises or exits
+
+    Returns:
+        fn's result
+    """
+    path = Path(path)
+    report_path = path.with_name(path.name + ".txt")
+    profiler = cProfile.Profile()
+    sampler = None
+    if memory:
+        tracemalloc.start(TRACEBACK_FRAMES)
+        sampler = PeakSampler()
+        sampler.start()
+
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+
+        snapshot = heap_peak = None
+        if sampler is not None:
+            snapshot = sampler.stop()
+            heap_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if snapshot is not None:
+                snapshot = snapshot.filter_traces((
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                ))
+
+        # stderr, so output meant for pipes (diff --format json) stays clean
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(path))
+            summary = write_report(report_path, command, elapsed, profiler, snapshot, heap_peak)
+        except OSError as e:
+            print(f"\n⚠️  Cannot write profile: {e}", file=sys.stderr)
+        else:
+            print(f"\n📈 Profile written to {path} (report: {report_path})", file=sys.stderr)
+            for line in summary[1:]:
+                print(f"   {line}", file=sys.stderr)
@@ -0,0 +1,144 @@
+"""
+Registry Query
+
+Filter skills by field with the postings of the lookup index
+(skills/skills-index.bin) rather than a pass over every entry. A query is
+a list of clauses that must all hold:
+
+    category=scientific license=MIT author=K-Dense-AI   (or field:value)
+    tag=pdf,docx            any of the values (OR within a clause)
+    repo!=anthropics/*      none of them; * ? [] are glob patterns
+    name=pdf*               skill names themselves
+
+Fields: name, category, tag (tags), license, author, repo. Values match
+case-insensitively. Each clause resolves to the union of the postings of
+its matching keys, clauses are intersected smallest first, and only the
+entries of the requested page are decoded.
+"""
+
+import re
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .lookup import KEY_FIELDS, LookupIndex, LookupIndexError, build_index, index_path
+from .registry import load_registry
+
+FIELDS = ('name',) + KEY_FIELDS
+ALIASES = {'tags': 'tag', 'categories': 'category', 'source': 'repo'}
+DEFAULT_LIMIT = 50
+
+_CLAUSE = re.compile(r"^\s*([A-Za-z_]+)\s*(!=|=|:)\s*(.*?)\s*$")
+_GLOB = re.compile(r"[*?\[]")
+
+
+class QueryError(ValueError):
+    """A query clause cannot be parsed"""
+
+
+def parse_query(clauses: List[str]) -> List[Tuple[str, bool, List[str]]]:
+    """
+    Parse "field=value[,value...]" / "field!=..." clauses
+
+    Returns:
+        List of (field, negated, values)
+
+    Raises:
+        QueryError: Malformed clause, unknown field or empty value
+    """
+    parsed = []
+    for clause in clauses:
+        match = _CLAUSE.match(clause)
+        if not match:
+            raise QueryError(f"'{clause}': expected field=value or field!=value")
+        field, operator, raw = match.groups()
+        field = ALIASES.get(field.lower(), field.lower())
+        if field not in FIELDS:
+            raise QueryError(f"'{clause}': unknown field '{field}' (use {', '.join(FIELDS)})")
+        values = [v.strip() for v in raw.split(',') if v.strip()]
+        if not values:
+            raise QueryError(f"'{clause}': no value")
+        parsed.append((field, operator == '!=', values))
+    return parsed
+
+
+def _matcher(values: List[str]):
+    """Predicate for keys equal to (case-insensitively) or matching a glob of one of the values"""
+    exact = {v.lower() for v in values if not _GLOB.search(v)}
+    globs = [v.lower() for v in values if _GLOB.search(v)]
+
+    def matches(key: str) -> bool:
+        key = key.lower()
+        return key in exact or any(fnmatchcase(key, g) for g in globs)
+    return matches
+
+
+def _clause_positions(index: LookupIndex, field: str, values: List[str]) -> Set[int]:
+    """Name positions matching any of the values of one clause"""
+    if field == 'name':
+        exact = [index.position(v) for v in values if not _GLOB.search(v)]
+        if len(exact) == len(values) and None not in exact:
+            # Exact names: binary search instead of a scan of the name table
+            return set(exact)
+        matches = _matcher(values)
+        return {i for i, name in enumerate(index.iter_names()) if matches(name)}
+
+    positions = set()
+    matches = _matcher(values)
+    for key in index.keys(field):
+        if matches(key):
+            positions.update(index.postings(field, key))
+    return positions
+
+
+def run_query(index: LookupIndex, clauses: List[Tuple[str, bool, List[str]]]) -> List[int]:
+    """Sorted name positions of the skills matching every clause"""
+    included, excluded = [], set()
+    for field, negated, values in clauses:
+        positions = _clause_positions(index, field, values)
+        if negated:
+            excluded |= positions
+        else:
+            included.append(positions)
+
+    if included:
+        included.sort(key=len)
+        matched = included[0].intersection(*included[1:])
+    else:
+        matched = set(range(len(index)))
+    return sorted(matched - excluded)
+
+
+def paginate(positions: List[int], offset: int = 0, limit: Optional[int] = DEFAULT_LIMIT) -> Dict:
+    """One page of results; limit None or 0 returns everything from offset"""
+    offset = max(offset, 0)
+    page = positions[offset:offset + limit] if limit else positions[offset:]
+    end = offset + len(page)
+    return {
+        'total': len(positions),
+        'offset': offset,
+        'limit': limit or None,
+        'next_offset': end if end < len(positions) else None,
+        'items': page,
+    }
+
+
+def open_index(registry_path: Path, index_file: Optional[Path] = None) -> Tuple[LookupIndex, bool]:
+    """
+    The lookup index of a registry: the index file when it is current,
+    otherwise one built in memory from the registry
+
+    Returns:
+        (index, from_file)
+    """
+    path = Path(index_file or index_path(registry_path))
+    try:
+        index = LookupIndex.open(path)
+    except (FileNotFoundError, ValueError, LookupIndexError):
+        index = None
+    if index is not None:
+        if index_file or index.is_current(registry_path):
+            return index, True
+        index.close()
+
+    return LookupIndex(build_index(load_registry(registry_path))), False
@@ -0,0 +1,248 @@
+"""
+Lazy Registry Reader
+
+Read-only, memory-mapped view of skills-registry.json. The first open scans
+the file once for the name and byte span of every skill entry and caches
+them in a hidden sidecar file (.skills-registry.json.offsets, keyed by file
+size and mtime). Entries are decoded only when accessed, so reading the stats or
+one skill of a large registry touches a few kilobytes instead of building
+the whole dict tree.
+
+Usage:
+    with RegistryReader.open("skills/skills-registry.json") as reader:
+        reader.root['stats']
+        reader['pdf']
+"""
+
+import os
+import json
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from json.decoder import JSONDecoder, WHITESPACE, scanstring
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+OFFSETS_MAGIC = b"SKOF"
+OFFSETS_FORMAT = 1
+
+_HEADER = struct.Struct("<4sHHQqQQQQ")
+_SCAN = JSONDecoder().scan_once
+
+
+class RegistryFormatError(ValueError):
+    """The registry file does not have the expected layout"""
+
+
+def offsets_path(registry_path: Path) -> Path:
+    registry_path = Path(registry_path)
+    return registry_path.with_name(f".{registry_path.name}.offsets")
+
+
+def _ws(text: str, pos: int) -> int:
+    return WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, char: str):
+    if text[pos:pos + 1] != char:
+        raise RegistryFormatError(f"Expected '{char}' at character {pos}")
+
+
+def _scan_skills(text: str, pos: int, names: List[str], spans: List[int]) -> int:
+    """Record (name, value span) of every entry of the skills object at pos"""
+    _expect(text, pos, '{')
+    pos = _ws(text, pos + 1)
+    if text[pos:pos + 1] == '}':
+        return pos + 1
+
+    while True:
+        _expect(text, pos, '"')
+        name, pos = scanstring(text, pos + 1)
+        pos = _ws(text, pos)
+        _expect(text, pos, ':')
+        start = _ws(text, pos + 1)
+        value, pos = _SCAN(text, start)
+        if not isinstance(value, (dict, list)):
+            raise RegistryFormatError(f"Skill '{name}' is not an object")
+        names.append(name)
+        spans += (start, pos)
+
+        pos = _ws(text, pos)
+        if text[pos:pos + 1] == '}':
+            return pos + 1
+        _expect(text, pos, ',')
+        pos = _ws(text, pos + 1)
+
+
+def scan_offsets(buf) -> Tuple[int, int, List[str], array]:
+    """
+    Locate the skills object and each entry in a registry file
+
+    Runs once per file version (the result is cached), at about the cost of
+    one json.load.
+
+    Returns:
+        (start, end) byte span of the "skills" object, the skill names in
+        file order and a flat array of (start, end) byte spans per entry
+    """
+    text = bytes(buf).decode('utf-8')
+    names, spans = [], []
+    skills_span = None
+
+    try:
+        pos = _ws(text, 0)
+        _expect(text, pos, '{')
+        pos = _ws(text, pos + 1)
+        while text[pos:pos + 1] != '}':
+            _expect(text, pos, '"')
+            key, pos = scanstring(text, pos + 1)
+            pos = _ws(text, pos)
+            _expect(text, pos, ':')
+            pos = _ws(text, pos + 1)
+
+            if key == 'skills' and skills_span is None:
+                start = pos
+                pos = _scan_skills(text, pos, names, spans)
+                skills_span = [start, pos]
+            else:
+                _, pos = _SCAN(text, pos)
+
+            pos = _ws(text, pos)
+            if text[pos:pos + 1] == ',':
+                pos = _ws(text, pos + 1)
+            else:
+                _expect(text, pos, '}')
+    except StopIteration as e:
+        raise RegistryFormatError(f"Invalid JSON value at character {e.value}")
+
+    if skills_span is None:
+        raise RegistryFormatError("No 'skills' object found")
+
+    # Character positions -> byte offsets (identical for ASCII files)
+    positions = [skills_span[0]] + spans + [skills_span[1]]
+    if len(text) != len(buf):
+        offsets, char, byte = [], 0, 0
+        for p in positions:
+            byte += len(text[char:p].encode('utf-8'))
+            char = p
+            offsets.append(byte)
+        positions = offsets
+
+    return positions[0], positions[-1], names, array('Q', positions[1:-1])
+
+
+class RegistryReader(Mapping):
+    """Mapping of skill name -> entry, decoded on access"""
+
+    def __init__(self, buf, skills_span: Tuple[int, int], names: List[str], spans: array, close=None):
+        self.buf = buf
+        self.skills_span = skills_span
+        self.spans = spans
+        self._names = {name: 2 * i for i, name in enumerate(names)}
+        self._close = close
+        self._root = None
+
+    @classmethod
+    def open(cls, path: Path, cache: bool = True) -> "RegistryReader":
+        """Map a registry file, using (and refreshing) the offsets cache"""
+        path = Path(path)
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == 0:
+                raise RegistryFormatError(f"Empty registry file: {path}")
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = load_offsets(offsets_path(path), stamp) if cache else None
+        if cached is None:
+            try:
+                cached = scan_offsets(buf)
+            except (ValueError, IndexError) as e:
+                buf.close()
+                raise RegistryFormatError(f"{path}: {e}")
+            if cache:
+                save_offsets(offsets_path(path), stamp, *cached)
+
+        start, end, names, spans = cached
+        return cls(buf, (start, end), names, spans, buf.close)
+
+    def close(self):
+        if self._close:
+            self._close()
+            self._close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def root(self) -> dict:
+        """Top-level fields with an empty "skills" object (decoded once)"""
+        if self._root is None:
+            start, end = self.skills_span
+            self._root = json.loads(self.buf[:start] + b"{}" + self.buf[end:])
+        return self._root
+
+    def raw(self, name: str) -> bytes:
+        """Undecoded JSON bytes of one entry"""
+        i = self._names[name]
+        return self.buf[self.spans[i]:self.spans[i + 1]]
+
+    def __getitem__(self, name: str) -> dict:
+        return json.loads(self.raw(name))
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        for name in self._names:
+            yield name, self[name]
+
+    def values(self) -> Iterator[dict]:
+        for _, skill in self.items():
+            yield skill
+
+
+def load_offsets(path: Path, stamp: Tuple[int, int]) -> Optional[Tuple[int, int, List[str], array]]:
+    """Cached offsets for a registry file, None when missing or stale"""
+    try:
+        with open(path, 'rb') as f:
+            magic, fmt, _, size, mtime, start, end, count, names_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != OFFSETS_MAGIC or fmt != OFFSETS_FORMAT or (size, mtime) != stamp:
+                return None
+            spans = array('Q')
+            spans.fromfile(f, 2 * count)
+            blob = f.read(names_size)
+    except (OSError, EOFError, struct.error):
+        return None
+
+    names = blob.decode('utf-8').split('\0') if count else []
+    if len(names) != count:
+        return None
+    return start, end, names, spans
+
+
+def save_offsets(path: Path, stamp: Tuple[int, int], start: int, end: int, names: List[str], spans: array):
+    """Write the offsets cache (skipped on read-only locations)"""
+    if any('\0' in name for name in names):
+        return
+    blob = '\0'.join(names).encode('utf-8')
+    try:
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, 'wb') as f:
+            f.write(_HEADER.pack(OFFSETS_MAGIC, OFFSETS_FORMAT, 0, stamp[0], stamp[1],
+                                 start, end, len(names), len(blob)))
+            spans.tofile(f)
+            f.write(blob)
+        tmp.replace(path)
+    except OSError:
+        pass
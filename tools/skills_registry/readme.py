@@ -0,0 +1,245 @@
+"""
+Skills Registry README Generator
+
+Generate a human-readable README.md from skills-registry.json
+"""
+
+import os
+import multiprocessing
+from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+# Below this many skills, starting worker processes costs more than it saves
+PARALLEL_MIN_SKILLS = 5000
+
+
+def render_category(category: str, cat_info: dict, skills: List[Tuple[str, dict]]) -> str:
+    """Markdown section of one category and its skills"""
+    lines = []
+
+    # Category info
+    cat_name = cat_info.get('name', category.title())
+    cat_desc = cat_info.get('description', '')
+
+    # Category header
+    lines.append(f"### {cat_name}")
+    lines.append("")
+
+    if cat_desc:
+        lines.append(f"{cat_desc}")
+        lines.append("")
+
+    # Sort skills by name
+    skills.sort(key=lambda x: x[0])
+
+    # List skills
+    for skill_name, skill in skills:
+        lines.append(f"#### {skill_name}")
+        lines.append("")
+
+        description = skill.get('description', 'No description')
+        lines.append(f"**Description**: {description}")
+        lines.append("")
+
+        # Source info
+        source = skill.get('source', {})
+        source_type = source.get('type', 'unknown')
+
+        if source_type == 'github':
+            repo = source.get('repo', 'unknown')
+            url = source.get('url', '')
+            lines.append(f"**Source**: [GitHub]({url})")
+            lines.append("")
+        elif source_type == 'local':
+            path = source.get('path', 'unknown')
+            lines.append(f"**Source**: Local (`{path}`)")
+            lines.append("")
+
+        # Metadata
+        metadata = skill.get('metadata', {})
+
+        # Author
+        if metadata.get('author'):
+            lines.append(f"**Author**: {metadata['author']}")
+
+        # License
+        if metadata.get('license'):
+            lines.append(f"**License**: {metadata['license']}")
+
+        # Tags
+        tags = metadata.get('tags', [])
+        if tags:
+            tags_str = ', '.join(tags)
+            lines.append(f"**Tags**: `{tags_str}`")
+
+        lines.append("")
+
+        # Installation hint
+        lines.append("**Installation**:")
+        lines.append("")
+        lines.append("```bash")
+        lines.append(f"python scripts/install_skill.py {skill_name}")
+        lines.append("```")
+        lines.append("")
+
+    return '\n'.join(lines)
+
+
+# Sections of the render in progress; forked workers inherit them, so only
+# index ranges and rendered text cross process boundaries (pickling the
+# skills would cost several times more than rendering them)
+_pending: List[Tuple[str, dict, List[Tuple[str, dict]]]] = []
+
+
+def _render_range(bounds: Tuple[int, int]) -> List[str]:
+    start, stop = bounds
+    return [render_category(*section) for section in _pending[start:stop]]
+
+
+def render_sections(sections: List[Tuple[str, dict, List[Tuple[str, dict]]]], workers: int = 1) -> List[str]:
+    """
+    Render (category, info, skills) sections, in a process pool with workers > 1
+
+    Sections are grouped into about four chunks per worker, balanced by
+    skill count, and returned in input order, so the result is the same as
+    rendering serially. workers=0 uses one worker per CPU. Workers are
+    forked; where fork is unavailable (Windows) sections render serially.
+    """
+    global _pending
+
+    workers = workers or os.cpu_count() or 1
+    total = sum(len(skills) for _, _, skills in sections)
+    if (workers <= 1 or len(sections) < 2 or total < PARALLEL_MIN_SKILLS
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        return [render_category(*section) for section in sections]
+
+    bounds, start, size = [], 0, 0
+    target = max(1, total // (workers * 4))
+    for i, (_, _, skills) in enumerate(sections, 1):
+        size += len(skills)
+        if size >= target or i == len(sections):
+            bounds.append((start, i))
+            start, size = i, 0
+
+    _pending = sections
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)),
+                                 mp_context=multiprocessing.get_context('fork')) as pool:
+            return [text for texts in pool.map(_render_range, bounds) for text in texts]
+    finally:
+        _pending = []
+
+
+def generate_readme(data: dict, workers: int = 1) -> str:
+    """
+    Generate README content from registry data
+
+    Args:
+        workers: Processes rendering the category sections (1: serial,
+            0: one per CPU); the output is the same either way
+    """
+
+    lines = []
+
+    # Header
+    lines.append("# Claude Skills Registry")
+    lines.append("")
+    lines.append("A centralized registry of Claude Skills available for installation via Skills Store.")
+    lines.append("")
+
+    # About section
+    lines.append("## About")
+    lines.append("")
+    lines.append("This registry contains a curated list of Claude Skills that can be discovered and installed")
+    lines.append("using [Skills Store](https://github.com/your-username/skills-store). Each skill entry includes")
+    lines.append("metadata, source information, and installation details.")
+    lines.append("")
+
+    # Statistics
+    stats = data.get('stats', {})
+    lines.append("## Statistics")
+    lines.append("")
+    lines.append(f"- **Total Skills**: {stats.get('total_skills', 0)}")
+    lines.append(f"- **Total Sources**: {stats.get('total_sources', 0)}")
+    lines.append(f"- **Last Updated**: {data.get('last_updated', 'Unknown')}")
+    lines.append("")
+
+    # Quick links
+    lines.append("## Quick Links")
+    lines.append("")
+    categories = data.get('categories', {})
+    if categories:
+        for cat_id, cat_info in sorted(categories.items()):
+            name = cat_info.get('name', cat_id)
+            count = cat_info.get('count', 0)
+            lines.append(f"- [{name}](#{cat_id.replace('_', '-')}) ({count} skills)")
+    lines.append("")
+
+    # Skills by category
+    lines.append("## Skills by Category")
+    lines.append("")
+
+    # Group skills by category
+    skills_by_category = defaultdict(list)
+    for skill_name, skill in data.get('skills', {}).items():
+        category = skill.get('metadata', {}).get('category', 'other')
+        skills_by_category[category].append((skill_name, skill))
+
+    # Categories render independently; sections are stitched in sorted order
+    sections = [
+        (category, categories.get(category, {}), skills)
+        for category, skills in sorted(skills_by_category.items())
+    ]
+    lines.extend(render_sections(sections, workers))
+
+    # Usage section
+    lines.append("## Usage")
+    lines.append("")
+    lines.append("### Prerequisites")
+    lines.append("")
+    lines.append("1. Install [Skills Store](https://github.com/your-username/skills-store)")
+    lines.append("2. Ensure you have Python 3.7+ and required dependencies")
+    lines.append("")
+
+    lines.append("### Installing a Skill")
+    lines.append("")
+    lines.append("```bash")
+    lines.append("# Search for skills")
+    lines.append("python scripts/search_skills.py \"keyword\"")
+    lines.append("")
+    lines.append("# Install a specific skill")
+    lines.append("python scripts/install_skill.py <skill-name>")
+    lines.append("```")
+    lines.append("")
+
+    # Contributing section
+    lines.append("## Contributing")
+    lines.append("")
+    lines.append("To add a new skill to the registry:")
+    lines.append("")
+    lines.append("1. Fork this repository")
+    lines.append("2. Edit `skills/skills-registry.json`")
+    lines.append("3. Add your skill following the [schema](docs/SCHEMA.md)")
+    lines.append("4. Run validation: `python tools/validate_registry.py`")
+    lines.append("5. Regenerate this README: `python tools/generate_readme.py`")
+    lines.append("6. Submit a pull request")
+    lines.append("")
+
+    # Schema reference
+    lines.append("## Schema Reference")
+    lines.append("")
+    lines.append("For detailed information about the registry schema, see [SCHEMA.md](docs/SCHEMA.md).")
+    lines.append("")
+
+    # Footer
+    lines.append("---")
+    lines.append("")
+    lines.append("**Maintained by**: The Claude Skills Community")
+    lines.append("")
+    lines.append("*This README is automatically generated from skills-registry.json*")
+    lines.append("")
+    lines.append(f"*Generated: {datetime.now().isoformat()}*")
+
+    return '\n'.join(lines)
@@ -0,0 +1,116 @@
+"""
+Registry Storage
+
+Load and save skills-registry.json and build new skill entries.
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from . import feed, shards
+from .stats import GITHUB_URL, Registry, update_totals
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+REGISTRY_PATH = ROOT_DIR / "skills" / "skills-registry.json"
+
+
+def utc_now() -> str:
+    """Current UTC time in the registry's timestamp format"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def load_registry(registry_path: Path = REGISTRY_PATH) -> dict:
+    """
+    Load the skills registry (raises FileNotFoundError if missing)
+
+    A shard directory or shard manifest loads as a sharded registry whose
+    skills are read lazily (see shards.py).
+    """
+    if shards.is_sharded(registry_path):
+        return Registry(shards.load_sharded(registry_path), registry_path)
+
+    with open(registry_path, 'r', encoding='utf-8') as f:
+        return Registry(json.load(f), registry_path)
+
+
+def save_registry(registry_path: Path, registry: dict):
+    """
+    Save the skills registry (only changed shards for a sharded registry)
+
+    When the registry has a delta feed (see feed.py), the changes of this
+    save are appended to it as the next patch, and a lookup index next to
+    it (see lookup.py) is rebuilt so it never goes stale.
+    """
+    from .lookup import index_path, write_index
+
+    ops = feed.pending_ops(registry_path, registry) if feed.is_enabled(registry_path) else None
+
+    if shards.is_sharded(registry_path):
+        shards.save_sharded(registry_path, registry)
+    else:
+        data = registry
+        if isinstance(registry.get('skills'), shards.ShardedSkills):
+            data = dict(registry, skills=dict(registry['skills'].items()))
+
+        with open(registry_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    if ops:
+        feed.append(registry_path, ops)
+    if isinstance(registry, Registry):
+        registry.mark_saved(registry_path)
+    if index_path(registry_path).exists():
+        write_index(registry_path, registry)
+
+
+def registry_file(registry_path: Path) -> Path:
+    """The file whose changes signal a registry change (manifest for shards)"""
+    if shards.is_sharded(registry_path):
+        return shards.shard_dir(registry_path) / shards.MANIFEST_NAME
+    return Path(registry_path)
+
+
+def touch_registry(registry: dict, synced: bool = False):
+    """
+    Update last_updated and the stats totals after an edit; synced also
+    sets stats.last_sync (after a scan). Skills should be added and removed
+    with stats.put_skill/remove_skill so the counters the totals come from
+    stay current.
+    """
+    registry['last_updated'] = utc_now()
+    update_totals(registry, registry['last_updated'] if synced else None)
+
+
+def build_entry(name: Optional[str], description: Optional[str], source: Dict, metadata: Dict) -> Dict:
+    """Registry entry from its parts, in registry key order, leaving out None fields"""
+    entry = {}
+    if name is not None:
+        entry['name'] = name
+    if description is not None:
+        entry['description'] = description
+    entry['source'] = {k: v for k, v in source.items() if v is not None}
+    entry['metadata'] = {k: v for k, v in metadata.items() if v is not None}
+    return entry
+
+
+def create_skill_entry(skill: Dict, branch: str = "main", category: str = "general",
+                       description: Optional[str] = None) -> Dict:
+    """
+    Create a skill entry for the registry
+
+    Args:
+        skill: Scan result with 'name', 'path' and 'repo' (and 'commit'/'tree' when pinned)
+        branch: Branch the skill was found on
+        category: Registry category
+        description: Defaults to "Skill from <repo>"
+    """
+    repo = skill['repo']
+    return build_entry(
+        skill['name'],
+        description or f"Skill from {repo}",
+        {"type": "github", "repo": repo, "url": GITHUB_URL + repo, "branch": branch, "path": skill['path'],
+         "commit": skill.get('commit'), "tree": skill.get('tree')},
+        {"author": repo.split('/')[0], "license": "Unknown", "tags": [], "category": category},
+    )
@@ -0,0 +1,352 @@
+"""
+Release Artifacts
+
+Pack the registry, its lookup and search indexes and optionally the cached
+skill bundles into one compressed tar archive, so consumers make a single
+download:
+
+    skills-registry-<version>.tar.gz   (or .tar.zst)
+        MANIFEST.json           first member: every file with size and sha256
+        skills-registry.json
+        skills-index.bin        lookup index (lookup.py)
+        skills-vectors.npz      search index (semantic.py, needs NumPy)
+        bundles/...             with --bundles: the skill bundle cache
+
+Builds are reproducible: members are sorted, owners and modes normalized,
+every timestamp is SOURCE_DATE_EPOCH (default: the registry's last_updated)
+and the gzip header has no name or time. Extraction streams the archive
+into a staging directory, checking each file against the manifest while
+writing it, so memory use does not grow with the archive, and moves the
+files into place only once the whole archive has verified. zstd needs the
+optional zstandard package.
+"""
+
+import io
+import os
+import json
+import gzip
+import shutil
+import hashlib
+import tarfile
+import zipfile
+import calendar
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+MANIFEST_NAME = "MANIFEST.json"
+RELEASE_FORMAT = 1
+COMPRESSIONS = ("gzip", "zstd")
+EXTENSIONS = {"gzip": ".tar.gz", "zstd": ".tar.zst"}
+CHUNK_SIZE = 1 << 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class ReleaseError(Exception):
+    """A release cannot be built, or an archive is invalid or corrupt"""
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_date_epoch(registry: dict) -> int:
+    """Timestamp for every archive member (SOURCE_DATE_EPOCH, else last_updated)"""
+    if os.environ.get('SOURCE_DATE_EPOCH'):
+        return int(os.environ['SOURCE_DATE_EPOCH'])
+    try:
+        return calendar.timegm(datetime.strptime(registry.get('last_updated', ''), '%Y-%m-%dT%H:%M:%SZ').timetuple())
+    except ValueError:
+        return 0
+
+
+def _normalize_zip(path: Path):
+    """Rewrite a zip (NumPy .npz) with fixed timestamps so it is reproducible"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in sorted(source.infolist(), key=lambda i: i.filename):
+            fixed = zipfile.ZipInfo(info.filename, date_time=(1980, 1, 1, 0, 0, 0))
+            fixed.compress_type = zipfile.ZIP_DEFLATED
+            fixed.external_attr = 0o644 << 16
+            target.writestr(fixed, source.read(info))
+    path.write_bytes(buffer.getvalue())
+
+
+def stage_files(registry_path: Path, registry: dict, staging: Path,
+                bundles_dir: Optional[Path] = None) -> List[Tuple[str, Path]]:
+    """
+    Put the registry file (merged, for shards) and fresh indexes into staging
+
+    Returns:
+        Sorted (archive name, file) pairs, bundle cache files included
+    """
+    from . import lookup, semantic
+    from .shards import is_sharded
+
+    staged = staging / "skills-registry.json"
+    if is_sharded(registry_path):
+        registry = dict(registry, skills=dict(registry['skills'].items()))
+        with open(staged, 'w', encoding='utf-8') as f:
+            json.dump(registry, f, indent=2, ensure_ascii=False)
+    else:
+        shutil.copyfile(registry_path, staged)
+
+    files = [("skills-registry.json", staged)]
+    files.append(("skills-index.bin", lookup.write_index(staged, registry, staging / "skills-index.bin")))
+
+    if semantic.np is not None:
+        vectors = staging / semantic.VECTORS_FILENAME
+        semantic.save_index(semantic.build_index(registry), vectors)
+        _normalize_zip(vectors)
+        files.append((semantic.VECTORS_FILENAME, vectors))
+
+    if bundles_dir is not None:
+        from .bundles import BundleCache
+
+        cache = BundleCache(bundles_dir)
+        wanted = {name: info for name, info in cache.index.items() if name in registry['skills']}
+        objects = set()
+        for name, info in wanted.items():
+            manifest = cache.manifest(info['tree'])
+            if manifest is None:
+                raise ReleaseError(f"bundle of {name} is incomplete; run 'skills.py bundles fetch'")
+            files.append((f"bundles/trees/{info['tree']}.json", cache.root / "trees" / f"{info['tree']}.json"))
+            objects.update(f['sha'] for f in manifest)
+
+        for sha in objects:
+            path = cache.object_path(sha)
+            if not path.exists():
+                raise ReleaseError(f"bundle object {sha} is missing; run 'skills.py bundles fetch'")
+            files.append((f"bundles/objects/{sha[:2]}/{sha[2:]}", path))
+
+        index_path = staging / "bundles-index.json"
+        index_path.write_text(json.dumps(wanted, indent=2, sort_keys=True, ensure_ascii=False), encoding='utf-8')
+        files.append(("bundles/index.json", index_path))
+
+    return sorted(set(files))
+
+
+def _tar_info(name: str, size: int, mtime: int) -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = mtime
+    info.mode = 0o644
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def _compressor(raw: BinaryIO, compression: str, level: Optional[int]):
+    if compression == "zstd":
+        if zstandard is None:
+            raise ReleaseError("zstd compression requires the zstandard package: pip install zstandard")
+        return zstandard.ZstdCompressor(level=level or 19).stream_writer(raw, closefd=False)
+    return gzip.GzipFile(filename="", mode='wb', fileobj=raw, mtime=0, compresslevel=level or 9)
+
+
+def build_release(registry_path: Path, output_dir: Path, compression: str = "gzip",
+                  bundles_dir: Optional[Path] = None, level: Optional[int] = None) -> Tuple[Path, Dict]:
+    """
+    Build a release archive and its .sha256 file in output_dir
+
+    Returns:
+        (archive path, manifest)
+    """
+    from .registry import load_registry
+
+    if compression not in COMPRESSIONS:
+        raise ReleaseError(f"unknown compression: {compression}")
+
+    registry = load_registry(registry_path)
+    version = registry.get('version', '0.0.0')
+    mtime = source_date_epoch(registry)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    archive = output_dir / f"skills-registry-{version}{EXTENSIONS[compression]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = stage_files(registry_path, registry, Path(tmp), bundles_dir)
+        manifest = {
+            'format': RELEASE_FORMAT,
+            'version': version,
+            'created': datetime.fromtimestamp(mtime, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'files': [
+                {'path': name, 'size': path.stat().st_size, 'sha256': file_digest(path)}
+                for name, path in files
+            ],
+        }
+        manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+
+        tmp_archive = archive.with_name(archive.name + ".tmp")
+        with open(tmp_archive, 'wb') as raw:
+            stream = _compressor(raw, compression, level)
+            with tarfile.open(fileobj=stream, mode='w|', format=tarfile.GNU_FORMAT) as tar:
+                tar.addfile(_tar_info(MANIFEST_NAME, len(manifest_bytes), mtime), io.BytesIO(manifest_bytes))
+                for name, path in files:
+                    with open(path, 'rb') as f:
+                        tar.addfile(_tar_info(name, path.stat().st_size, mtime), f)
+            stream.close()
+        tmp_archive.replace(archive)
+
+    Path(f"{archive}.sha256").write_text(f"{file_digest(archive)}  {archive.name}\n", encoding='utf-8')
+    return archive, manifest
+
+
+class _HashingReader(io.RawIOBase):
+    """Read-through wrapper that hashes everything read from a stream"""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        buffer[:len(data)] = data
+        self.digest.update(data)
+        return len(data)
+
+
+def _open_source(source: str) -> BinaryIO:
+    if source.startswith(('http://', 'https://')):
+        from .github import get_session, REQUEST_TIMEOUT
+
+        response = get_session().get(source, stream=True, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            raise ReleaseError(f"{source}: HTTP {response.status_code}")
+        response.raw.decode_content = False
+        return response.raw
+    return open(source, 'rb')
+
+
+def _decompressor(stream: BinaryIO) -> BinaryIO:
+    buffered = io.BufferedReader(stream, CHUNK_SIZE)
+    magic = buffered.peek(4)[:4]
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=buffered, mode='rb')
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ReleaseError("this archive is zstd-compressed; pip install zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(buffered)
+    raise ReleaseError("not a gzip or zstd release archive")
+
+
+def _safe_path(dest: Path, name: str) -> Path:
+    parts = Path(name).parts
+    if not parts or Path(name).is_absolute() or '..' in parts:
+        raise ReleaseError(f"unsafe path in archive: {name}")
+    return dest.joinpath(*parts)
+
+
+def extract_release(source: str, dest: Path, expected_sha256: Optional[str] = None) -> Dict:
+    """
+    Stream-extract a release archive (file or URL) into dest
+
+    Files are written to a staging directory next to dest and checked
+    against the manifest as they are written. Only when the whole archive
+    has been read, and matches expected_sha256 when given, are they moved
+    into dest, so a tampered or truncated archive leaves dest untouched.
+
+    Returns:
+        The manifest (raises ReleaseError)
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{dest.name}.extract-", dir=dest.parent))
+    hashing = None
+    try:
+        hashing = _HashingReader(_open_source(source))
+        stream = _decompressor(hashing)
+        with tarfile.open(fileobj=stream, mode='r|') as tar:
+            members = iter(tar)
+            first = next(members, None)
+            if first is None or first.name != MANIFEST_NAME:
+                raise ReleaseError(f"archive does not start with {MANIFEST_NAME}")
+            manifest = json.load(tar.extractfile(first))
+            if manifest.get('format') != RELEASE_FORMAT:
+                raise ReleaseError(f"unsupported release format: {manifest.get('format')}")
+            expected = {f['path']: f for f in manifest['files']}
+
+            seen = set()
+            for member in members:
+                if not member.isfile():
+                    raise ReleaseError(f"unexpected archive member: {member.name}")
+                entry = expected.get(member.name)
+                if entry is None:
+                    raise ReleaseError(f"{member.name} is not in the manifest")
+
+                target = _safe_path(staging, member.name)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                digest = hashlib.sha256()
+                size = 0
+                source_file = tar.extractfile(member)
+                with open(target, 'wb') as out:
+                    for block in iter(lambda: source_file.read(CHUNK_SIZE), b""):
+                        digest.update(block)
+                        size += len(block)
+                        out.write(block)
+                if size != entry['size'] or digest.hexdigest() != entry['sha256']:
+                    raise ReleaseError(f"{member.name} does not match its manifest checksum")
+                seen.add(member.name)
+
+            missing = set(expected) - seen
+            if missing:
+                raise ReleaseError(f"archive is missing {len(missing)} file(s), e.g. {sorted(missing)[0]}")
+
+        # Read to the end so the compression trailer and archive digest are checked
+        while stream.read(CHUNK_SIZE):
+            pass
+        while hashing.read(CHUNK_SIZE):
+            pass
+        if expected_sha256 and hashing.digest.hexdigest() != expected_sha256.lower():
+            raise ReleaseError("archive sha256 does not match")
+
+        for name in sorted(seen):
+            target = _safe_path(dest, name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(_safe_path(staging, name), target)
+    except (tarfile.TarError, OSError, EOFError, ValueError) as e:
+        raise ReleaseError(f"corrupt archive: {e}")
+    finally:
+        if hashing is not None:
+            hashing.raw.close()
+        shutil.rmtree(staging, ignore_errors=True)
+    return manifest
+
+
+def read_checksum(archive: str) -> Optional[str]:
+    """Digest from the .sha256 file next to a local archive, if there is one"""
+    try:
+        with open(f"{archive}.sha256", 'r', encoding='utf-8') as f:
+            return f.read().split()[0]
+    except (OSError, IndexError):
+        return None
+
+
+def format_size(size: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def print_manifest(manifest: Dict):
+    total = sum(f['size'] for f in manifest['files'])
+    print(f"   Version: {manifest['version']}")
+    print(f"   Files:   {len(manifest['files'])} ({format_size(total)} uncompressed)")
+
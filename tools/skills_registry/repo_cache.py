@@ -0,0 +1,139 @@
+"""
+GitHub Repository Cache
+
+On-disk cache for the scanner (.github-cache.json in the repository root):
+
+    repos   repo -> {"default_branch", "fetched_at"}, refreshed after a day
+    trees   git tree sha -> [[name, type, sha], ...]
+    used    git tree sha -> day (days since the epoch) it was last read or stored
+
+Tree objects are content-addressed and never change, so a listing fetched
+for one branch is reused by every other branch, tag or later scan that
+contains the same tree. Trees of old commits are never asked for again,
+so saving drops listings unused for TREE_TTL_DAYS, keeps at most
+MAX_TREES of the most recently used ones, and forgets expired metadata.
+"""
+
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .registry import ROOT_DIR
+
+CACHE_PATH = ROOT_DIR / ".github-cache.json"
+CACHE_FORMAT = 1
+METADATA_TTL = 24 * 3600
+TREE_TTL_DAYS = 30
+MAX_TREES = 50000
+
+
+def _today() -> int:
+    return int(time.time() // 86400)
+
+
+class RepoCache:
+    """Repository metadata and tree listings, shared by all scanner threads"""
+
+    def __init__(self, path: Optional[Path] = CACHE_PATH):
+        self.path = Path(path) if path else None
+        self.repos = {}
+        self.trees = {}
+        self.used = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Optional[Path] = CACHE_PATH) -> "RepoCache":
+        cache = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') == CACHE_FORMAT:
+                cache.repos = data.get('repos', {})
+                cache.trees = data.get('trees', {})
+                cache.used = data.get('used', {})
+        except (TypeError, OSError, ValueError):
+            pass
+        return cache
+
+    def save(self):
+        """Write the cache if anything changed (skipped on read-only locations)"""
+        with self.lock:
+            if not self.dirty or self.path is None:
+                return
+            self.prune()
+            data = {'format': CACHE_FORMAT, 'repos': self.repos, 'trees': self.trees, 'used': self.used}
+            self.dirty = False
+        try:
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def prune(self):
+        """Drop expired metadata and stale or excess tree listings (call with the lock held)"""
+        now = time.time()
+        self.repos = {repo: meta for repo, meta in self.repos.items()
+                      if now - meta.get('fetched_at', 0) < METADATA_TTL}
+
+        # Listings cached before use days were recorded count as used today
+        today = _today()
+        used = {sha: self.used.get(sha, today) for sha in self.trees}
+        keep = sorted((sha for sha, day in used.items() if today - day < TREE_TTL_DAYS),
+                      key=used.get, reverse=True)[:MAX_TREES]
+        self.trees = {sha: self.trees[sha] for sha in keep}
+        self.used = {sha: used[sha] for sha in keep}
+
+    def default_branch(self, repo: str) -> Optional[str]:
+        with self.lock:
+            meta = self.repos.get(repo)
+        if meta and time.time() - meta.get('fetched_at', 0) < METADATA_TTL:
+            return meta.get('default_branch')
+        return None
+
+    def set_metadata(self, repo: str, default_branch: str):
+        with self.lock:
+            self.repos[repo] = {'default_branch': default_branch, 'fetched_at': int(time.time())}
+            self.dirty = True
+
+    def tree(self, sha: str) -> Optional[List[List[str]]]:
+        with self.lock:
+            listing = self.trees.get(sha)
+            if listing is not None and self.used.get(sha) != _today():
+                self.used[sha] = _today()
+                self.dirty = True
+            return listing
+
+    def add_tree(self, sha: str, entries: List[dict]):
+        """Store a non-recursive tree listing from the git trees API"""
+        listing = [[e['path'], e['type'], e['sha']] for e in entries]
+        with self.lock:
+            self.trees[sha] = listing
+            self.used[sha] = _today()
+            self.dirty = True
+
+    def add_recursive_tree(self, sha: str, entries: List[dict]):
+        """Store a recursive listing as one listing per contained tree"""
+        children = {'': []}
+        for entry in entries:
+            parent, _, name = entry['path'].rpartition('/')
+            children.setdefault(parent, []).append([name, entry['type'], entry['sha']])
+            if entry['type'] == 'tree':
+                children.setdefault(entry['path'], [])
+
+        shas = {'': sha}
+        shas.update({e['path']: e['sha'] for e in entries if e['type'] == 'tree'})
+        today = _today()
+        with self.lock:
+            for path, listing in children.items():
+                self.trees[shas[path]] = listing
+                self.used[shas[path]] = today
+            self.dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {'repos': len(self.repos), 'trees': len(self.trees)}
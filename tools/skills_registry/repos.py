@@ -0,0 +1,303 @@
+"""
+Repository Manager
+
+Manage the repositories configured in repositories.json and scan the
+enabled ones for new skills.
+"""
+
+from pathlib import Path
+from typing import List, Dict
+
+from . import tracing
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info, print_next_steps
+from .config import save_config, enabled_repositories, repository_refs, categorize_skill
+from .github import DEFAULT_WORKERS
+from .pins import update_pin
+from .registry import REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry, utc_now
+from .stats import put_skill
+
+
+def categorize_semantic(skills: List[Dict], registry: dict, registry_path: Path, categories: dict):
+    """
+    Re-categorize skills by nearest centroid over the offline TF-IDF index
+
+    The description of each skill's SKILL.md is fetched first (one request
+    per skill) and kept on the skill for its registry entry.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from . import semantic
+    from .github import fetch_skill_description
+
+    semantic.require_numpy()
+    index = semantic.load_or_build_index(registry_path, registry, categories)
+
+    with tracing.span('describe'), ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) as pool:
+        descriptions = pool.map(lambda s: fetch_skill_description(s['repo'], s['tree']) if s.get('tree') else None,
+                                skills)
+        for skill, description in zip(skills, descriptions):
+            if description:
+                skill['description'] = description
+    texts = [f"{skill['name'].replace('-', ' ')} {skill.get('description') or 'Skill from ' + skill['repo']}"
+             for skill in skills]
+
+    # One batched call for all new skills; keep the keyword match on no overlap
+    for skill, (category, score) in zip(skills, semantic.categorize(texts, index)):
+        if score > 0:
+            skill['category'] = category
+
+
+def list_repositories(config: dict, config_path: Path = None):
+    """List all repositories in configuration"""
+    print_header("📚 Configured Repositories")
+
+    repos = config.get('repositories', [])
+    if not repos:
+        print_warning("No repositories configured")
+        return
+
+    print(f"{'№':<3} {'Enabled':<7} {'Priority':<8} {'Repository':<40} {'Description'}")
+    print("-" * 100)
+
+    for i, repo_config in enumerate(repos, 1):
+        enabled = "✅" if repo_config.get('enabled', True) else "❌"
+        priority = repo_config.get('priority', 999)
+        repo = repo_config['repo']
+        desc = repo_config.get('description', '')
+
+        print(f"{i:<3} {enabled:<7} {priority:<8} {repo:<40} {desc}")
+
+    print(f"\n{Colors.GREEN}Total:{Colors.END} {len(repos)} repositories")
+
+
+def add_repository(config: dict, config_path: Path):
+    """Add a new repository to configuration"""
+    print_header("➕ Add New Repository")
+
+    repo = input(f"{Colors.BOLD}Repository (owner/repo):{Colors.END} ").strip()
+    if not repo:
+        print_error("Repository is required")
+        return
+
+    branch = input(f"{Colors.BOLD}Branch [main]:{Colors.END} ").strip() or "main"
+    name = input(f"{Colors.BOLD}Name:{Colors.END} ").strip() or repo
+    description = input(f"{Colors.BOLD}Description:{Colors.END} ").strip()
+    priority = input(f"{Colors.BOLD}Priority [99]:{Colors.END} ").strip()
+    priority = int(priority) if priority else 99
+
+    new_repo = {
+        "name": name,
+        "repo": repo,
+        "branch": branch,
+        "enabled": True,
+        "priority": priority,
+        "description": description
+    }
+
+    config['repositories'].append(new_repo)
+    config['repositories'].sort(key=lambda x: x.get('priority', 999))
+    config['last_updated'] = utc_now()
+
+    save_config(config_path, config)
+    print_success(f"Added {repo} to configuration")
+
+
+def scan_repositories(config: dict, config_path: Path, semantic: bool = False,
+                      registry_path: Path = REGISTRY_PATH, backend: str = "rest",
+                      workers: int = DEFAULT_WORKERS, bayes: bool = False):
+    """
+    Scan enabled repositories and add skills
+
+    Skills are checked against the registry and categorized by keyword as
+    the scan finds them; semantic or bayes re-categorize the new skills in
+    one batch once the scan is done. backend "graphql" fetches the
+    repositories in batched GraphQL queries (falling back to REST); "rest"
+    scans `workers` repositories at a time.
+    """
+    print_header("🔍 Scan Repositories")
+
+    try:
+        with tracing.span('load_registry'):
+            registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return
+
+    # Get enabled repositories
+    repos = enabled_repositories(config)
+
+    if not repos:
+        print_warning("No enabled repositories found")
+        print_info("Use 'repo_manager.py toggle' to enable repositories")
+        return
+
+    print_info(f"Scanning {len(repos)} enabled repository(ies)...\n")
+
+    targets = [(r['repo'], repository_refs(r)) for r in repos]
+    if backend == "graphql":
+        from .graphql import stream_skills_batch
+
+        stream = stream_skills_batch(targets)
+    else:
+        from .github import stream_skills
+
+        stream = stream_skills(targets, workers)
+
+    categories = config.get('categories', {})
+    found = {}
+    new_skills = []
+    new_names = set()
+    existing = 0
+    failed = []
+    repinned = {'changed': [], 'pinned': []}
+
+    with tracing.span('scan'):
+        for repo, skill in stream:
+            if isinstance(skill, Exception):
+                print_error(f"{repo}: scan failed: {skill}")
+                failed.append(repo)
+                continue
+            if skill is None:
+                if found.get(repo):
+                    print_success(f"{repo}: {found[repo]} skill(s)")
+                else:
+                    print_warning(f"{repo}: no skills found")
+                continue
+
+            found[repo] = found.get(repo, 0) + 1
+            name = skill['name']
+            if name in registry['skills'] or name in new_names:
+                existing += 1
+                status = name not in new_names and update_pin(registry, name, skill)
+                if status:
+                    repinned[status].append(name)
+                if status == 'changed':
+                    print(f"  {Colors.YELLOW}~{Colors.END} {name} {Colors.BLUE}(changed){Colors.END}")
+                continue
+
+            # Auto-categorize
+            skill['category'] = categorize_skill(name, f"Skill from {skill['repo']}", categories)
+            new_skills.append(skill)
+            new_names.add(name)
+            print(f"  {Colors.GREEN}+{Colors.END} {name} {Colors.BLUE}({skill['category']}){Colors.END}")
+
+    total = sum(found.values())
+    if failed:
+        print_warning(f"{len(failed)} repositories failed: {', '.join(sorted(failed))}")
+    if not total:
+        print_error("No skills found!")
+        return
+
+    # Show summary
+    print()
+    print_header("📊 Scan Summary")
+    print(f"Total skills found: {Colors.GREEN}{total}{Colors.END}\n")
+
+    if semantic and new_skills:
+        with tracing.span('categorize'):
+            categorize_semantic(new_skills, registry, registry_path, categories)
+
+    if bayes and new_skills:
+        from .classifier import require_numpy, categorize_skills
+
+        require_numpy()
+        with tracing.span('categorize'):
+            learned = categorize_skills(new_skills, registry, registry_path)
+        print_info(f"Learned categorizer labeled {learned} of {len(new_skills)} new skill(s)")
+
+    print(f"New skills: {Colors.GREEN}{len(new_skills)}{Colors.END}")
+    print(f"Existing skills: {Colors.YELLOW}{existing}{Colors.END}")
+    print(f"Changed skills: {Colors.YELLOW}{len(repinned['changed'])}{Colors.END}\n")
+
+    added = []
+    if not new_skills:
+        print_info("All skills already exist in registry")
+    else:
+        # Ask for confirmation
+        print(f"{Colors.YELLOW}Add {len(new_skills)} new skill(s)?{Colors.END}")
+        choice = input(f"{Colors.BOLD}[y/N]:{Colors.END} ").strip().lower()
+
+        if choice == 'y':
+            # Add skills to registry
+            print_header("💾 Adding Skills")
+
+            for skill in new_skills:
+                put_skill(registry, skill['name'], create_skill_entry(skill, skill['branch'], skill.get('category', 'general'),
+                                                                 skill.get('description')))
+                print_success(f"Added {skill['name']}")
+                added.append(skill['name'])
+        else:
+            print_info("Cancelled")
+
+    # Content pins of existing skills are updated either way
+    repinned_count = len(repinned['changed']) + len(repinned['pinned'])
+    if not added and not repinned_count:
+        return
+
+    touch_registry(registry, synced=True)
+    with tracing.span('save_registry'):
+        save_registry(registry_path, registry)
+
+    print()
+    if added:
+        print_success(f"Added {len(added)} skill(s) to registry!")
+    if repinned_count:
+        print_success(f"Updated the commit/tree pins of {repinned_count} skill(s) "
+                      f"({len(repinned['changed'])} changed)")
+    print()
+    if added:
+        print_next_steps(f"Add {len(added)} skills from scan")
+    else:
+        print_next_steps(f"Update {repinned_count} skill pins from scan")
+
+
+def toggle_repository(config: dict, config_path: Path):
+    """Toggle repository enabled status"""
+    print_header("🔄 Toggle Repository")
+
+    repos = config.get('repositories', [])
+
+    print(f"{Colors.BOLD}Select repository to toggle:{Colors.END}\n")
+
+    for i, repo_config in enumerate(repos, 1):
+        enabled = "✅ Enabled" if repo_config.get('enabled', True) else "❌ Disabled"
+        print(f"  {i}. {repo_config['repo']} - {enabled}")
+
+    try:
+        choice = int(input(f"\n{Colors.BOLD}Enter number:{Colors.END} ")) - 1
+        if 0 <= choice < len(repos):
+            repos[choice]['enabled'] = not repos[choice].get('enabled', True)
+            status = "enabled" if repos[choice]['enabled'] else "disabled"
+            save_config(config_path, config)
+            print_success(f"{repos[choice]['repo']} {status}")
+        else:
+            print_error("Invalid selection")
+    except ValueError:
+        print_error("Invalid input")
+
+
+def interactive_menu(config: dict, config_path: Path):
+    """Menu shown by repo_manager.py without arguments"""
+    print_header("🎯 Repository Manager")
+
+    print(f"{Colors.BOLD}Available actions:{Colors.END}")
+    print(f"  {Colors.GREEN}1{Colors.END}. List repositories")
+    print(f"  {Colors.GREEN}2{Colors.END}. Add repository")
+    print(f"  {Colors.GREEN}3{Colors.END}. Scan and import skills")
+    print(f"  {Colors.GREEN}4{Colors.END}. Toggle repository")
+    print(f"  {Colors.GREEN}5{Colors.END}. Exit")
+
+    choice = input(f"\n{Colors.BOLD}Choose action [1-5]:{Colors.END} ").strip()
+
+    actions = {
+        '1': list_repositories,
+        '2': add_repository,
+        '3': scan_repositories,
+        '4': toggle_repository
+    }
+
+    if choice in actions:
+        actions[choice](config, config_path)
+    elif choice == '5':
+        print_info("Goodbye!")
+    else:
+        print_error("Invalid choice")
@@ -0,0 +1,43 @@
+"""
+Skill Search
+
+Keyword search over skill names, descriptions, tags and categories.
+"""
+
+from typing import List, Tuple
+
+
+def search_skills(registry: dict, query: str) -> List[Tuple[int, str, dict]]:
+    """
+    Find skills matching every word of the query
+
+    Returns:
+        List of (score, name, skill), best match first. Name matches score
+        highest, then tags and category, then the description.
+    """
+    terms = [t for t in query.lower().split() if t]
+    results = []
+
+    for name, skill in registry.get('skills', {}).items():
+        metadata = skill.get('metadata', {})
+        name_lower = name.lower()
+        tags = [t.lower() for t in metadata.get('tags', [])]
+        category = metadata.get('category', '').lower()
+        description = skill.get('description', '').lower()
+
+        score = 0
+        for term in terms:
+            if term in name_lower:
+                score += 3
+            elif term in tags or term == category:
+                score += 2
+            elif term in description:
+                score += 1
+            else:
+                break
+        else:
+            if terms:
+                results.append((score, name, skill))
+
+    results.sort(key=lambda r: (-r[0], r[1]))
+    return results
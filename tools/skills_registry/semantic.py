@@ -0,0 +1,285 @@
+"""
+Semantic Skill Index
+
+Build offline TF-IDF vectors for every skill description and use them for
+nearest-centroid categorization and "similar skills" lookups.
+
+The vectors are stored as a NumPy matrix next to the registry
+(skills/skills-vectors.npz). No network access is needed.
+"""
+
+import sys
+import re
+import json
+import hashlib
+from pathlib import Path
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+VECTORS_FILENAME = "skills-vectors.npz"
+
+# Cap the vocabulary so the dense matrix stays small on large registries
+MAX_FEATURES = 2048
+
+# Chunk size for batched similarity queries
+BATCH_SIZE = 1024
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "into", "is", "it", "its", "of", "on", "or", "that", "the", "this", "to",
+    "when", "with", "skill", "skills", "claude", "needs", "using", "use",
+}
+
+
+def require_numpy():
+    """Exit with a helpful message when NumPy is not installed"""
+    if np is None:
+        print("❌ The semantic index requires NumPy: pip install numpy")
+        sys.exit(1)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens without stop words"""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS and len(t) > 1]
+
+
+def skill_text(skill: dict) -> str:
+    """Text used to vectorize a skill (name, description and tags)"""
+    metadata = skill.get('metadata', {})
+    parts = [
+        skill.get('name', '').replace('-', ' ').replace('_', ' '),
+        skill.get('description', ''),
+        ' '.join(metadata.get('tags', [])),
+    ]
+    return ' '.join(parts)
+
+
+def registry_fingerprint(registry: dict) -> str:
+    """Hash of the skills section, used to detect a stale index"""
+    payload = json.dumps(dict(registry.get('skills', {}).items()), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def vectors_path(registry_path: Path) -> Path:
+    """Location of the vector matrix for a registry file"""
+    return Path(registry_path).parent / VECTORS_FILENAME
+
+
+def _count_matrix(token_lists: List[List[str]], vocabulary: Dict[str, int]) -> "np.ndarray":
+    """Term count matrix for tokenized documents over a fixed vocabulary"""
+    rows, cols = [], []
+    for row, tokens in enumerate(token_lists):
+        for token in tokens:
+            col = vocabulary.get(token)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+
+    counts = np.zeros((len(token_lists), len(vocabulary)), dtype=np.float32)
+    if rows:
+        np.add.at(counts, (np.array(rows), np.array(cols)), 1.0)
+    return counts
+
+
+def _normalize(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize matrix rows in place (zero rows are left as is)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _weight(counts: "np.ndarray", idf: "np.ndarray") -> "np.ndarray":
+    """Sublinear TF-IDF weighting followed by row normalization"""
+    return _normalize(np.log1p(counts) * idf)
+
+
+def build_index(registry: dict, categories: Optional[dict] = None,
+                max_features: int = MAX_FEATURES) -> dict:
+    """
+    Build the TF-IDF index for a registry
+
+    Args:
+        registry: Loaded skills registry
+        categories: Optional keyword config (repositories.json "categories");
+            each category's keywords are folded into its centroid
+        max_features: Maximum vocabulary size
+
+    Returns:
+        Index dictionary (names, labels, vocabulary, idf, matrix, centroids)
+    """
+    require_numpy()
+
+    skills = registry.get('skills', {})
+    names = sorted(skills)
+    labels = [skills[n].get('metadata', {}).get('category', 'general') for n in names]
+    token_lists = [tokenize(skill_text(skills[n])) for n in names]
+
+    keyword_docs = {
+        category: tokenize(' '.join(config.get('keywords', [])))
+        for category, config in (categories or {}).items()
+    }
+
+    # Vocabulary: most frequent document terms (ties broken alphabetically)
+    doc_freq = Counter()
+    for tokens in token_lists + list(keyword_docs.values()):
+        doc_freq.update(set(tokens))
+    terms = sorted(doc_freq, key=lambda t: (-doc_freq[t], t))[:max_features]
+    terms.sort()
+    vocabulary = {term: i for i, term in enumerate(terms)}
+
+    counts = _count_matrix(token_lists, vocabulary)
+    n_docs = len(names) + len(keyword_docs)
+    df = np.array([doc_freq[t] for t in terms], dtype=np.float32)
+    idf = (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+    matrix = _weight(counts, idf)
+
+    # Nearest-centroid model: mean vector of each labeled category
+    centroid_labels = sorted(set(labels) | set(keyword_docs))
+    label_ids = {label: i for i, label in enumerate(centroid_labels)}
+    centroids = np.zeros((len(centroid_labels), len(vocabulary)), dtype=np.float32)
+    if names:
+        np.add.at(centroids, np.array([label_ids[l] for l in labels]), matrix)
+
+    if keyword_docs:
+        keyword_labels = list(keyword_docs)
+        keyword_vectors = _weight(_count_matrix(list(keyword_docs.values()), vocabulary), idf)
+        np.add.at(centroids, np.array([label_ids[l] for l in keyword_labels]), keyword_vectors)
+
+    return {
+        'fingerprint': registry_fingerprint(registry),
+        'names': names,
+        'labels': labels,
+        'vocabulary': terms,
+        'idf': idf,
+        'matrix': matrix,
+        'centroid_labels': centroid_labels,
+        'centroids': _normalize(centroids),
+    }
+
+
+def save_index(index: dict, path: Path):
+    """Save the index as a compressed NumPy archive"""
+    require_numpy()
+    np.savez_compressed(
+        path,
+        fingerprint=np.array(index['fingerprint']),
+        names=np.array(index['names'], dtype=str),
+        labels=np.array(index['labels'], dtype=str),
+        vocabulary=np.array(index['vocabulary'], dtype=str),
+        idf=index['idf'],
+        matrix=index['matrix'],
+        centroid_labels=np.array(index['centroid_labels'], dtype=str),
+        centroids=index['centroids'],
+    )
+
+
+def load_index(path: Path) -> dict:
+    """Load an index saved by save_index"""
+    require_numpy()
+    with np.load(path, allow_pickle=False) as data:
+        return {
+            'fingerprint': str(data['fingerprint']),
+            'names': data['names'].tolist(),
+            'labels': data['labels'].tolist(),
+            'vocabulary': data['vocabulary'].tolist(),
+            'idf': data['idf'],
+            'matrix': data['matrix'],
+            'centroid_labels': data['centroid_labels'].tolist(),
+            'centroids': data['centroids'],
+        }
+
+
+def load_or_build_index(registry_path: Path, registry: dict,
+                        categories: Optional[dict] = None) -> dict:
+    """Load the stored index, rebuilding it when the registry has changed"""
+    path = vectors_path(registry_path)
+    if path.exists():
+        index = load_index(path)
+        if index['fingerprint'] == registry_fingerprint(registry):
+            return index
+
+    index = build_index(registry, categories)
+    save_index(index, path)
+    return index
+
+
+def vectorize(texts: List[str], index: dict) -> "np.ndarray":
+    """Vectorize free-form texts against an index's vocabulary"""
+    require_numpy()
+    vocabulary = {term: i for i, term in enumerate(index['vocabulary'])}
+    counts = _count_matrix([tokenize(t) for t in texts], vocabulary)
+    return _weight(counts, index['idf'])
+
+
+def categorize(texts: List[str], index: dict, default: str = "general") -> List[Tuple[str, float]]:
+    """
+    Categorize texts by their nearest category centroid
+
+    Returns:
+        List of (category, cosine score); texts sharing no terms with the
+        index get the default category and a score of 0.0
+    """
+    if not texts:
+        return []
+
+    scores = vectorize(texts, index) @ index['centroids'].T
+    best = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(texts)), best]
+
+    labels = index['centroid_labels']
+    return [
+        (labels[b], float(s)) if s > 0 else (default, 0.0)
+        for b, s in zip(best.tolist(), best_scores.tolist())
+    ]
+
+
+def _top_matches(queries: "np.ndarray", index: dict, top_n: int,
+                 exclude: Optional[List[int]] = None) -> List[List[Tuple[str, float]]]:
+    """Top-N most similar skills for each query vector, in chunks"""
+    matrix = index['matrix']
+    names = index['names']
+    top_n = min(top_n, len(names))
+    results = []
+
+    for start in range(0, len(queries), BATCH_SIZE):
+        scores = queries[start:start + BATCH_SIZE] @ matrix.T
+        if exclude is not None:
+            rows = np.arange(scores.shape[0])
+            scores[rows, exclude[start:start + BATCH_SIZE]] = -1.0
+
+        k = min(top_n, scores.shape[1])
+        if k == 0:
+            results.extend([] for _ in range(scores.shape[0]))
+            continue
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        for row, cols in enumerate(top):
+            ordered = sorted(cols.tolist(), key=lambda c: -scores[row, c])
+            results.append([(names[c], float(scores[row, c])) for c in ordered if scores[row, c] > 0])
+
+    return results
+
+
+def similar_skills(skill_names: List[str], index: dict, top_n: int = 5) -> Dict[str, List[Tuple[str, float]]]:
+    """Find the most similar skills for each named skill"""
+    positions = {name: i for i, name in enumerate(index['names'])}
+    known = [n for n in skill_names if n in positions]
+    if not known:
+        return {}
+
+    rows = [positions[n] for n in known]
+    matches = _top_matches(index['matrix'][rows], index, top_n, exclude=rows)
+    return dict(zip(known, matches))
+
+
+def search(text: str, index: dict, top_n: int = 5) -> List[Tuple[str, float]]:
+    """Find the skills most similar to a free-form query"""
+    return _top_matches(vectorize([text], index), index, top_n)[0]
@@ -0,0 +1,315 @@
+"""
+Registry Server
+
+Long-running local HTTP API over the registry. The registry is parsed once,
+indexed by name, category, tag and repository, and re-indexed
+incrementally (only changed entries) when the file changes on disk.
+
+Endpoints (all GET, JSON responses):
+    /health                         Skill count, load time, validation status
+    /skills?category=&tag=&repo=    Paginated skill list (filters are ANDed)
+    /skills/<name>                  One skill entry
+    /search?q=                      Paginated keyword search
+    /categories  /tags  /repos      Index keys with skill counts
+    /validate                       Validation result for the loaded registry
+
+Pagination: ?limit=N&offset=M (limit defaults to 50, capped at 500). Pages
+carry total, offset, limit and next_offset (null on the last page).
+"""
+
+import os
+import json
+import time
+import socket
+import threading
+import socketserver
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Set
+
+from .search import search_skills
+from .registry import load_registry, registry_file
+from .validate import validate_data
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class RegistryIndex:
+    """In-memory registry with name, category, tag and repo indexes"""
+
+    def __init__(self):
+        self.skills = {}
+        self.meta = {}
+        self.by_category = {}
+        self.by_tag = {}
+        self.by_repo = {}
+        self._sorted_names = []
+        self.validation = (True, [])
+        self.loaded_at = None
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _keys(skill: dict) -> Dict[str, List[str]]:
+        """Index keys of one entry"""
+        metadata = skill.get('metadata', {}) if isinstance(skill.get('metadata'), dict) else {}
+        source = skill.get('source', {}) if isinstance(skill.get('source'), dict) else {}
+        return {
+            'category': [metadata.get('category', 'general')],
+            'tag': [t for t in metadata.get('tags', []) if isinstance(t, str)],
+            'repo': [source['repo']] if source.get('repo') else [],
+        }
+
+    def _indexes(self) -> Dict[str, Dict[str, Set[str]]]:
+        return {'category': self.by_category, 'tag': self.by_tag, 'repo': self.by_repo}
+
+    def _add(self, name: str, skill: dict):
+        self.skills[name] = skill
+        indexes = self._indexes()
+        for field, values in self._keys(skill).items():
+            for value in values:
+                indexes[field].setdefault(value, set()).add(name)
+
+    def _remove(self, name: str):
+        skill = self.skills.pop(name)
+        indexes = self._indexes()
+        for field, values in self._keys(skill).items():
+            for value in values:
+                names = indexes[field].get(value)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del indexes[field][value]
+
+    def apply(self, data: dict) -> Dict[str, int]:
+        """
+        Load a registry, touching only entries that changed since the last load
+
+        Returns:
+            Counts of added, updated and removed skills
+        """
+        skills = data.get('skills', {})
+        new_skills = dict(skills.items()) if isinstance(skills, Mapping) else {}
+        validation = validate_data(data)
+
+        with self.lock:
+            removed = [n for n in self.skills if n not in new_skills]
+            updated = [n for n, s in new_skills.items() if n in self.skills and self.skills[n] != s]
+            added = [n for n in new_skills if n not in self.skills]
+
+            for name in removed + updated:
+                self._remove(name)
+            for name in updated + added:
+                self._add(name, new_skills[name])
+
+            if added or removed:
+                self._sorted_names = sorted(self.skills)
+
+            self.meta = {k: v for k, v in data.items() if k != 'skills'}
+            self.validation = validation
+            self.loaded_at = time.time()
+
+        return {'added': len(added), 'updated': len(updated), 'removed': len(removed)}
+
+    def names(self, category: Optional[str] = None, tag: Optional[str] = None,
+              repo: Optional[str] = None) -> List[str]:
+        """Sorted skill names matching all given filters"""
+        with self.lock:
+            filters = [
+                self._indexes()[field].get(value, set())
+                for field, value in (('category', category), ('tag', tag), ('repo', repo))
+                if value
+            ]
+            if not filters:
+                return list(self._sorted_names)
+
+            matched = set.intersection(*sorted(filters, key=len))
+            return sorted(matched)
+
+    def counts(self, field: str) -> Dict[str, int]:
+        """Skill count for every key of an index"""
+        with self.lock:
+            return {key: len(names) for key, names in sorted(self._indexes()[field].items())}
+
+
+def paginate(items: list, query: dict) -> dict:
+    """Slice items by ?limit=&offset= and describe the page"""
+    try:
+        limit = min(max(int(query.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+        offset = max(int(query.get('offset', 0)), 0)
+    except ValueError:
+        raise ValueError("limit and offset must be integers")
+
+    page = items[offset:offset + limit]
+    next_offset = offset + limit if offset + limit < len(items) else None
+    return {'total': len(items), 'offset': offset, 'limit': limit, 'next_offset': next_offset, 'items': page}
+
+
+class RegistryWatcher(threading.Thread):
+    """Polls the registry file (or shard manifest) and re-applies it when it changes"""
+
+    def __init__(self, path: Path, index: RegistryIndex, interval: float = 1.0, log=print):
+        super().__init__(daemon=True)
+        self.path = Path(path)
+        self.index = index
+        self.interval = interval
+        self.log = log
+        self._stamp = None
+        self._stopped = threading.Event()
+
+    def stamp(self):
+        st = os.stat(registry_file(self.path))
+        return (st.st_mtime_ns, st.st_size)
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-apply the file if it changed; returns True when reloaded"""
+        try:
+            stamp = self.stamp()
+            if not force and stamp == self._stamp:
+                return False
+            data = load_registry(self.path)
+            data['skills'] = dict(data.get('skills', {}).items())
+        except (OSError, ValueError) as e:
+            # Keep serving the last good registry (the file may be mid-write)
+            self.log(f"⚠️  Reload skipped: {e}")
+            return False
+
+        self._stamp = stamp
+        changes = self.index.apply(data)
+        self.log(f"🔄 Loaded {len(self.index.skills)} skills "
+                 f"(+{changes['added']} ~{changes['updated']} -{changes['removed']})")
+        return True
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.reload()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def make_handler(index: RegistryIndex):
+    """Request handler class bound to an index"""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "SkillsRegistry/1.0"
+
+        def address_string(self):
+            # Unix socket peers have no (host, port) address
+            return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, status: int, payload):
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            segments = [unquote(s) for s in parts.path.strip('/').split('/') if s]
+
+            try:
+                status, payload = self.route(segments, query)
+            except ValueError as e:
+                status, payload = 400, {'error': str(e)}
+            self.send_json(status, payload)
+
+        def route(self, segments: List[str], query: dict):
+            if segments == ['health']:
+                with index.lock:
+                    return 200, {
+                        'status': 'ok',
+                        'skills': len(index.skills),
+                        'version': index.meta.get('version'),
+                        'last_updated': index.meta.get('last_updated'),
+                        'loaded_at': index.loaded_at,
+                        'valid': index.validation[0],
+                    }
+
+            if segments == ['validate']:
+                valid, messages = index.validation
+                return 200, {'valid': valid, 'messages': messages}
+
+            if segments == ['skills']:
+                names = index.names(query.get('category'), query.get('tag'), query.get('repo'))
+                page = paginate(names, query)
+                with index.lock:
+                    page['items'] = [index.skills[n] for n in page['items'] if n in index.skills]
+                return 200, page
+
+            if len(segments) == 2 and segments[0] == 'skills':
+                with index.lock:
+                    skill = index.skills.get(segments[1])
+                if skill is None:
+                    return 404, {'error': f"Unknown skill: {segments[1]}"}
+                return 200, skill
+
+            if segments == ['search']:
+                if not query.get('q'):
+                    raise ValueError("missing ?q=")
+                names = index.names(query.get('category'), query.get('tag'), query.get('repo'))
+                with index.lock:
+                    subset = {'skills': {n: index.skills[n] for n in names}}
+                results = search_skills(subset, query['q'])
+                page = paginate(results, query)
+                page['items'] = [dict(skill, score=score) for score, _, skill in page['items']]
+                return 200, page
+
+            if len(segments) == 1 and segments[0] in ('categories', 'tags', 'repos'):
+                field = {'categories': 'category', 'tags': 'tag', 'repos': 'repo'}[segments[0]]
+                return 200, index.counts(field)
+
+            return 404, {'error': "Not found"}
+
+    return Handler
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix domain socket"""
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def serve(registry_path: Path, host: str = "127.0.0.1", port: int = 8377,
+          unix_socket: Optional[str] = None, poll_interval: float = 1.0):
+    """Load the registry, start the file watcher and serve until interrupted"""
+    index = RegistryIndex()
+    watcher = RegistryWatcher(registry_path, index, poll_interval)
+    if not watcher.reload(force=True):
+        raise FileNotFoundError(f"Cannot load registry: {registry_path}")
+    watcher.start()
+
+    handler = make_handler(index)
+    if unix_socket:
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError("Unix sockets are not supported on this platform")
+        httpd = UnixHTTPServer(unix_socket, handler)
+        print(f"🚀 Serving {registry_path} on unix:{unix_socket}")
+    else:
+        httpd = ThreadingHTTPServer((host, port), handler)
+        httpd.daemon_threads = True
+        print(f"🚀 Serving {registry_path} on http://{host}:{httpd.server_address[1]}")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        httpd.server_close()
+        if unix_socket and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
@@ -0,0 +1,374 @@
+"""
+Sharded Registry Layout
+
+Store the registry as one JSON file per category (or per source repo) plus
+a small manifest with per-shard counts and SHA-256 hashes:
+
+    skills/shards/
+        manifest.json               root fields (version, categories, stats, ...),
+                                    {"shards": {key: {file, count, sha256}}}
+                                    and the number of name buckets
+        document-<hash>.json        {"skills": {name: entry, ...}}
+        development-<hash>.json
+        ...
+        names/00.json               {skill name: shard key}, for the names
+        names/01.json               whose hash falls in that bucket
+        ...
+
+Shard files are named after their key plus a hash of it, so keys that
+only differ in punctuation or case never share a file. Shards are read
+on first access, a lookup (also of a missing name) reads the one name
+bucket the name hashes to, and only modified shards and buckets are
+rewritten, so an import touches a few small files instead of the whole
+registry.
+load_registry/save_registry accept a shard directory (or its manifest.json)
+anywhere a registry file is expected.
+"""
+
+import re
+import json
+import hashlib
+from pathlib import Path
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MANIFEST_NAME = "manifest.json"
+NAMES_DIR = "names"
+NAME_BUCKETS = 64
+SHARD_FORMAT = 2
+SHARD_BY = ("category", "source")
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def is_sharded(path: Path) -> bool:
+    """True for a shard directory or a shard manifest"""
+    path = Path(path)
+    return path.is_dir() or path.name == MANIFEST_NAME
+
+
+def shard_dir(path: Path) -> Path:
+    """Shard directory for a directory or manifest path"""
+    path = Path(path)
+    return path.parent if path.name == MANIFEST_NAME else path
+
+
+def shard_key(skill: dict, shard_by: str) -> str:
+    """Shard a skill entry belongs to"""
+    if shard_by == "source":
+        return (skill.get('source') or {}).get('repo') or "local"
+    return (skill.get('metadata') or {}).get('category') or "general"
+
+
+def shard_filename(key: str) -> str:
+    """File name for a shard key ("owner/repo" -> "owner__repo-<12 hex digits>.json")"""
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]
+    return f"{_UNSAFE.sub('_', key.replace('/', '__'))}-{digest}.json"
+
+
+def name_bucket(name: str, buckets: int) -> str:
+    """File of the name index a skill name is listed in ("2a.json")"""
+    return f"{int(hashlib.sha256(name.encode('utf-8')).hexdigest()[:8], 16) % buckets:02x}.json"
+
+
+def _dump(data) -> bytes:
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+class ShardedSkills(MutableMapping):
+    """
+    The "skills" mapping of a sharded registry
+
+    The name index says which shard holds a name, so lookups load (and
+    cache) one name bucket and at most that shard, and membership tests
+    load no shard; iteration and items() stream shards that are not already
+    cached; len() comes from the manifest counts. Assignments mark the
+    target shard and name bucket dirty.
+    """
+
+    def __init__(self, directory: Path, shards: Dict[str, dict], shard_by: str,
+                 buckets: Optional[int] = None):
+        self.directory = Path(directory)
+        self.shard_by = shard_by
+        self.shards = shards          # key -> {"file", "count", "sha256"} from the manifest
+        self.buckets = buckets        # name buckets; None for manifests without a name index
+        self._loaded = {}             # key -> {name: entry}
+        self._names = {}              # bucket file (None: all names) -> {name: key}
+        self.dirty = set()
+        self.dirty_buckets = set()
+
+    def names_of_bucket(self, bucket: Optional[str]) -> Dict[str, str]:
+        """Name -> shard key map of a name bucket (None: every name, read from the shards)"""
+        if bucket not in self._names:
+            if bucket is None:
+                self._names[None] = {name: key for key in self.keys_of_shards() for name in self.read_shard(key)}
+            else:
+                try:
+                    with open(self.directory / NAMES_DIR / bucket, 'r', encoding='utf-8') as f:
+                        self._names[bucket] = json.load(f)
+                except FileNotFoundError:
+                    self._names[bucket] = {}
+        return self._names[bucket]
+
+    def _bucket_of(self, name: str) -> Optional[str]:
+        return name_bucket(name, self.buckets) if self.buckets else None
+
+    def keys_of_shards(self) -> List[str]:
+        return sorted(set(self.shards) | set(self._loaded))
+
+    def read_shard(self, key: str) -> Dict[str, dict]:
+        """Read a shard without caching it"""
+        if key in self._loaded:
+            return self._loaded[key]
+        info = self.shards.get(key)
+        if info is None:
+            return {}
+        with open(self.directory / info['file'], 'r', encoding='utf-8') as f:
+            return json.load(f).get('skills', {})
+
+    def load_shard(self, key: str) -> Dict[str, dict]:
+        """Read and cache a shard"""
+        if key not in self._loaded:
+            self._loaded[key] = self.read_shard(key)
+        return self._loaded[key]
+
+    def _find(self, name: str) -> Optional[str]:
+        return self.names_of_bucket(self._bucket_of(name)).get(name)
+
+    def __getitem__(self, name: str) -> dict:
+        key = self._find(name)
+        if key is None:
+            raise KeyError(name)
+        return self.load_shard(key)[name]
+
+    def __setitem__(self, name: str, skill: dict):
+        new_key = shard_key(skill, self.shard_by)
+        old_key = self._find(name)
+        if old_key is not None and old_key != new_key:
+            del self.load_shard(old_key)[name]
+            self.dirty.add(old_key)
+        self.load_shard(new_key)[name] = skill
+        self.names_of_bucket(self._bucket_of(name))[name] = new_key
+        self.dirty.add(new_key)
+        self.dirty_buckets.add(self._bucket_of(name))
+
+    def __delitem__(self, name: str):
+        key = self._find(name)
+        if key is None:
+            raise KeyError(name)
+        del self.load_shard(key)[name]
+        del self.names_of_bucket(self._bucket_of(name))[name]
+        self.dirty.add(key)
+        self.dirty_buckets.add(self._bucket_of(name))
+
+    def __contains__(self, name) -> bool:
+        return self._find(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.keys_of_shards():
+            yield from list(self.read_shard(key))
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        for key in self.keys_of_shards():
+            yield from list(self.read_shard(key).items())
+
+    def values(self) -> Iterator[dict]:
+        for _, skill in self.items():
+            yield skill
+
+    def __len__(self) -> int:
+        total = sum(len(skills) for skills in self._loaded.values())
+        return total + sum(info['count'] for key, info in self.shards.items() if key not in self._loaded)
+
+
+def read_manifest(path: Path) -> dict:
+    with open(shard_dir(path) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_sharded(path: Path) -> dict:
+    """Load a sharded registry (shards are read lazily)"""
+    manifest = read_manifest(path)
+    registry = {k: v for k, v in manifest.items() if k not in ('format', 'shard_by', 'shards', 'name_buckets')}
+    registry['skills'] = ShardedSkills(shard_dir(path), manifest.get('shards', {}),
+                                       manifest.get('shard_by', 'category'), manifest.get('name_buckets'))
+    return registry
+
+
+def save_sharded(path: Path, registry: dict, shard_by: Optional[str] = None):
+    """
+    Save a registry in sharded form
+
+    A registry loaded with load_sharded only rewrites its dirty shards; a
+    plain registry dict is split into a fresh set of shards.
+    """
+    directory = shard_dir(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    skills = registry.get('skills', {})
+
+    if isinstance(skills, ShardedSkills):
+        shard_by = skills.shard_by
+        shards = dict(skills.shards)
+        changed = {key: skills.load_shard(key) for key in skills.dirty}
+        if skills.buckets:
+            buckets = {bucket: skills.names_of_bucket(bucket) for bucket in skills.dirty_buckets}
+        else:
+            # First save of a registry without a name index: write all of it
+            buckets = _name_buckets(skills.names_of_bucket(None))
+    else:
+        shard_by = shard_by or "category"
+        manifest_path = directory / MANIFEST_NAME
+        shards = read_manifest(directory).get('shards', {}) if manifest_path.exists() else {}
+        # Every old shard is replaced (or removed when its key is gone)
+        changed = {key: {} for key in shards}
+        names = {}
+        for name, skill in skills.items():
+            key = shard_key(skill, shard_by)
+            changed.setdefault(key, {})[name] = skill
+            names[name] = key
+        buckets = _name_buckets(names)
+        names_dir = directory / NAMES_DIR
+        for stale in (names_dir.glob("*.json") if names_dir.is_dir() else ()):
+            buckets.setdefault(stale.name, {})
+
+    old_files, data = {}, {}
+    for key, shard_skills in changed.items():
+        if key in shards:
+            old_files[key] = shards[key]['file']
+        if not shard_skills:
+            shards.pop(key, None)
+            continue
+
+        data[key] = _dump({'skills': {n: shard_skills[n] for n in sorted(shard_skills)}})
+        shards[key] = {
+            'file': shard_filename(key),
+            'count': len(shard_skills),
+            'sha256': hashlib.sha256(data[key]).hexdigest(),
+        }
+
+    # Nothing is written when two keys would share a file (also on
+    # case-insensitive filesystems)
+    files = {}
+    for key, info in shards.items():
+        other = files.setdefault(info['file'].lower(), key)
+        if other != key:
+            raise ValueError(f"Shards '{other}' and '{key}' map to the same file {info['file']}")
+
+    for key, shard_data in data.items():
+        (directory / shards[key]['file']).write_bytes(shard_data)
+    in_use = {info['file'] for info in shards.values()}
+    for old_file in old_files.values():
+        if old_file not in in_use:
+            (directory / old_file).unlink(missing_ok=True)
+
+    (directory / NAMES_DIR).mkdir(exist_ok=True)
+    for bucket, bucket_names in buckets.items():
+        if bucket_names:
+            (directory / NAMES_DIR / bucket).write_bytes(_dump({n: bucket_names[n] for n in sorted(bucket_names)}))
+        else:
+            (directory / NAMES_DIR / bucket).unlink(missing_ok=True)
+
+    manifest = {'format': SHARD_FORMAT, 'shard_by': shard_by}
+    manifest.update({k: v for k, v in registry.items() if k != 'skills'})
+    manifest['shards'] = {key: shards[key] for key in sorted(shards)}
+    manifest['name_buckets'] = NAME_BUCKETS
+    (directory / MANIFEST_NAME).write_bytes(_dump(manifest))
+
+    if isinstance(skills, ShardedSkills):
+        skills.shards = manifest['shards']
+        if not skills.buckets:
+            skills.buckets = NAME_BUCKETS
+            skills._names = dict(buckets)
+        skills.dirty.clear()
+        skills.dirty_buckets.clear()
+
+
+def _name_buckets(names: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+    """Split a name -> shard key map into the files of the name index"""
+    buckets = {}
+    for name, key in names.items():
+        buckets.setdefault(name_bucket(name, NAME_BUCKETS), {})[name] = key
+    return buckets
+
+
+def merge_shards(path: Path) -> dict:
+    """Materialize a sharded registry as a single registry dict"""
+    registry = load_sharded(path)
+    skills = dict(registry.pop('skills').items())
+
+    # Same key order as the monolithic file: skills right after the header
+    merged = {k: registry[k] for k in ('version', 'last_updated') if k in registry}
+    merged['skills'] = skills
+    merged.update(registry)
+    return merged
+
+
+def verify_shards(path: Path) -> List[str]:
+    """Check shard files against the manifest (existence, hash, count, placement, name index)"""
+    errors = []
+    directory = shard_dir(path)
+
+    try:
+        manifest = read_manifest(directory)
+    except FileNotFoundError:
+        return [f"Shard manifest not found: {directory / MANIFEST_NAME}"]
+    except json.JSONDecodeError as e:
+        return [f"Invalid shard manifest: {e}"]
+
+    shard_by = manifest.get('shard_by')
+    if shard_by not in SHARD_BY:
+        errors.append(f"manifest: shard_by must be one of {', '.join(SHARD_BY)}")
+
+    seen, files = {}, {}
+    for key, info in manifest.get('shards', {}).items():
+        other = files.setdefault(str(info.get('file', '')).lower(), key)
+        if other != key:
+            errors.append(f"Shard '{key}': shares file {info.get('file')} with shard '{other}'")
+            continue
+
+        shard_path = directory / info.get('file', '')
+        if not shard_path.is_file():
+            errors.append(f"Shard '{key}': file not found: {shard_path.name}")
+            continue
+
+        data = shard_path.read_bytes()
+        if hashlib.sha256(data).hexdigest() != info.get('sha256'):
+            errors.append(f"Shard '{key}': sha256 does not match the manifest")
+
+        try:
+            skills = json.loads(data).get('skills', {})
+        except json.JSONDecodeError as e:
+            errors.append(f"Shard '{key}': invalid JSON: {e}")
+            continue
+
+        if len(skills) != info.get('count'):
+            errors.append(f"Shard '{key}': count {info.get('count')} doesn't match {len(skills)} skills")
+
+        for name, skill in skills.items():
+            if name in seen:
+                errors.append(f"Skill '{name}': present in shards '{seen[name]}' and '{key}'")
+            seen[name] = key
+            if shard_by in SHARD_BY and isinstance(skill, dict) and shard_key(skill, shard_by) != key:
+                errors.append(f"Skill '{name}': stored in shard '{key}' but belongs in '{shard_key(skill, shard_by)}'")
+
+    buckets = manifest.get('name_buckets')
+    if buckets:
+        names = {}
+        for bucket_path in sorted((directory / NAMES_DIR).glob("*.json")):
+            try:
+                bucket_names = json.loads(bucket_path.read_bytes())
+            except json.JSONDecodeError as e:
+                errors.append(f"Name index {bucket_path.name}: invalid JSON: {e}")
+                continue
+            for name, key in bucket_names.items():
+                if name_bucket(name, buckets) != bucket_path.name:
+                    errors.append(f"Skill '{name}': listed in name index {bucket_path.name}, "
+                                  f"belongs in {name_bucket(name, buckets)}")
+                names[name] = key
+        for name, key in seen.items():
+            if names.get(name) != key:
+                errors.append(f"Skill '{name}': name index says shard '{names.get(name)}', found in '{key}'")
+        for name in names.keys() - seen.keys():
+            errors.append(f"Skill '{name}': in the name index but in no shard")
+
+    return errors
@@ -0,0 +1,183 @@
+"""
+Registry Stats
+
+Keep the aggregate fields of the registry consistent with its skills:
+
+    stats.total_skills, total_sources, total_categories, last_sync
+    categories[*].count        skills per category
+    sources[*].skills_count    skills per source repository
+
+Write paths don't recount. put_skill() and remove_skill() move an entry's
+category and source repo counters by one, and touch_registry() derives the
+totals from the counters, so an edit costs the same on 20 skills as on
+100,000. Categories and repositories seen for the first time get a block
+of their own. recount() is the full pass, for registries whose counters
+have drifted (skills.py stats --fix).
+"""
+
+import copy
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+GITHUB_URL = "https://github.com/"
+DEFAULT_CATEGORY = "general"
+
+
+class Registry(dict):
+    """
+    A registry as load_registry() returns it: the JSON object, plus a
+    journal of the edits since it was loaded or saved (none of it is saved)
+
+        path        registry file or shard directory the journal refers to
+        saved_root  root fields (all but skills) as they are on disk
+        changes     skills put or removed since, by name, as they were
+                    before the first change (None for new skills)
+
+    The delta feed diffs only the journal instead of re-reading the file.
+    source_positions maps repos to their block in the sources list, so the
+    counters find a block without a scan; it is checked on every use.
+    """
+
+    def __init__(self, data=(), path: Optional[Path] = None):
+        super().__init__(data)
+        self.source_positions: Dict[str, int] = {}
+        self.mark_saved(path)
+
+    def mark_saved(self, path: Optional[Path]):
+        """Start a new journal: the registry now matches what is at path"""
+        self.path = Path(path).resolve() if path is not None else None
+        self.changes: Dict[str, Optional[dict]] = {}
+        self.saved_root = copy.deepcopy({k: v for k, v in self.items() if k != 'skills'})
+
+
+def entry_keys(entry) -> Tuple[str, Optional[str]]:
+    """(category, source repo) an entry is counted under"""
+    metadata = entry.get('metadata') if isinstance(entry, dict) else None
+    source = entry.get('source') if isinstance(entry, dict) else None
+    category = metadata.get('category') if isinstance(metadata, dict) else None
+    repo = source.get('repo') if isinstance(source, dict) else None
+    return category or DEFAULT_CATEGORY, repo if isinstance(repo, str) and repo else None
+
+
+def _category(registry: dict, name: str) -> dict:
+    categories = registry.setdefault('categories', {})
+    block = categories.get(name)
+    if block is None:
+        title = name.replace('-', ' ').replace('_', ' ').title()
+        block = categories[name] = {'name': title, 'description': f"{title} skills", 'count': 0}
+    return block
+
+
+def _source(registry: dict, repo: str) -> dict:
+    sources = registry.get('sources')
+    if not isinstance(sources, list):
+        sources = registry['sources'] = []
+    positions = registry.source_positions if isinstance(registry, Registry) else {}
+
+    i = positions.get(repo)
+    stale = i is not None and (i >= len(sources) or not isinstance(sources[i], dict) or sources[i].get('name') != repo)
+    if stale or (i is None and len(positions) != len(sources)):
+        # First use, or the list was edited directly: map it again
+        positions.clear()
+        positions.update((s['name'], n) for n, s in enumerate(sources) if isinstance(s, dict) and 'name' in s)
+        i = positions.get(repo)
+
+    if i is None:
+        sources.append({'name': repo, 'type': 'github', 'url': GITHUB_URL + repo,
+                        'description': "", 'skills_count': 0})
+        i = positions[repo] = len(sources) - 1
+    return sources[i]
+
+
+def _adjust(registry: dict, entry, delta: int):
+    category, repo = entry_keys(entry)
+    block = _category(registry, category)
+    block['count'] = block.get('count', 0) + delta
+    if repo:
+        source = _source(registry, repo)
+        source['skills_count'] = source.get('skills_count', 0) + delta
+
+
+def _journal(registry: dict, name: str, old: Optional[dict]):
+    if isinstance(registry, Registry) and name not in registry.changes:
+        registry.changes[name] = old
+
+
+def put_skill(registry: dict, name: str, entry: dict):
+    """Add or replace a skill, moving the counters of its old and new category and repo"""
+    skills = registry['skills']
+    old = skills[name] if name in skills else None
+    if old is not None:
+        _adjust(registry, old, -1)
+    _journal(registry, name, old)
+    skills[name] = entry
+    _adjust(registry, entry, 1)
+
+
+def remove_skill(registry: dict, name: str) -> Optional[dict]:
+    """Remove a skill (if present) and its counts; returns the removed entry"""
+    skills = registry['skills']
+    if name not in skills:
+        return None
+    entry = skills[name]
+    _journal(registry, name, entry)
+    del skills[name]
+    _adjust(registry, entry, -1)
+    return entry
+
+
+def update_totals(registry: dict, synced_at: Optional[str] = None):
+    """Derive stats.total_* from the counters (and set last_sync when given)"""
+    stats = registry.setdefault('stats', {})
+    stats['total_skills'] = len(registry['skills'])
+    stats['total_sources'] = sum(
+        1 for s in registry.get('sources') or () if isinstance(s, dict) and s.get('skills_count', 0) > 0
+    )
+    stats['total_categories'] = sum(
+        1 for c in (registry.get('categories') or {}).values() if isinstance(c, dict) and c.get('count', 0) > 0
+    )
+    if synced_at:
+        stats['last_sync'] = synced_at
+    elif 'last_sync' not in stats and registry.get('last_updated'):
+        stats['last_sync'] = registry['last_updated']
+
+
+def recount(registry: dict):
+    """Recompute every counter and total from the skills in one pass"""
+    for block in (registry.get('categories') or {}).values():
+        if isinstance(block, dict):
+            block['count'] = 0
+    for source in registry.get('sources') or ():
+        if isinstance(source, dict):
+            source['skills_count'] = 0
+    for entry in registry['skills'].values():
+        _adjust(registry, entry, 1)
+    update_totals(registry)
+
+
+def _counters(registry: dict) -> Dict[str, object]:
+    counters = {f"stats.{k}": v for k, v in (registry.get('stats') or {}).items() if k.startswith('total_')}
+    for name, block in (registry.get('categories') or {}).items():
+        if isinstance(block, dict):
+            counters[f"categories.{name}.count"] = block.get('count')
+    for source in registry.get('sources') or ():
+        if isinstance(source, dict) and 'name' in source:
+            counters[f"sources.{source['name']}.skills_count"] = source.get('skills_count')
+    return counters
+
+
+def check(registry: dict) -> List[str]:
+    """Counters that don't match a full recount, as "field: stored -> actual" lines"""
+    actual = {
+        'skills': registry['skills'],
+        'categories': {k: dict(v) for k, v in (registry.get('categories') or {}).items() if isinstance(v, dict)},
+        'sources': [dict(s) for s in registry.get('sources') or () if isinstance(s, dict)],
+        'stats': dict(registry.get('stats') or {}),
+    }
+    recount(actual)
+
+    stored, expected = _counters(registry), _counters(actual)
+    return [
+        f"{field}: {stored.get(field, '(missing)')} -> {value}"
+        for field, value in expected.items() if stored.get(field) != value
+    ]
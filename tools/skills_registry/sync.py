@@ -0,0 +1,256 @@
+"""
+Scheduled Sync
+
+Scan only the configured repositories that are due, so `skills.py sync`
+can run from cron every few minutes. Each repository in repositories.json
+may set "refresh" ("30m", "6h", "1d", "2w" or seconds); the others use
+sync.default_refresh. Once the request budget of a run is spent no further
+scans start, and the skipped repositories stay due for the next run; the
+first scan of a run always starts. Last-run times live in .sync-state.json,
+saved together with the registry every few hundred changed entries, at
+the end and on Ctrl-C, so an interrupted run keeps its progress.
+
+    "sync": {"default_refresh": "1d", "budget": 300},
+    "repositories": [
+        {"repo": "anthropics/skills", "refresh": "1h", ...}
+    ]
+"""
+
+import re
+import json
+import time
+import calendar
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import tracing
+from .config import enabled_repositories, repository_refs, categorize_skill
+from .pins import update_pin
+from .console import Colors, print_header, print_success, print_error, print_warning, print_info
+from .registry import ROOT_DIR, REGISTRY_PATH, load_registry, save_registry, touch_registry, create_skill_entry
+from .stats import put_skill
+
+STATE_PATH = ROOT_DIR / ".sync-state.json"
+DEFAULT_REFRESH = "1d"
+DEFAULT_BUDGET = 300
+DEFAULT_COST = 10
+RETRY_AFTER = 15 * 60
+SAVE_EVERY = 500   # changed entries between registry saves
+
+_INTERVAL = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$")
+_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+
+
+def parse_interval(value) -> int:
+    """Seconds in a refresh interval such as "30m", "6h", "1d" or 3600 (raises ValueError)"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = value
+    else:
+        match = _INTERVAL.match(str(value).lower())
+        if not match:
+            raise ValueError(f"invalid refresh interval: {value!r}")
+        seconds = float(match.group(1)) * _UNITS[match.group(2)]
+    if seconds <= 0:
+        raise ValueError(f"refresh interval must be positive: {value!r}")
+    return int(seconds)
+
+
+def format_interval(seconds: float, exact: bool = True) -> str:
+    """
+    Interval for display: the largest unit that divides it exactly
+    (5400 -> "90m"), or with exact=False the largest unit it spans,
+    rounded down (5400 -> "1h")
+    """
+    seconds = int(seconds)
+    for unit in ('w', 'd', 'h', 'm'):
+        if seconds >= _UNITS[unit] and (not exact or seconds % _UNITS[unit] == 0):
+            return f"{seconds // _UNITS[unit]}{unit}"
+    return f"{seconds}s"
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return calendar.timegm(time.strptime(value, '%Y-%m-%dT%H:%M:%SZ'))
+    except ValueError:
+        return None
+
+
+def _iso(seconds: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+
+def load_state(state_path: Path = STATE_PATH) -> Dict:
+    """Last runs per repository ({'repos': {repo: {...}}})"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if isinstance(state.get('repos'), dict):
+            return state
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {'repos': {}}
+
+
+def save_state(state_path: Path, state: Dict):
+    """Write the state atomically"""
+    tmp = Path(state_path).with_name(Path(state_path).name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    tmp.replace(state_path)
+
+
+def schedule(config: dict, state: Dict, now: float, force: bool = False) -> List[Dict]:
+    """
+    Scheduling plan for the enabled repositories
+
+    Returns:
+        One {'config', 'repo', 'interval', 'next_run', 'due'} per repository,
+        due ones first (by priority, then most overdue)
+
+    Raises:
+        ValueError: A refresh interval is invalid
+    """
+    default = config.get('sync', {}).get('default_refresh', DEFAULT_REFRESH)
+    plan = []
+    for repo_config in enabled_repositories(config):
+        repo = repo_config['repo']
+        interval = parse_interval(repo_config.get('refresh', default))
+        last = state['repos'].get(repo, {})
+        next_run = _timestamp(last.get('retry_at'))
+        if next_run is None:
+            last_run = _timestamp(last.get('last_run'))
+            next_run = last_run + interval if last_run is not None else now
+        plan.append({
+            'config': repo_config,
+            'repo': repo,
+            'interval': interval,
+            'next_run': next_run,
+            'due': force or next_run <= now,
+        })
+
+    plan.sort(key=lambda p: (not p['due'], p['config'].get('priority', 999) if p['due'] else 0, p['next_run']))
+    return plan
+
+
+def print_schedule(plan: List[Dict], state: Dict, now: float):
+    """Table of refresh intervals, last runs and next runs"""
+    print(f"{'Repository':<40} {'Refresh':>7}  {'Last run':<20}  {'Next run'}")
+    print("-" * 90)
+    for item in plan:
+        last = state['repos'].get(item['repo'], {}).get('last_run') or "never"
+        if item['due']:
+            when = f"{Colors.GREEN}due{Colors.END}"
+        else:
+            when = f"in {format_interval(max(60, item['next_run'] - now), exact=False)}"
+        print(f"{item['repo']:<40} {format_interval(item['interval']):>7}  {last:<20}  {when}")
+
+
+def sync(config: dict, registry_path: Path = REGISTRY_PATH, state_path: Path = STATE_PATH,
+         budget: Optional[int] = None, force: bool = False, dry_run: bool = False) -> int:
+    """Scan the repositories that are due within the request budget; returns an exit code"""
+    from .github import find_skills_in_refs, request_count, GitHubError
+
+    print_header("🔄 Sync Repositories")
+
+    now = time.time()
+    state = load_state(state_path)
+    try:
+        plan = schedule(config, state, now, force)
+    except ValueError as e:
+        print_error(f"repositories.json: {e}")
+        return 1
+
+    if budget is None:
+        budget = config.get('sync', {}).get('budget', DEFAULT_BUDGET)
+
+    due = [item for item in plan if item['due']]
+    if dry_run or not due:
+        print_schedule(plan, state, now)
+        print()
+        print_info(f"{len(due)} of {len(plan)} repositories due (budget: {budget} requests)")
+        return 0
+
+    try:
+        with tracing.span('load_registry'):
+            registry = load_registry(registry_path)
+    except FileNotFoundError:
+        print_error("Registry file not found!")
+        return 1
+
+    categories = config.get('categories', {})
+    start_count = request_count()
+    added, repinned, failed, deferred = [], [], [], []
+    unsaved = 0
+
+    def checkpoint():
+        # Registry first, then state: an interrupted run never records a
+        # scan whose skills weren't saved
+        nonlocal unsaved
+        if unsaved:
+            touch_registry(registry, synced=True)
+            with tracing.span('save_registry'):
+                save_registry(registry_path, registry)
+            unsaved = 0
+        save_state(state_path, state)
+
+    try:
+        for position, item in enumerate(due):
+            repo = item['repo']
+            record = state['repos'].setdefault(repo, {})
+            spent = request_count() - start_count
+            # The first scan always runs, so a repository costing more than
+            # the whole budget doesn't hold up every run
+            if spent and spent + record.get('requests', DEFAULT_COST) > budget:
+                # Due order is priority order: nothing after this one starts either
+                deferred.extend(i['repo'] for i in due[position:])
+                break
+
+            before = request_count()
+            try:
+                skills = find_skills_in_refs(repo, repository_refs(item['config']), strict=True)
+            except GitHubError as e:
+                print_error(f"{repo}: {e}")
+                record['retry_at'] = _iso(now + min(item['interval'], RETRY_AFTER))
+                record['last_error'] = str(e)
+                failed.append(repo)
+                continue
+
+            new, pinned = [], []
+            for skill in skills:
+                if skill['name'] in registry['skills']:
+                    if update_pin(registry, skill['name'], skill):
+                        pinned.append(skill['name'])
+                    continue
+                category = categorize_skill(skill['name'], f"Skill from {skill['repo']}", categories)
+                put_skill(registry, skill['name'], create_skill_entry(skill, skill['branch'], category))
+                new.append(skill['name'])
+            added.extend(new)
+            repinned.extend(pinned)
+            unsaved += len(new) + len(pinned)
+
+            record.update(last_run=_iso(now), requests=request_count() - before, skills=len(skills))
+            record.pop('retry_at', None)
+            record.pop('last_error', None)
+            if unsaved >= SAVE_EVERY:
+                checkpoint()
+            print(f"{Colors.BOLD}{repo}{Colors.END}: {len(skills)} skill(s), "
+                  f"{Colors.GREEN}{len(new)} new{Colors.END}, {record['requests']} request(s)")
+    except KeyboardInterrupt:
+        checkpoint()
+        print()
+        print_warning(f"Interrupted; {len(added)} new skill(s) from finished repositories are saved")
+        return 130
+    checkpoint()
+
+    print()
+    scanned = len(due) - len(failed) - len(deferred)
+    print_success(f"Synced {scanned} repositories with {request_count() - start_count} requests; "
+                  f"{len(added)} new skill(s), {len(repinned)} re-pinned")
+    if deferred:
+        print_warning(f"{len(deferred)} due repositories deferred by the request budget ({budget})")
+    if failed:
+        print_warning(f"{len(failed)} repositories failed and will be retried: {', '.join(failed)}")
+        return 1
+    return 0
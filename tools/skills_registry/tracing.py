@@ -0,0 +1,221 @@
+"""
+Scan Tracing
+
+Per-request and per-span timing for the scan pipeline. Tracing is off by
+default; the tools enable it with --trace FILE and export the events as
+JSONL (*.jsonl) or Chrome trace format (anything else, open it in
+chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from collections import defaultdict
+from typing import List, Dict, Optional
+
+_active = None
+
+
+class Tracer:
+    """Collects request and span events for one run"""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def now(self) -> float:
+        """Seconds since the tracer was created"""
+        return time.perf_counter() - self._origin
+
+    def add(self, event: Dict):
+        event.setdefault('tid', threading.get_ident())
+        with self._lock:
+            self.events.append(event)
+
+    def requests(self) -> List[Dict]:
+        return [e for e in self.events if e['type'] == 'request']
+
+    def cache_hits(self) -> List[Dict]:
+        return [e for e in self.events if e['type'] == 'cache']
+
+    def spans(self, category: Optional[str] = None) -> List[Dict]:
+        return [
+            e for e in self.events
+            if e['type'] == 'span' and (category is None or e['category'] == category)
+        ]
+
+    def export_jsonl(self, path: Path):
+        """One JSON event per line"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in sorted(self.events, key=lambda e: e['start_s']):
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def export_chrome(self, path: Path):
+        """Chrome trace event format (complete "X" events)"""
+        pid = os.getpid()
+        trace_events = []
+        for event in sorted(self.events, key=lambda e: e['start_s']):
+            args = {k: v for k, v in event.items() if k not in ('type', 'name', 'category', 'start_s', 'duration_s', 'tid')}
+            trace_events.append({
+                'name': event['name'],
+                'cat': event['category'],
+                'ph': 'X',
+                'ts': round(event['start_s'] * 1e6, 1),
+                'dur': round(event['duration_s'] * 1e6, 1),
+                'pid': pid,
+                'tid': event['tid'],
+                'args': args,
+            })
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+    def export(self, path: Path):
+        """Export by file extension: .jsonl for JSONL, anything else for Chrome trace"""
+        path = Path(path)
+        if path.suffix == '.jsonl':
+            self.export_jsonl(path)
+        else:
+            self.export_chrome(path)
+
+    def summary(self, top: int = 10) -> List[str]:
+        """Summary table: slowest repos with their request counts"""
+        per_repo = defaultdict(lambda: {'requests': 0, 'errors': 0, 'bytes': 0, 'cached': 0, 'http_s': 0.0})
+        for request in self.requests():
+            stats = per_repo[request.get('repo') or '-']
+            stats['requests'] += 1
+            stats['bytes'] += request.get('bytes') or 0
+            stats['http_s'] += request['duration_s']
+            if request.get('status') != 200:
+                stats['errors'] += 1
+        for hit in self.cache_hits():
+            per_repo[hit.get('repo') or '-']['cached'] += 1
+
+        repo_time = defaultdict(float)
+        for span in self.spans('repo'):
+            repo_time[span['name']] += span['duration_s']
+
+        repos = sorted(set(repo_time) | set(per_repo), key=lambda r: -repo_time.get(r, per_repo[r]['http_s']))
+
+        lines = [
+            f"{'Repository':<45} {'Time (s)':>9} {'Requests':>9} {'Errors':>7} {'Cached':>7} {'KB':>9}",
+            "-" * 91,
+        ]
+        for repo in repos[:top]:
+            stats = per_repo[repo]
+            seconds = repo_time.get(repo, stats['http_s'])
+            lines.append(
+                f"{repo:<45} {seconds:>9.2f} {stats['requests']:>9} {stats['errors']:>7} "
+                f"{stats['cached']:>7} {stats['bytes'] / 1024:>9.1f}"
+            )
+
+        total_requests = sum(s['requests'] for s in per_repo.values())
+        lines.append("-" * 91)
+        lines.append(f"{len(repos)} repositories, {total_requests} requests, {self.now():.2f}s total")
+
+        phase_time = defaultdict(float)
+        for span in self.spans('phase'):
+            phase_time[span['name']] += span['duration_s']
+        if phase_time:
+            lines.append("Phases: " + ", ".join(
+                f"{name} {seconds:.2f}s" for name, seconds in sorted(phase_time.items(), key=lambda p: -p[1])
+            ))
+
+        return lines
+
+
+def enable() -> Tracer:
+    """Start collecting trace events"""
+    global _active
+    _active = Tracer()
+    return _active
+
+
+def disable():
+    """Stop collecting trace events"""
+    global _active
+    _active = None
+
+
+def active() -> Optional[Tracer]:
+    """The active tracer, or None when tracing is off"""
+    return _active
+
+
+@contextmanager
+def span(name: str, category: str = 'phase', **args):
+    """Time a block as a span (no-op when tracing is off)"""
+    tracer = _active
+    if tracer is None:
+        yield
+        return
+
+    start = tracer.now()
+    try:
+        yield
+    finally:
+        tracer.add(dict(args, type='span', name=name, category=category,
+                        start_s=start, duration_s=tracer.now() - start))
+
+
+def record_request(url: str, start: float, response=None, repo: Optional[str] = None, error: Optional[str] = None):
+    """
+    Record one HTTP request
+
+    Args:
+        url: Requested URL
+        start: time.perf_counter() taken just before the request
+        response: requests.Response, if one was received
+        repo: Repository the request belongs to
+        error: Exception text for failed requests
+    """
+    tracer = _active
+    if tracer is None:
+        return
+
+    duration = time.perf_counter() - start
+    event = {
+        'type': 'request',
+        'name': url,
+        'category': 'http',
+        'start_s': tracer.now() - duration,
+        'duration_s': duration,
+        'repo': repo,
+        'status': None,
+        'bytes': 0,
+    }
+
+    if response is not None:
+        event['status'] = response.status_code
+        event['bytes'] = len(response.content)
+    if error:
+        event['error'] = error
+
+    tracer.add(event)
+
+
+def record_cache_hit(name: str, repo: Optional[str] = None):
+    """Record a lookup answered by the repository cache (no request made)"""
+    tracer = _active
+    if tracer is None:
+        return
+    tracer.add({'type': 'cache', 'name': name, 'category': 'cache',
+                'start_s': tracer.now(), 'duration_s': 0.0, 'repo': repo})
+
+
+def finish(path: str):
+    """Export the active trace to `path` and print the summary table"""
+    tracer = _active
+    if tracer is None:
+        return
+
+    tracer.export(path)
+    print()
+    for line in tracer.summary():
+        print(line)
+    print(f"\nTrace written to {path}")
+    disable()
@@ -0,0 +1,283 @@
+"""
+Skills Registry Validator
+
+Validate the skills-registry.json file for correctness and completeness.
+"""
+
+import json
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from collections.abc import Mapping
+
+from . import shards
+from .pins import check_pin
+from .reader import RegistryReader, RegistryFormatError
+from .stats import entry_keys
+
+SOURCE_TYPES = ("github", "local")
+
+
+def validate_registry(registry_path: str) -> tuple[bool, list[str]]:
+    """
+    Validate the skills registry JSON file
+
+    Args:
+        registry_path: Path to skills-registry.json
+
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    # Check if file exists
+    path = Path(registry_path)
+    if not path.exists():
+        return False, [f"Registry file not found: {registry_path}"]
+
+    if shards.is_sharded(path):
+        return validate_sharded(path)
+
+    # Stream entries through the lazy reader: one decoded entry at a time
+    try:
+        with RegistryReader.open(path) as reader:
+            return validate_data(dict(reader.root, skills=reader))
+    except RegistryFormatError:
+        pass  # Reported with the detailed messages below
+    except Exception as e:
+        return False, [f"Error reading file: {e}"]
+
+    # Load JSON
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return False, [f"Invalid JSON: {e}"]
+    except Exception as e:
+        return False, [f"Error reading file: {e}"]
+
+    return validate_data(data)
+
+
+def validate_sharded(path: Path) -> tuple[bool, list[str]]:
+    """Validate a sharded registry one shard at a time"""
+    shard_errors = shards.verify_shards(path)
+    if any(e.startswith(("Shard manifest", "Invalid shard manifest")) for e in shard_errors):
+        return False, shard_errors
+
+    is_valid, messages = validate_data(shards.load_sharded(path))
+    return is_valid and not shard_errors, shard_errors + messages
+
+
+def validate_data(data: dict) -> tuple[bool, list[str]]:
+    """
+    Validate an already loaded registry
+
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    errors = []
+    warnings = []
+    category_counts = Counter()
+    repo_counts = Counter()
+
+    # Validate root structure
+    required_root_fields = ['version', 'last_updated', 'skills']
+    for field in required_root_fields:
+        if field not in data:
+            errors.append(f"Missing required root field: {field}")
+
+    # Validate version
+    if 'version' in data:
+        version = data['version']
+        if not isinstance(version, str):
+            errors.append("Version must be a string")
+        else:
+            # Check semantic versioning format
+            parts = version.split('.')
+            if len(parts) != 3:
+                errors.append("Version should follow semantic versioning (MAJOR.MINOR.PATCH)")
+
+    # Validate last_updated timestamp
+    if 'last_updated' in data:
+        try:
+            datetime.fromisoformat(data['last_updated'].replace('Z', '+00:00'))
+        except ValueError:
+            errors.append("last_updated should be ISO 8601 format (e.g., 2026-01-02T15:30:00Z)")
+
+    # Validate skills object
+    if 'skills' in data:
+        if not isinstance(data['skills'], Mapping):
+            errors.append("skills must be an object/dictionary")
+        else:
+            # Validate each skill; valid ones are tallied by category and repo
+            for skill_name, skill in data['skills'].items():
+                skill_errors = validate_skill(skill_name, skill)
+                errors.extend(skill_errors)
+                if not skill_errors:
+                    category, repo = entry_keys(skill)
+                    category_counts[category] += 1
+                    if repo:
+                        repo_counts[repo] += 1
+
+    # Validate categories if present
+    if 'categories' in data:
+        if not isinstance(data['categories'], dict):
+            errors.append("categories must be an object/dictionary")
+        else:
+            for cat_name, category in data['categories'].items():
+                cat_errors = validate_category(cat_name, category)
+                errors.extend(cat_errors)
+
+    # Validate stats if present
+    if 'stats' in data:
+        stats_errors = validate_stats(data['stats'])
+        errors.extend(stats_errors)
+
+    # Check for warnings
+    if 'skills' in data and 'stats' in data:
+        total_skills = data['stats'].get('total_skills', 0)
+        actual_count = len(data['skills'])
+        if total_skills != actual_count:
+            warnings.append(f"stats.total_skills ({total_skills}) doesn't match actual skill count ({actual_count})")
+
+        total_sources = data['stats'].get('total_sources')
+        if not errors and isinstance(total_sources, int) and total_sources != len(repo_counts):
+            warnings.append(f"stats.total_sources ({total_sources}) doesn't match the number of source repos ({len(repo_counts)})")
+
+        total_categories = data['stats'].get('total_categories')
+        if not errors and isinstance(total_categories, int) and total_categories != len(category_counts):
+            warnings.append(f"stats.total_categories ({total_categories}) doesn't match the categories in use ({len(category_counts)})")
+
+    if not errors and isinstance(data.get('categories'), dict):
+        for cat_name, category in data['categories'].items():
+            count = category.get('count') if isinstance(category, dict) else None
+            if isinstance(count, int) and count != category_counts[cat_name]:
+                warnings.append(f"Category '{cat_name}': count ({count}) doesn't match its skills ({category_counts[cat_name]})")
+
+    if not errors and isinstance(data.get('sources'), list):
+        for source in data['sources']:
+            count = source.get('skills_count') if isinstance(source, dict) else None
+            if isinstance(count, int) and count != repo_counts[source.get('name')]:
+                warnings.append(f"Source '{source.get('name')}': skills_count ({count}) doesn't match its skills ({repo_counts[source.get('name')]})")
+
+    return len(errors) == 0, errors + warnings
+
+
+def validate_skill(name: str, skill: dict) -> list[str]:
+    """Validate a single skill entry"""
+    errors = []
+
+    if not isinstance(skill, dict):
+        return [f"Skill '{name}': entry must be an object"]
+
+    # Check required fields
+    required_fields = ['name', 'description', 'source']
+    for field in required_fields:
+        if field not in skill:
+            errors.append(f"Skill '{name}': Missing required field '{field}'")
+
+    # Validate name matches key
+    if 'name' in skill and skill['name'] != name:
+        errors.append(f"Skill '{name}': name field ('{skill['name']}') doesn't match key ('{name}')")
+
+    # Validate name format
+    if not name.replace('-', '').replace('_', '').isalnum():
+        errors.append(f"Skill '{name}': Name should contain only alphanumeric characters, hyphens, and underscores")
+
+    # Validate source
+    if 'source' in skill:
+        source = skill['source']
+        if not isinstance(source, dict):
+            errors.append(f"Skill '{name}': source must be an object")
+        else:
+            if 'type' not in source:
+                errors.append(f"Skill '{name}': source missing 'type' field")
+            else:
+                source_type = source['type']
+                if source_type not in SOURCE_TYPES:
+                    errors.append(f"Skill '{name}': source.type must be 'github' or 'local'")
+
+                # Validate GitHub source
+                if source_type == 'github':
+                    required_github_fields = ['repo', 'path']
+                    for field in required_github_fields:
+                        if field not in source:
+                            errors.append(f"Skill '{name}': source missing required field '{field}' for github type")
+
+                    # Validate repo format
+                    if 'repo' in source:
+                        repo = source['repo']
+                        if '/' not in repo:
+                            errors.append(f"Skill '{name}': repo should be in 'owner/repo' format")
+
+                    errors.extend(check_pin(name, source))
+
+                # Validate local source
+                if source_type == 'local':
+                    if 'path' not in source:
+                        errors.append(f"Skill '{name}': source missing 'path' field for local type")
+
+    # Validate metadata if present
+    if 'metadata' in skill:
+        metadata = skill['metadata']
+        if not isinstance(metadata, dict):
+            errors.append(f"Skill '{name}': metadata must be an object")
+        else:
+            # Validate tags if present
+            if 'tags' in metadata:
+                tags = metadata['tags']
+                if not isinstance(tags, list):
+                    errors.append(f"Skill '{name}': metadata.tags must be an array")
+                else:
+                    for i, tag in enumerate(tags):
+                        if not isinstance(tag, str):
+                            errors.append(f"Skill '{name}': metadata.tags[{i}] must be a string")
+
+            # Validate category if present
+            if 'category' in metadata:
+                if not isinstance(metadata['category'], str):
+                    errors.append(f"Skill '{name}': metadata.category must be a string")
+
+    return errors
+
+
+def validate_category(name: str, category: dict) -> list[str]:
+    """Validate a single category entry"""
+    errors = []
+
+    required_fields = ['name', 'description', 'count']
+    for field in required_fields:
+        if field not in category:
+            errors.append(f"Category '{name}': Missing required field '{field}'")
+
+    # Validate count is a number
+    if 'count' in category:
+        if not isinstance(category['count'], int):
+            errors.append(f"Category '{name}': count must be an integer")
+
+    return errors
+
+
+def validate_stats(stats: dict) -> list[str]:
+    """Validate the stats object"""
+    errors = []
+
+    required_fields = ['total_skills', 'total_sources', 'last_sync']
+    for field in required_fields:
+        if field not in stats:
+            errors.append(f"stats: Missing required field '{field}'")
+
+    # Validate types
+    if 'total_skills' in stats and not isinstance(stats['total_skills'], int):
+        errors.append("stats.total_skills must be an integer")
+
+    if 'total_sources' in stats and not isinstance(stats['total_sources'], int):
+        errors.append("stats.total_sources must be an integer")
+
+    # Validate last_sync timestamp
+    if 'last_sync' in stats:
+        try:
+            datetime.fromisoformat(stats['last_sync'].replace('Z', '+00:00'))
+        except ValueError:
+            errors.append("stats.last_sync should be ISO 8601 format")
+
+    return errors